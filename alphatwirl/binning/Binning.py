@@ -1,6 +1,10 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import bisect
+
+import numpy as np
 
 from .ReturnTrue import ReturnTrue
+from ._array import to_object_array, valid_array
 
 ##__________________________________________________________________||
 class Binning(object):
@@ -46,6 +50,27 @@ class Binning(object):
 
         self._valid = valid
 
+        # the bins can be found by bisection if the boundaries increase
+        self._increasing = all(l < u for l, u in zip(self.lows, self.ups))
+
+        self._successors = self._build_successors()
+
+    def _build_successors(self):
+        # returns a dict with the next bin of each bin. the entries are
+        # in the reverse order of the priorities in next() so that the
+        # entries with higher priorities overwrite
+        ret = { }
+        try:
+            for bin, next_ in reversed(list(zip(self.bins[:-1], self.bins[1:]))):
+                ret[bin] = next_
+            ret[self.bins[-1]] = self.overflow_bin
+            ret[self.overflow_bin] = self.overflow_bin
+            ret[self.underflow_bin] = self.bins[0]
+        except TypeError:
+            # e.g., the bins are not hashable
+            return { }
+        return ret
+
     def __repr__(self):
         return '{}(boundaries={!r}, underflow_bin={!r}, overflow_bin={!r}, valid={!r})'.format(
             self.__class__.__name__,
@@ -56,17 +81,72 @@ class Binning(object):
         if not self._valid(val): return None
         if val < self.lows[0]: return self.underflow_bin
         if self.ups[-1] <= val: return self.overflow_bin
+        if self._increasing:
+            i = bisect.bisect_right(self.lows, val) - 1
+            if self.lows[i] <= val < self.ups[i]: # False, e.g., for NaN
+                return self.bins[i]
         return [b for b, l, u in zip(self.bins, self.lows, self.ups) if l <= val < u][0]
 
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The bins are the same as ``self(v)`` for each value ``v``.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the dtype ``object`` with the bins, ``None`` for
+            the invalid values
+
+        """
+        values = np.atleast_1d(values)
+        if not self._increasing or values.dtype.kind not in 'biuf':
+            return to_object_array([self(v) for v in values.tolist()])
+
+        valid = valid_array(self._valid, values)
+        if np.isnan(values[valid].astype(np.float64)).any():
+            # as in __call__()
+            raise IndexError('no bin for NaN')
+
+        # the index in the table: the underflow bin, the bins, the
+        # overflow bin, and None
+        nbins = len(self.bins)
+        idxs = np.searchsorted(np.asarray(self.lows), values, side='right')
+        idxs[values >= self.ups[-1]] = nbins + 1
+        idxs[~valid] = nbins + 2
+
+        table = to_object_array((self.underflow_bin, ) + tuple(self.bins) + (self.overflow_bin, None))
+        return table[idxs]
+
     def next(self, bin):
         if self.lowedge:
             # call self._call__() to ensure that the 'bin' is indeed one of the
-            # bins.
-            bin = self.__call__(bin)
+            # bins unless the 'bin' is in the table, which has only the bins.
+            if not (isinstance(self._valid, ReturnTrue) and _contains(self._successors, bin)):
+                bin = self.__call__(bin)
+
+        try:
+            return self._successors[bin]
+        except (KeyError, TypeError):
+            pass
 
         if bin == self.underflow_bin: return self.bins[0]
         if bin == self.overflow_bin: return self.overflow_bin
         if bin == self.bins[-1]: return self.overflow_bin
         return self.bins[self.bins.index(bin) + 1]
 
+    def all_bins(self):
+        """return all bins in order, including the underflow and overflow bins"""
+        return (self.underflow_bin, ) + tuple(self.bins) + (self.overflow_bin, )
+
+##__________________________________________________________________||
+def _contains(dict_, key):
+    try:
+        return key in dict_
+    except TypeError:
+        # e.g., key is not hashable
+        return False
+
 ##__________________________________________________________________||
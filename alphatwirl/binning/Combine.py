@@ -1,5 +1,9 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 
+import numpy as np
+
+from ._array import call_bin_array
+
 ##__________________________________________________________________||
 class Combine(object):
     """A combine two binnings.
@@ -28,6 +32,32 @@ class Combine(object):
         else:
             return self._high(val)
 
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The values are split with a mask into those below *at* and the
+        others, which are given to ``bin_array()`` of *low* and *high*
+        respectively if they have the method. The bins are the same as
+        ``self(v)`` for each value ``v``.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the dtype ``object`` with the bins
+
+        """
+        values = np.atleast_1d(values)
+        low = values < self._at
+        high = ~low
+        ret = np.empty(len(values), dtype=object)
+        if low.any():
+            ret[low] = call_bin_array(self._low, values[low])
+        if high.any():
+            ret[high] = call_bin_array(self._high, values[high])
+        return ret
+
     def next(self, bin):
         if bin < self._at:
             bin = self._low.next(bin)
@@ -1,6 +1,8 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import numpy as np
 
 from .ReturnTrue import ReturnTrue
+from ._array import valid_array
 
 ##__________________________________________________________________||
 class PlusOne(object):
@@ -29,6 +31,32 @@ class Echo(object):
         if not self._valid(val): return None
         return val
 
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The bins are the values. The array of the values is returned as
+        it is, without a copy, unless ``valid`` returns ``False`` for
+        any value, in which case an array of the dtype ``object`` is
+        returned with ``None`` for those values.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the bins
+
+        """
+        values = np.atleast_1d(values)
+        if isinstance(self._valid, ReturnTrue):
+            return values
+        valid = valid_array(self._valid, values)
+        if valid.all():
+            return values
+        ret = np.empty(len(values), dtype=object)
+        ret[valid] = values[valid]
+        return ret
+
     def next(self, bin):
         if self._nextFunc is None: return None
         return self._nextFunc(bin)
@@ -0,0 +1,120 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import numbers
+
+import numpy as np
+
+from ._array import call_bin_array
+
+##__________________________________________________________________||
+class Memoize(object):
+    """A binning that remembers the bins of integer values
+
+    This class wraps a binning, e.g., ``Binning``, ``Round``,
+    ``RoundLog``, ``Combine``, or ``Echo``. The bins of integer values,
+    e.g., the numbers of jets or the run numbers, are looked up in a
+    table after the first time. The values of other types, e.g.,
+    floats, are given to the binning every time.
+
+    The table holds up to ``maxsize`` values. The values not in the
+    full table are given to the binning every time.
+
+    The numbers of the lookups found and not found in the table are
+    in ``nhits`` and ``nmisses``.
+
+    Args:
+        binning : the binning to wrap
+        maxsize (int) : the maximum number of values in the table
+
+    """
+    def __init__(self, binning, maxsize=4096):
+        self.binning = binning
+        self.maxsize = maxsize
+        self._table = { }
+        self.nhits = 0
+        self.nmisses = 0
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('binning', self.binning),
+            ('maxsize', self.maxsize),
+            ('nhits', self.nhits),
+            ('nmisses', self.nmisses),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def __call__(self, val):
+        if type(val) is not int and not _is_integral(type(val)):
+            return self.binning(val)
+        try:
+            ret = self._table[val]
+        except KeyError:
+            pass
+        else:
+            self.nhits += 1
+            return ret
+        self.nmisses += 1
+        ret = self.binning(val)
+        if len(self._table) < self.maxsize:
+            self._table[val] = ret
+        return ret
+
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The bins are the same as ``self(v)`` for each value ``v``. The
+        bins of integer arrays are looked up in the table for each
+        unique value.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the dtype ``object`` with the bins
+
+        """
+        values = np.atleast_1d(values)
+        if values.dtype.kind not in 'biu':
+            return call_bin_array(self.binning, values)
+
+        uniq, inverse = np.unique(values, return_inverse=True)
+        uniq = uniq.tolist()
+        bins = [self._table.get(v, _MISSING) for v in uniq]
+        missing = [i for i, b in enumerate(bins) if b is _MISSING]
+        self.nhits += len(uniq) - len(missing)
+        self.nmisses += len(missing)
+        if missing:
+            missing_bins = call_bin_array(self.binning, np.array([uniq[i] for i in missing], dtype=values.dtype))
+            for i, b in zip(missing, missing_bins.tolist()):
+                bins[i] = b
+                if len(self._table) < self.maxsize:
+                    self._table[uniq[i]] = b
+
+        ret = np.empty(len(bins), dtype=object)
+        ret[:] = bins
+        return ret[inverse.reshape(-1)]
+
+    def next(self, bin):
+        return self.binning.next(bin)
+
+    def all_bins(self):
+        return self.binning.all_bins()
+
+##__________________________________________________________________||
+_MISSING = object()
+
+_integral = { } # type -> bool
+
+def _is_integral(type_):
+    # isinstance(val, numbers.Integral), cached for each type as it
+    # is slow for abstract base classes
+    try:
+        return _integral[type_]
+    except KeyError:
+        ret = _integral[type_] = issubclass(type_, numbers.Integral)
+        return ret
+
+##__________________________________________________________________||
@@ -0,0 +1,159 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+
+import numpy as np
+
+from ._array import call_bin_array
+
+##__________________________________________________________________||
+class MultiBinning(object):
+    """A multi-dimensional binning with flat indices
+
+    This class combines the binnings of the elements of a key, e.g.,
+    the binnings of a table. The values are mapped directly to one
+    integer, the flat index of the bin, from the indices of the bins in
+    ``all_bins()`` of the binnings, as ``np.ravel_multi_index()``. All
+    binnings need to be bounded, i.e., have the method ``all_bins()``.
+
+    e.g., if the bins of the binnings are ``(-inf, 10, 20, 30)`` and
+    ``(0, 1, 2)``, the values ``(25, 1.5)``, in the bins ``(20, 1)``,
+    are mapped to ``2*3 + 1 = 7``.
+
+    This class is used by ``DenseSummarizer`` and ``PackedSummarizer``
+    to index the keys.
+
+    Args:
+        binnings: binnings of the elements of the key
+
+    """
+    def __init__(self, binnings):
+        self.binnings = tuple(binnings)
+
+        self._bins = [b.all_bins() for b in self.binnings]
+        # e.g., [(-inf, 10, 20, 30), (0, 1, 2)]
+
+        self._bin_idxs = [ ]
+        for bins in self._bins:
+            idxs = { }
+            for i, b in enumerate(bins):
+                idxs.setdefault(b, i)
+            self._bin_idxs.append(idxs)
+        # e.g., [{-inf: 0, 10: 1, 20: 2, 30: 3}, {0: 0, 1: 1, 2: 2}]
+
+        self.shape = tuple(len(b) for b in self._bins)
+        self.size = 1
+        for n in self.shape:
+            self.size *= n
+        if self.size > np.iinfo(np.int64).max:
+            raise ValueError('too many bins for int64: shape={!r}'.format(self.shape))
+
+        self._strides = [ ]
+        stride = 1
+        for n in reversed(self.shape):
+            self._strides.insert(0, stride)
+            stride *= n
+        # e.g., [3, 1]
+
+        self._zipped = list(zip(self.binnings, self._bin_idxs, self._strides))
+        self._zipped_key = list(zip(self._bins, self._strides, self.shape))
+
+    def __repr__(self):
+        return '{}(binnings={!r})'.format(
+            self.__class__.__name__,
+            self.binnings
+        )
+
+    def __call__(self, vals):
+        """return the flat index of the bin of the values
+
+        Args:
+            vals : a tuple of values, one for each binning
+
+        Returns:
+            an integer, or ``None`` if any binning returns ``None``
+
+        """
+        ret = 0
+        for (binning, idxs, stride), v in zip(self._zipped, vals):
+            bin = binning(v)
+            if bin is None:
+                return None
+            ret += idxs[bin]*stride
+        return ret
+
+    def index(self, key):
+        """return the flat index of the key, a tuple of bins"""
+        ret = 0
+        for (_, idxs, stride), b in zip(self._zipped, key):
+            ret += idxs[b]*stride
+        return ret
+
+    def key(self, index):
+        """return the key, a tuple of bins, of the flat index"""
+        return tuple(bins[(index//stride) % n] for bins, stride, n in self._zipped_key)
+
+    def call_batch(self, values):
+        """return the flat indices of the values in columns
+
+        Each binning is called once for each unique value, or its
+        ``bin_array()`` is used if it has the method.
+
+        Args:
+            values : a tuple of arrays, one for each binning
+
+        Returns:
+            a tuple ``(indices, valid)`` of an int64 array of the flat
+            indices and a bool array, which is ``False`` where any
+            binning returns ``None``. The indices are 0 where ``valid``
+            is ``False``.
+
+        """
+        nrows = len(values[0]) if values else 0
+        ret = np.zeros(nrows, dtype=np.int64)
+        valid = np.ones(nrows, dtype=bool)
+        for (binning, idxs, stride), v in zip(self._zipped, values):
+            uniq, inverse = np.unique(v, return_inverse=True)
+            bins = call_bin_array(binning, uniq).tolist()
+            bin_idxs = np.array([-1 if b is None else idxs[b] for b in bins], dtype=np.int64)
+            i = bin_idxs[inverse.reshape(-1)]
+            valid &= i >= 0
+            ret += np.where(i >= 0, i, 0)*stride
+        ret[~valid] = 0
+        return ret, valid
+
+    def index_array(self, keys):
+        """return the flat indices of the keys in columns
+
+        Args:
+            keys : a tuple of arrays of the bins, one for each binning
+
+        Returns:
+            an int64 array of the flat indices
+
+        """
+        nrows = len(keys[0]) if keys else 0
+        ret = np.zeros(nrows, dtype=np.int64)
+        for (_, idxs, stride), k in zip(self._zipped, keys):
+            uniq, inverse = np.unique(k, return_inverse=True)
+            bin_idxs = np.array([idxs[u] for u in uniq.tolist()], dtype=np.int64)
+            ret += bin_idxs[inverse.reshape(-1)]*stride
+        return ret
+
+    def key_array(self, indices):
+        """return the keys of the flat indices in columns
+
+        Args:
+            indices : an array of the flat indices
+
+        Returns:
+            a tuple of arrays of the bins, one for each binning
+
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        ret = [ ]
+        for bins, stride, n in self._zipped_key:
+            array = np.empty(len(bins), dtype=object)
+            array[:] = bins
+            ret.append(array[(indices//stride) % n])
+        return tuple(ret)
+
+##__________________________________________________________________||
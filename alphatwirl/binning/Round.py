@@ -4,7 +4,9 @@ import math
 import collections
 import logging
 
-from .search import binary_search
+import numpy as np
+
+from ._array import to_object_array, valid_array
 
 ##__________________________________________________________________||
 class Round(object):
@@ -57,6 +59,9 @@ class Round(object):
         self.overflow_bin = overflow_bin
         self.valid = valid
 
+        # the next bin of each bin, filled as needed unless bounded
+        self._successors = { }
+
         if self.min is not None:
             self._update_boundaries(self.min)
 
@@ -65,6 +70,10 @@ class Round(object):
             if self.overflow_bin is True:
                 self.overflow_bin = self.boundaries[-1]
 
+        if self.min is not None and self.max is not None:
+            for bin in self.all_bins():
+                self._successors[bin] = self._successor(bin)
+
     def __repr__(self):
         return '{}(width={!r}, aboundary={!r}, min={!r}, underflow_bin={!r}, max={!r}, overflow_bin={!r}, valid={!r})'.format(
             self.__class__.__name__,
@@ -97,15 +106,81 @@ class Round(object):
             if not val < self.boundaries[-1]:
                 return self.overflow_bin
 
-        if math.isinf(val):
+        if math.isinf(val) or math.isnan(val):
             logger = logging.getLogger(__name__)
             logger.warning('val={}. will return {}'.format(val, None))
             return None
 
         self._update_boundaries(val)
 
-        idx = binary_search(val, self.boundaries)
-        return self.boundaries[idx]
+        return self.boundaries[self._index(val)]
+
+    def _index(self, val):
+        # returns the index of the last boundary that is not greater
+        # than val. The index is computed in the closed form and then
+        # corrected because the boundaries, which are accumulated by
+        # adding the width, can differ from the closed form by
+        # rounding errors.
+        boundaries = self.boundaries
+        last = len(boundaries) - 1
+        idx = int(math.floor((val - boundaries[0])/self.width))
+        idx = min(max(idx, 0), last)
+        while val < boundaries[idx]:
+            idx -= 1
+        while idx < last and boundaries[idx + 1] <= val:
+            idx += 1
+        return idx
+
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The bins are the same as ``self(v)`` for each value ``v``.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the dtype ``object`` with the bins, ``None`` for
+            the invalid values, inf, and NaN
+
+        """
+        values = np.atleast_1d(values)
+        if values.dtype.kind not in 'biuf':
+            return to_object_array([self(v) for v in values.tolist()])
+
+        # the index in the table: the boundaries, the underflow bin,
+        # the overflow bin, and None. the boundaries are added after
+        # they are updated.
+        UNDERFLOW, OVERFLOW, NONE = -3, -2, -1
+        idxs = np.full(values.shape, NONE, dtype=np.int64)
+
+        rest = valid_array(self.valid, values)
+
+        if self.min is not None:
+            underflow = rest & ~(self.boundaries[0] <= values)
+            idxs[underflow] = UNDERFLOW
+            rest &= ~underflow
+
+        if self.max is not None:
+            overflow = rest & ~(values < self.boundaries[-1])
+            idxs[overflow] = OVERFLOW
+            rest &= ~overflow
+
+        nonfinite = rest & ~np.isfinite(values)
+        if nonfinite.any():
+            logger = logging.getLogger(__name__)
+            logger.warning('{} values are inf or NaN. will return {}'.format(nonfinite.sum(), None))
+            rest &= ~nonfinite
+
+        if rest.any():
+            self._update_boundaries(values[rest].min().item())
+            self._update_boundaries(values[rest].max().item())
+            boundaries = np.array(self.boundaries)
+            idxs[rest] = np.searchsorted(boundaries, values[rest], side='right') - 1
+
+        table = to_object_array(list(self.boundaries) + [self.underflow_bin, self.overflow_bin, None])
+        return table[idxs]
 
 
     def _update_boundaries(self, val):
@@ -119,6 +194,23 @@ class Round(object):
     def next(self, bin):
         return self._next_lower_boundary(bin)
 
+    def all_bins(self):
+        """return all bins in order, including the underflow and overflow bins
+
+        This method is only available when both ``min`` and ``max`` are
+        given. The underflow and overflow bins are not included if they
+        are ``None``.
+
+        """
+        if self.min is None or self.max is None:
+            raise ValueError('{!r} is not bounded. min and max need to be given'.format(self))
+        ret = list(self.boundaries)[:-1]
+        if self.underflow_bin is not None:
+            ret.insert(0, self.underflow_bin)
+        if self.overflow_bin is not None:
+            ret.append(self.overflow_bin)
+        return tuple(ret)
+
     def _next_lower_boundary(self, bin):
 
         bin = self._lower_boundary(bin)
@@ -126,6 +218,20 @@ class Round(object):
         if bin is None:
             return None
 
+        try:
+            return self._successors[bin]
+        except KeyError:
+            pass
+        except TypeError:
+            # e.g., underflow_bin is not hashable
+            return self._successor(bin)
+
+        ret = self._successors[bin] = self._successor(bin)
+        return ret
+
+    def _successor(self, bin):
+        # returns the next bin of the bin
+
         if bin == self.underflow_bin:
             return self._lower_boundary(self.min)
 
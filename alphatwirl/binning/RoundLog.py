@@ -1,7 +1,11 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import math
+import logging
+
+import numpy as np
 
 from .Round import Round
+from ._array import to_object_array, valid_array
 
 ##__________________________________________________________________||
 class RoundLog(object):
@@ -48,6 +52,11 @@ class RoundLog(object):
         self.min = min
         self.max = max
         self.valid = valid
+        self._edges_cache = None # (key, 10**b for the boundaries b)
+
+        # the next bin of the bin of each log10 boundary, filled as
+        # needed unless bounded
+        self._successors = { }
 
         if self.min is None:
             self.min_bin_log10_lowedge = None
@@ -67,6 +76,11 @@ class RoundLog(object):
             else:
                 self.overflow_bin = overflow_bin
 
+        if self.min is not None and self.max is not None:
+            for log10_bin in list(self._round.boundaries):
+                if self.min_bin_log10_lowedge <= log10_bin < self.max_bin_log10_upedge:
+                    self._successors[log10_bin] = self._successor(log10_bin)
+
     def __repr__(self):
         return '{}(width={!r}, aboundary={!r}, min={!r}, underflow_bin={!r}, max={!r}, overflow_bin={!r}, valid={!r})'.format(
             self.__class__.__name__,
@@ -115,6 +129,101 @@ class RoundLog(object):
 
         return 10**val
 
+    def bin_array(self, values):
+        """return the bins of the values in an array
+
+        The bins are the same as ``self(v)`` for each value ``v``.
+
+        The logarithms are computed in NumPy, which can differ from
+        ``math.log10()`` in the last digit. The values whose
+        logarithms are within the rounding errors of a boundary are
+        binned by ``self(v)``.
+
+        Args:
+            values : an array of the values. a scalar is taken as an
+                array of one value
+
+        Returns:
+            an array of the dtype ``object`` with the bins, ``None`` for
+            the invalid values
+
+        """
+        values = np.atleast_1d(values)
+        if values.dtype.kind not in 'biuf':
+            return to_object_array([self(v) for v in values.tolist()])
+
+        # the index in the table: the bins for the boundaries of
+        # self._round, the underflow bin, the overflow bin, 0, and None
+        UNDERFLOW, OVERFLOW, ZERO, NONE = -4, -3, -2, -1
+        idxs = np.full(values.shape, NONE, dtype=np.int64)
+
+        x = values.astype(np.float64)
+        rest = valid_array(self.valid, values)
+
+        nonpositive = rest & (x <= 0)
+        if self.min is not None:
+            idxs[nonpositive] = UNDERFLOW
+        else:
+            idxs[nonpositive & (x == 0)] = ZERO
+        rest &= ~nonpositive
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log10 = np.log10(np.where(rest, x, 1))
+
+        # the values near the boundaries
+        near = np.zeros(values.shape, dtype=bool)
+        tolerance = 1e-10*np.maximum(1, np.abs(log10))
+
+        if self.min is not None:
+            near |= rest & (np.abs(log10 - self.min_bin_log10_lowedge) <= tolerance)
+            underflow = rest & (log10 < self.min_bin_log10_lowedge)
+            idxs[underflow] = UNDERFLOW
+            rest &= ~underflow
+
+        inf = rest & np.isinf(x)
+        idxs[inf] = OVERFLOW if self.max is not None else NONE
+        rest &= ~inf
+
+        if self.max is not None:
+            near |= rest & (np.abs(log10 - self.max_bin_log10_upedge) <= tolerance)
+            overflow = rest & (self.max_bin_log10_upedge <= log10)
+            idxs[overflow] = OVERFLOW
+            rest &= ~overflow
+
+        nan = rest & np.isnan(x)
+        if nan.any():
+            logger = logging.getLogger(__name__)
+            logger.warning('{} values are NaN. will return {}'.format(nan.sum(), None))
+            rest &= ~nan
+
+        if rest.any():
+            self._round._update_boundaries(log10[rest].min().item())
+            self._round._update_boundaries(log10[rest].max().item())
+            boundaries = np.array(self._round.boundaries, dtype=np.float64)
+            i = np.searchsorted(boundaries, log10[rest], side='right') - 1
+            idxs[rest] = i
+            i_up = np.minimum(i + 1, len(boundaries) - 1)
+            t = tolerance[rest]
+            near[rest] |= (log10[rest] - boundaries[i] <= t) | (boundaries[i_up] - log10[rest] <= t)
+
+        ret = to_object_array(self._edges() + [self.underflow_bin, self.overflow_bin, 0, None])[idxs]
+
+        if near.any():
+            near = np.flatnonzero(near)
+            ret[near] = [self(v) for v in values[near].tolist()]
+
+        return ret
+
+    def _edges(self):
+        # returns 10**b for the boundaries b of self._round. cached
+        # until the boundaries grow
+        boundaries = self._round.boundaries
+        key = (len(boundaries), boundaries[0])
+        cache = self._edges_cache
+        if cache is None or cache[0] != key:
+            cache = self._edges_cache = (key, [10**b for b in boundaries])
+        return cache[1]
+
     def next(self, bin):
 
         if bin is None:
@@ -137,6 +246,17 @@ class RoundLog(object):
         if log10_bin is None:
             return None
 
+        try:
+            return self._successors[log10_bin]
+        except KeyError:
+            pass
+
+        ret = self._successors[log10_bin] = self._successor(log10_bin)
+        return ret
+
+    def _successor(self, log10_bin):
+        # returns the next bin of the bin whose log10 is log10_bin
+
         log10_next = self._round.next(log10_bin)
 
         if self.max is not None:
@@ -145,4 +265,21 @@ class RoundLog(object):
 
         return 10**log10_next
 
+    def all_bins(self):
+        """return all bins in order, including the underflow and overflow bins
+
+        This method is only available when both ``min`` and ``max`` are
+        given. The underflow and overflow bins are not included if they
+        are ``None``.
+
+        """
+        if self.min is None or self.max is None:
+            raise ValueError('{!r} is not bounded. min and max need to be given'.format(self))
+        ret = [10**b for b in self._round.boundaries if self.min_bin_log10_lowedge <= b < self.max_bin_log10_upedge]
+        if self.underflow_bin is not None:
+            ret.insert(0, self.underflow_bin)
+        if self.overflow_bin is not None:
+            ret.append(self.overflow_bin)
+        return tuple(ret)
+
 ##__________________________________________________________________||
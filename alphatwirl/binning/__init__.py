@@ -3,3 +3,5 @@ from .Round import Round
 from .RoundLog import RoundLog
 from .Echo import Echo
 from .Combine import Combine
+from .Memoize import Memoize
+from .MultiBinning import MultiBinning
@@ -0,0 +1,41 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import numpy as np
+
+from .ReturnTrue import ReturnTrue
+
+##__________________________________________________________________||
+# helpers for bin_array() of the binnings
+
+def to_object_array(values):
+    """return the values in a 1D array of the dtype ``object``
+
+    The elements are the values themselves, e.g., tuples are not
+    expanded into a 2D array.
+
+    """
+    ret = np.empty(len(values), dtype=object)
+    ret[:] = values
+    return ret
+
+def valid_array(valid, values):
+    """return the results of ``valid`` for the values in a bool array
+
+    ``valid`` is not called if it is ``None`` or ``ReturnTrue``.
+
+    """
+    if valid is None or isinstance(valid, ReturnTrue):
+        return np.ones(values.shape, dtype=bool)
+    return np.array([bool(valid(v)) for v in values.tolist()], dtype=bool)
+
+def call_bin_array(binning, values):
+    """return the bins of the values in an array of the dtype ``object``
+
+    ``bin_array()`` of the binning is used if it has the method.
+    Otherwise, the binning is called for each value.
+
+    """
+    if callable(getattr(type(binning), 'bin_array', None)):
+        return binning.bin_array(values)
+    return to_object_array([binning(v) for v in values.tolist()])
+
+##__________________________________________________________________||
@@ -1,6 +1,8 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import itertools
 
+from ..summary import merge_summarizers
+
 ##__________________________________________________________________||
 class ToTupleList(object):
     def __init__(self, summaryColumnNames
@@ -39,7 +41,11 @@ class ToTupleList(object):
         # e.g.,
         # summarizers_list = (summarizer1, summarizer2, summarizer3, summarizer4)
 
-        summarizer = sum(summarizers_list)
+        summarizer = merge_summarizers(summarizers_list)
+        # the same as sum(summarizers_list) but reduced at once without
+        # copying the accumulator at every step
+        if summarizer is None:
+            return None
 
         ret = summarizer.to_tuple_list()
         # e.g.,
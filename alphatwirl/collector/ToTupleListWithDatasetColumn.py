@@ -1,17 +1,31 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 
+from ..summary import merge_summarizers
+
 ##__________________________________________________________________||
 class ToTupleListWithDatasetColumn(object):
+    """
+    Args:
+        summaryColumnNames (tuple): the column names of the summaries
+        datasetColumnName (str): the column name of the datasets
+        stream (bool): if True, ``combine()`` returns an iterable that
+            creates the rows one at a time each time iterated instead
+            of a list, e.g., for ``SpillScan``
+
+    """
     def __init__(self, summaryColumnNames,
-                 datasetColumnName='component'
+                 datasetColumnName='component',
+                 stream=False
                  ):
 
         self.summaryColumnNames = summaryColumnNames
         self.datasetColumnName = datasetColumnName
+        self.stream = stream
 
         self._repr_pairs = [
             ('summaryColumnNames', self.summaryColumnNames),
             ('datasetColumnName',  self.datasetColumnName),
+            ('stream',             self.stream),
         ]
 
     def __repr__(self):
@@ -45,7 +59,7 @@ class ToTupleListWithDatasetColumn(object):
         #     ('WJets',  (summarizer4, ),
         # ]
 
-        dataset_summarizer_pairs = [(d, sum(s)) for d, s in  dataset_summarizers_list]
+        dataset_summarizer_pairs = [(d, merge_summarizers(s)) for d, s in  dataset_summarizers_list]
         # e.g.,
         # dataset_summarizer_pairs = [
         #     ('QCD',    summarizer1 + summarizer2),
@@ -54,6 +68,11 @@ class ToTupleListWithDatasetColumn(object):
         # ]
         # note: summarizers can be added
 
+        header = (self.datasetColumnName, ) + self.summaryColumnNames
+
+        if self.stream:
+            return _Stream(header, dataset_summarizer_pairs)
+
         dataset_tuple_list_pairs = [(d, s.to_tuple_list()) for d, s in dataset_summarizer_pairs]
         # e.g.,
         # dataset_tuple_list_pairs = [
@@ -81,8 +100,6 @@ class ToTupleListWithDatasetColumn(object):
         #     ('TTJets', 300, 3,  15,  30)
         # ]
 
-        header = (self.datasetColumnName, ) + self.summaryColumnNames
-
         ret.insert(0, header)
         # e.g.,
         # [
@@ -97,3 +114,21 @@ class ToTupleListWithDatasetColumn(object):
         return ret
 
 ##__________________________________________________________________||
+class _Stream(object):
+    """the combined results, created one row at a time each time iterated"""
+
+    def __init__(self, header, dataset_summarizer_pairs):
+        self.header = header
+        self.dataset_summarizer_pairs = dataset_summarizer_pairs
+
+    def __iter__(self):
+        yield self.header
+        for dataset, summarizer in self.dataset_summarizer_pairs:
+            if hasattr(summarizer, 'to_tuple_iter'):
+                tuples = summarizer.to_tuple_iter()
+            else:
+                tuples = summarizer.to_tuple_list()
+            for e in tuples:
+                yield (dataset, ) + e
+
+##__________________________________________________________________||
@@ -2,9 +2,24 @@
 from ..misc import mkdir_p
 from ..misc import list_to_aligned_text
 import os
+import itertools
 
 ##__________________________________________________________________||
 class WriteListToFile(object):
+    """
+    Args:
+        outPath (str): the path to the output file
+
+    The results are a list of rows with the header first. They can
+    also be an iterable of rows that are not all in memory, e.g., the
+    results of ``ToTupleListWithDatasetColumn`` with ``stream=True``,
+    in which case the rows are written in blocks of ``block_size``
+    rows. The columns are aligned in each block.
+
+    """
+
+    block_size = 10000
+
     def __init__(self, outPath):
         self._outPath = outPath
 
@@ -17,15 +32,28 @@ class WriteListToFile(object):
     def deliver(self, results):
         if results is None: return
         f = self._open(self._outPath)
-        f.write(list_to_aligned_text(results).encode())
+        if isinstance(results, list):
+            f.write(list_to_aligned_text(results).encode())
+        else:
+            for block in _blocks(results, self.block_size):
+                f.write(list_to_aligned_text(block).encode())
         self._close(f)
 
     def _open(self, path):
         directory = os.path.dirname(path)
         if directory:
             mkdir_p(directory)
-        return open(path, 'w')
+        return open(path, 'wb')
 
     def _close(self, file): file.close()
 
 ##__________________________________________________________________||
+def _blocks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        block = list(itertools.islice(iterator, size))
+        if not block:
+            return
+        yield block
+
+##__________________________________________________________________||
@@ -10,7 +10,7 @@ from collections import deque
 from ..progressbar import NullProgressMonitor
 from .TaskPackage import TaskPackage
 
-from .Worker import Worker
+from .Worker import Worker, _PartialResult
 
 ##__________________________________________________________________||
 # https://docs.python.org/3/howto/logging-cookbook.html#logging-to-a-single-file-from-multiple-processes
@@ -39,6 +39,7 @@ class MultiprocessingDropbox(object):
         self.lock = multiprocessing.Lock()
         self.n_ongoing_tasks = 0
         self.task_idx = -1 # so it starts from 0
+        self._partial_results = { } # task_idx -> merged partial results
 
     def __repr__(self):
         return '{}(progressMonitor={!r}, n_max_workers={!r}, n_ongoing_tasks={!r}, task_idx={!r})'.format(
@@ -137,14 +138,37 @@ class MultiprocessingDropbox(object):
 
         return messages
 
+    def partial_results(self):
+        """Return a dict of task indices and partial results
+
+        The partial results are those sent by running tasks with
+        ``alphatwirl.concurrently.send_partial_result()`` and merged
+        as received. They are, e.g., live results of long tasks or
+        what can be salvaged if a task does not finish.
+        """
+        return dict(self._partial_results)
+
     def _receive_finished(self):
         messages = [ ] # a list of (task_idx, result)
         while not self.result_queue.empty():
-            message = self.result_queue.get()
-            messages.append(message)
+            task_idx, result = self.result_queue.get()
+            if isinstance(result, _PartialResult):
+                self._merge_partial_result(task_idx, result.result)
+                continue
+            if task_idx in self._partial_results:
+                self._merge_partial_result(task_idx, result)
+                result = self._partial_results.pop(task_idx)
+            messages.append((task_idx, result))
             self.n_ongoing_tasks -= 1
         return messages
 
+    def _merge_partial_result(self, task_idx, result):
+        merged = self._partial_results.get(task_idx)
+        if merged is None:
+            self._partial_results[task_idx] = result
+            return
+        merged.merge(result)
+
     def terminate(self):
         for worker in self.workers:
             worker.terminate()
@@ -9,6 +9,7 @@ except ImportError:
     from .queuehandler import QueueHandler
 
 from alphatwirl import progressbar
+from alphatwirl import concurrently
 
 ##__________________________________________________________________||
 class Worker(multiprocessing.Process):
@@ -45,9 +46,26 @@ class Worker(multiprocessing.Process):
                 self.task_queue.task_done()
                 break
             task_idx, package = message
-            result = package.task(*package.args, **package.kwargs)
+            concurrently._partial_result_sender = _PartialResultSender(self.result_queue, task_idx)
+            try:
+                result = package.task(*package.args, **package.kwargs)
+            finally:
+                concurrently._partial_result_sender = None
             self.task_queue.task_done()
             self.result_queue.put((task_idx, result))
 
+##__________________________________________________________________||
+class _PartialResult(object):
+    """a partial result of a task in the result queue"""
+    def __init__(self, result):
+        self.result = result
+
+class _PartialResultSender(object):
+    def __init__(self, result_queue, task_idx):
+        self.result_queue = result_queue
+        self.task_idx = task_idx
+
+    def __call__(self, result):
+        self.result_queue.put((self.task_idx, _PartialResult(result)))
 
 ##__________________________________________________________________||
@@ -6,3 +6,33 @@ from .MultiprocessingDropbox import MultiprocessingDropbox
 from .SubprocessRunner import SubprocessRunner
 from .WorkingArea import WorkingArea
 from .HTCondorJobSubmitter import HTCondorJobSubmitter
+
+##__________________________________________________________________||
+_partial_result_sender = None
+
+def can_send_partial_result():
+    """True if partial results can be sent to the main process
+
+    i.e., if the task is running in a worker of
+    ``MultiprocessingDropbox``.
+    """
+    return _partial_result_sender is not None
+
+def send_partial_result(result):
+    """send a partial result of the running task to the main process
+
+    The main process merges the partial results of the task in the
+    order in which they are sent with ``merge()`` of the result and
+    then merges the result of the task into them. The result needs
+    to have ``merge()``.
+
+    Returns:
+        True if sent, False if partial results cannot be sent
+
+    """
+    if _partial_result_sender is None:
+        return False
+    _partial_result_sender(result)
+    return True
+
+##__________________________________________________________________||
@@ -24,17 +24,24 @@ class TableConfigCompleter(object):
             'outFilePath': '/tmp/tbl_n_component_met_pt.txt',
         }
 
+    If ``keyColumnCache`` is given, it is added to the configs unless
+    the configs have it. The key columns are binned once for each
+    event and shared by the tables with the same attributes, indices,
+    and binning objects.
+
     """
     def __init__(self,
                  defaultSummaryClass=Count,
                  defaultWeight=WeightCalculatorOne(),
                  defaultOutDir='.',
-                 createOutFileName=TableFileNameComposer()):
+                 createOutFileName=TableFileNameComposer(),
+                 keyColumnCache=None):
 
         self.defaultSummaryClass = defaultSummaryClass
         self.defaultWeight = defaultWeight
         self.defaultOutDir = defaultOutDir
         self.createOutFileName = createOutFileName
+        self.keyColumnCache = keyColumnCache
 
         self.default_cfg = dict(
             keyAttrNames=( ),
@@ -55,6 +62,7 @@ class TableConfigCompleter(object):
             ('defaultWeight', self.defaultWeight),
             ('defaultOutDir', self.defaultOutDir),
             ('createOutFileName', self.createOutFileName),
+            ('keyColumnCache', self.keyColumnCache),
         )
         return '{}({})'.format(
             self.__class__.__name__,
@@ -67,6 +75,9 @@ class TableConfigCompleter(object):
 
         use_defaultSummaryClass = 'summaryClass' not in tblcfg
 
+        if self.keyColumnCache is not None:
+            ret.setdefault('keyColumnCache', self.keyColumnCache)
+
         ret['keyOutColumnNames'] = ret.get('keyOutColumnNames', ret['keyAttrNames'])
         # TODO: this line is not tested well. The following code also passes the tests
         # ret['keyOutColumnNames'] = ret.get('keyAttrNames', ret['keyAttrNames'])
@@ -74,6 +85,10 @@ class TableConfigCompleter(object):
         if 'valOutColumnNames' not in ret:
             if use_defaultSummaryClass:
                 ret['valOutColumnNames'] = ('n', 'nvar')
+            elif hasattr(ret['summaryClass'], 'out_column_names'):
+                # e.g., Moments, with more than one column for each value
+                valAttrNames = ret['valAttrNames'] if ret['valAttrNames'] is not None else ()
+                ret['valOutColumnNames'] = ret['summaryClass'].out_column_names(valAttrNames)
             else:
                 ret['valOutColumnNames'] = ret['valAttrNames'] if ret['valAttrNames'] is not None else ()
 
@@ -87,6 +102,9 @@ class TableConfigCompleter(object):
                     keyOutColumnNames  = ret['keyOutColumnNames'] if ret['keyOutColumnNames'] is not None else ()
                     keyIndices = ret['keyIndices'] if ret['keyIndices'] is not None else (None, )*len(keyOutColumnNames)
                     valOutColumnNames  = ret['valOutColumnNames'] if ret['valOutColumnNames'] is not None else ()
+                    if hasattr(ret['summaryClass'], 'out_column_names'):
+                        # the names of the values rather than the columns
+                        valOutColumnNames = ret['valAttrNames'] if ret['valAttrNames'] is not None else ()
                     valIndices = ret['valIndices'] if ret['valIndices'] is not None else (None, )*len(valOutColumnNames)
                     ret['outFileName'] = self.createOutFileName(
                         keyOutColumnNames + valOutColumnNames,
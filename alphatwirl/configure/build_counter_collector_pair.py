@@ -1,5 +1,7 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
-from ..summary import Reader, Summarizer, NextKeyComposer, KeyValueComposer
+from ..summary import Reader, Summarizer, DenseSummarizer, PackedSummarizer
+from ..summary import SpillSummarizer
+from ..summary import NextKeyComposer, KeyValueComposer
 from ..collector import ToTupleListWithDatasetColumn
 from ..collector import WriteListToFile
 from ..loop import Collector
@@ -11,21 +13,41 @@ def build_counter_collector_pair(tblcfg):
         binnings=tblcfg['binnings'],
         keyIndices=tblcfg['keyIndices'],
         valAttrNames=tblcfg['valAttrNames'],
-        valIndices=tblcfg['valIndices']
+        valIndices=tblcfg['valIndices'],
+        keyColumnCache=tblcfg.get('keyColumnCache')
     )
     nextKeyComposer = NextKeyComposer(tblcfg['binnings']) if tblcfg['binnings'] is not None else None
-    summarizer = Summarizer(
-        Summary=tblcfg['summaryClass']
-    )
+    if tblcfg.get('dense', False):
+        summarizer = DenseSummarizer(
+            Summary=tblcfg['summaryClass'],
+            binnings=tblcfg['binnings']
+        )
+    elif tblcfg.get('packKeys', False):
+        summarizer = PackedSummarizer(
+            Summary=tblcfg['summaryClass'],
+            binnings=tblcfg['binnings']
+        )
+    elif tblcfg.get('maxKeys') is not None:
+        summarizer = SpillSummarizer(
+            Summary=tblcfg['summaryClass'],
+            directory=tblcfg.get('spillDirectory'),
+            max_keys=tblcfg['maxKeys']
+        )
+    else:
+        summarizer = Summarizer(
+            Summary=tblcfg['summaryClass']
+        )
     reader = Reader(
         keyValComposer=keyValComposer,
         summarizer=summarizer,
         nextKeyComposer=nextKeyComposer,
         weightCalculator=tblcfg['weight'],
-        nevents=tblcfg['nevents']
+        nevents=tblcfg['nevents'],
+        bulkNextKeys=True
     )
     resultsCombinationMethod = ToTupleListWithDatasetColumn(
-        summaryColumnNames = tblcfg['keyOutColumnNames'] + tblcfg['valOutColumnNames']
+        summaryColumnNames = tblcfg['keyOutColumnNames'] + tblcfg['valOutColumnNames'],
+        stream=tblcfg.get('stream', False)
     )
     deliveryMethod = WriteListToFile(tblcfg['outFilePath']) if tblcfg['outFile'] else None
     collector = Collector(resultsCombinationMethod, deliveryMethod)
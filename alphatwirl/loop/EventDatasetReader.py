@@ -20,14 +20,21 @@ class EventDatasetReader(object):
     At the end, this class receives results from the event loop runner
     and have the collector collect them.
 
+    If `delta_nevents` or `delta_seconds` is given, the event loops
+    send partial results at the intervals if the event loop runner
+    supports partial results. See `EventLoop`.
+
     """
     def __init__(self, eventLoopRunner, reader, collector,
-                 split_into_build_events):
+                 split_into_build_events,
+                 delta_nevents=None, delta_seconds=None):
 
         self.eventLoopRunner = eventLoopRunner
         self.reader = reader
         self.collector = collector
         self.split_into_build_events = split_into_build_events
+        self.delta_nevents = delta_nevents
+        self.delta_seconds = delta_seconds
 
         self.EventLoop = EventLoop
 
@@ -40,6 +47,8 @@ class EventDatasetReader(object):
             ('reader', self.reader),
             ('collector', self.collector),
             ('split_into_build_events', self.split_into_build_events),
+            ('delta_nevents', self.delta_nevents),
+            ('delta_seconds', self.delta_seconds),
         )
         self._repr = '{}({})'.format(
             self.__class__.__name__,
@@ -61,7 +70,11 @@ class EventDatasetReader(object):
         eventLoops = [ ]
         for build_events in build_events_list:
             reader = copy.deepcopy(self.reader)
-            eventLoop = self.EventLoop(build_events, reader, dataset.name)
+            eventLoop = self.EventLoop(
+                build_events, reader, dataset.name,
+                delta_nevents=self.delta_nevents,
+                delta_seconds=self.delta_seconds
+            )
             eventLoops.append(eventLoop)
         runids = self.eventLoopRunner.run_multiple(eventLoops)
 
@@ -1,4 +1,5 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import time
 import uuid
 
 import alphatwirl
@@ -14,12 +15,33 @@ class EventLoop(object):
             `begin()` is called and after `end` is called.
         progressbar_label (optional): a label shown by the progress
             bar
+        delta_nevents (optional): if given, send the partial results
+            every this number of events
+        delta_seconds (optional): if given, send the partial results
+            every this number of seconds
+
+    If the reader has the method `is_done()` and it returns `True`,
+    the loop stops without reading the remaining events because no
+    further events can change the results, e.g., all readers have
+    read the maximum number of events. The progress is reported as
+    complete.
+
+    The partial results are sent only if the loop is running in a
+    worker that can send them to the main process (see
+    `alphatwirl.concurrently.send_partial_result()`). The reader needs
+    to have `delta()`, which returns the results read since the last
+    partial result, ready to be merged, and clears them in the reader.
+    The main process merges the partial results and the result of the
+    loop.
 
     """
     @_renamed_class_method_option(old='name', new='progressbar_label')
-    def __init__(self, build_events, reader, progressbar_label=None):
+    def __init__(self, build_events, reader, progressbar_label=None,
+                 delta_nevents=None, delta_seconds=None):
         self.build_events = build_events
         self.reader = reader
+        self.delta_nevents = delta_nevents
+        self.delta_seconds = delta_seconds
 
         # assign a random unique id to be used by progress bar
         self.taskid = uuid.uuid4()
@@ -35,6 +57,8 @@ class EventLoop(object):
             ('build_events', self.build_events),
             ('reader', self.reader),
             ('progressbar_label', self.progressbar_label),
+            ('delta_nevents', self.delta_nevents),
+            ('delta_seconds', self.delta_seconds),
         )
         self._repr = '{}({})'.format(
             self.__class__.__name__,
@@ -48,12 +72,41 @@ class EventLoop(object):
         self.nevents = len(events)
         self._report_progress(0)
         self.reader.begin(events)
-        for i, event in enumerate(events):
-            self._report_progress(i+1)
-            self.reader.event(event)
+        is_done = self._is_done_method()
+        send_delta = self._delta_sender()
+        if is_done is not None and is_done() is True:
+            self._report_progress(self.nevents)
+        else:
+            for i, event in enumerate(events):
+                self._report_progress(i+1)
+                self.reader.event(event)
+                if is_done is not None and is_done() is True:
+                    if i + 1 < self.nevents:
+                        self._report_progress(self.nevents)
+                    break
+                if send_delta is not None:
+                    send_delta(i + 1)
         self.reader.end()
         return self.reader
 
+    def _delta_sender(self):
+        # returns a function to be called after each event that sends
+        # the partial results when due, or None
+        if self.delta_nevents is None and self.delta_seconds is None:
+            return None
+        if not alphatwirl.concurrently.can_send_partial_result():
+            return None
+        if not callable(getattr(type(self.reader), 'delta', None)):
+            return None
+        return _DeltaSender(self.reader, self.delta_nevents, self.delta_seconds)
+
+    def _is_done_method(self):
+        # the method is looked up in the class so that, e.g., a mock
+        # reader does not stop the loop
+        if not callable(getattr(type(self.reader), 'is_done', None)):
+            return None
+        return self.reader.is_done
+
     def _report_progress(self, i):
         try:
             report = alphatwirl.progressbar.ProgressReport(
@@ -65,3 +118,26 @@ class EventLoop(object):
             pass
 
 ##__________________________________________________________________||
+class _DeltaSender(object):
+    def __init__(self, reader, nevents, seconds):
+        self.reader = reader
+        self.nevents = nevents
+        self.seconds = seconds
+        self.last_ievent = 0
+        self.last_time = time.time()
+
+    def __call__(self, ievent):
+        if not self._due(ievent):
+            return
+        alphatwirl.concurrently.send_partial_result(self.reader.delta())
+        self.last_ievent = ievent
+        self.last_time = time.time()
+
+    def _due(self, ievent):
+        if self.nevents is not None and self.nevents <= ievent - self.last_ievent:
+            return True
+        if self.seconds is not None and self.seconds <= time.time() - self.last_time:
+            return True
+        return False
+
+##__________________________________________________________________||
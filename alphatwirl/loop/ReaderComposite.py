@@ -16,6 +16,10 @@ class ReaderComposite(object):
     order in which the readers are added. If a reader returns `False`,
     it won't call the remaining readers.
 
+    `is_done()` returns `True` if all readers are done, i.e., if each
+    reader has `is_done()` that returns `True`. Then, no further
+    events can change the results.
+
     """
 
     def __init__(self, readers=None):
@@ -43,12 +47,37 @@ class ReaderComposite(object):
             if reader.event(event) is False:
                 break
 
+    def is_done(self):
+        for reader in self.readers:
+            if not hasattr(reader, 'is_done'):
+                return False
+            if reader.is_done() is not True:
+                return False
+        return True
+
     def end(self):
         for reader in self.readers:
             if not hasattr(reader, 'end'):
                 continue
             reader.end()
 
+    def clear(self):
+        for reader in self.readers:
+            if not hasattr(reader, 'clear'):
+                continue
+            reader.clear()
+
+    def delta(self):
+        """return the results read since the last clear and clear them
+
+        The results are returned in a new composite of ``delta()`` of
+        the readers. The readers without ``delta()`` are included as
+        they are.
+
+        """
+        readers = [r.delta() if hasattr(r, 'delta') else r for r in self.readers]
+        return self.__class__(readers)
+
     def merge(self, other):
         for r, o in zip(self.readers, other.readers):
             if not hasattr(r, 'merge'):
@@ -52,6 +52,11 @@ class Count(object):
             r[IDX_TOTAL] += 1 # total
             if p: r[IDX_PASS] += 1 # pass
 
+    def clear(self):
+        for r in self._results:
+            r[IDX_PASS] = 0
+            r[IDX_TOTAL] = 0
+
     def increment_depth(self, by = 1):
         for r in self._results:
             r[IDX_DEPTH] += by
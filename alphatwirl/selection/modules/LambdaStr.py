@@ -39,6 +39,10 @@ class LambdaStr(object):
     def __call__(self, event):
         return self.event(event)
 
+    def is_done(self):
+        # no results change with events
+        return True
+
     def end(self):
         self.func = None
 
@@ -47,6 +47,16 @@ class Base(object):
     def event(self, event):
         return self(event)
 
+    def is_done(self):
+        # as in ReaderComposite, the selections without is_done(),
+        # e.g., AllwCount, are not done
+        for s in self.selections:
+            if not hasattr(s, 'is_done'):
+                return False
+            if s.is_done() is not True:
+                return False
+        return True
+
     def end(self):
         for s in self.selections:
             if hasattr(s, 'end'): s.end()
@@ -114,6 +124,11 @@ class Not(object):
     def event(self, event):
         return self(event)
 
+    def is_done(self):
+        if not hasattr(self.selection, 'is_done'):
+            return False
+        return self.selection.is_done() is True
+
     def end(self):
         if hasattr(self.selection, 'end'):
             self.selection.end()
@@ -60,6 +60,18 @@ class WithCountBase(object):
         for s in self.selections:
             if hasattr(s, 'end'): s.end()
 
+    def clear(self):
+        self.count.clear()
+        for s in self.selections:
+            if hasattr(s, 'clear'): s.clear()
+
+    def delta(self):
+        ret = copy.copy(self)
+        ret.count = self.count.copy()
+        self.count.clear()
+        ret.selections = [s.delta() if hasattr(s, 'delta') else s for s in self.selections]
+        return ret
+
     def merge(self, other):
         self.count += other.count
         for s, o in zip(self.selections, other.selections):
@@ -165,6 +177,17 @@ class NotwCount(object):
     def end(self):
         if hasattr(self.selection, 'end'): self.selection.end()
 
+    def clear(self):
+        self.count.clear()
+        if hasattr(self.selection, 'clear'): self.selection.clear()
+
+    def delta(self):
+        ret = copy.copy(self)
+        ret.count = self.count.copy()
+        self.count.clear()
+        if hasattr(self.selection, 'delta'): ret.selection = self.selection.delta()
+        return ret
+
     def merge(self, other):
         self.count += other.count
         if not hasattr(self.selection, 'merge'):
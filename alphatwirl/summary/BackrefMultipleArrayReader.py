@@ -1,6 +1,8 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import itertools
-import numbers
+import operator
+
+import numpy as np
 
 ##__________________________________________________________________||
 class BackrefMultipleArrayReader(object):
@@ -14,14 +16,9 @@ class BackrefMultipleArrayReader(object):
         #
         self._check_args(arrays, idxs_conf, backref_idxs)
 
-        #
-        self.take_fast_path = not self._is_backref_used(backref_idxs)
-
-        if self.take_fast_path:
-            self._init_fast_path(arrays, idxs_conf)
-            return
+        self.arrays = arrays
 
-        self._init_full_path(arrays, idxs_conf, backref_idxs)
+        self._compile(idxs_conf, backref_idxs)
 
     def _check_args(self, arrays, idxs_conf, backref_idxs):
 
@@ -40,56 +37,64 @@ class BackrefMultipleArrayReader(object):
                     )
                 )
 
-    def _is_backref_used(self, backref_idxs):
-        if backref_idxs is None:
-            return False
-        return any([e is not None for e in backref_idxs])
+    def _compile(self, idxs_conf, backref_idxs):
+        # compile the configuration into a plan to generate the
+        # indices, used in every read
 
-    def _init_common(self, arrays, idxs_conf):
-        self.arrays = arrays
+        self._groups = self._group_entries(idxs_conf, backref_idxs)
+        # e.g.,
+        # idxs_conf = (0, '*', None, '*', None, None, None, None)
+        # backref_idxs = [None, None, 1, None, 3, 1, 1, 3]
+        # self._groups = [0, 1, 1, 2, 2, 1, 1, 2]
+
+        ngroups = max(self._groups) + 1 if self._groups else 0
+
+        self._group_members = [
+            [i for i, g in enumerate(self._groups) if g == group]
+            for group in range(ngroups)]
+        # e.g., [[0], [1, 2, 5, 6], [3, 4, 7]]
 
-        self.wildcard_conf = tuple(c == '*' for c in idxs_conf)
-        # e.g., (False, True, False, True, False, False, False, False)
+        anchors = [m[0] for m in self._group_members]
+        self._group_idxs = [None if idxs_conf[i] == '*' else idxs_conf[i] for i in anchors]
+        # the index of each group, None for wildcards
+        # e.g., [0, None, None]
 
-        self.idxs_conf = tuple(c if isinstance(c, numbers.Number) else None for c in idxs_conf)
-        # e.g., (0, None, None, None, None, None, None, None)
+        self._zipped = list(zip(self._group_members, self._group_idxs))
 
-    def _init_fast_path(self, arrays, idxs_conf):
-        self._init_common(arrays, idxs_conf)
-        self._zipped = list(zip(self.arrays, self.idxs_conf, self.wildcard_conf))
+        self._plans = { } # the number of the indices of each group -> plan
 
-    def _init_full_path(self, arrays, idxs_conf, backref_idxs):
-        self._init_common(arrays, idxs_conf)
+        # without back references, the product of the values is
+        # faster than the plans
+        self._without_backref = all(len(m) == 1 for m in self._group_members)
+        self._zipped_without_backref = list(zip(self.arrays, self._group_idxs))
 
-        self.uniq_idxs = [ ]
-        self.ref_idxs = [ ]
+    def _group_entries(self, idxs_conf, backref_idxs):
+        # the index of the group for each entry. entries referring to
+        # the same index via back references are in the same group.
+        if backref_idxs is None:
+            backref_idxs = (None, )*len(idxs_conf)
+        ret = [ ]
+        ngroups = 0
         for i in backref_idxs:
             if i is None:
-                l = [ ]
-                self.uniq_idxs.append(l)
-                self.ref_idxs.append(l)
+                ret.append(ngroups)
+                ngroups += 1
             else:
-                self.ref_idxs.append(self.ref_idxs[i])
-
+                ret.append(ret[i])
         # e.g.,
-        # self.uniq_idxs = [[], [], []]
-        # [id(o) for o in self.uniq_idxs] = [048, 480, 120]
-        # self.ref_idxs = [[], [], [], [], [], [], [], []]
-        # [id(o) for o in self.ref_idxs] = [048, 480, 480, 120, 120, 480, 480, 120]
-
-        self._zipped_1 = list(zip(self.arrays, self.idxs_conf, self.wildcard_conf, self.ref_idxs))
-        self._zipped_2 = list(zip(self.arrays, self.ref_idxs))
+        # idxs_conf = (0, '*', None, '*', None, None, None, None)
+        # backref_idxs = [None, None, 1, None, 3, 1, 1, 3]
+        # ret = [0, 1, 1, 2, 2, 1, 1, 2]
+        return ret
 
     def read(self):
-        if self.take_fast_path:
-            return self._fast_read_without_backref()
+        if self._without_backref:
+            return self._read_without_backref()
         return self._read_with_backref()
 
-    def _fast_read_without_backref(self):
+    def _read_without_backref(self):
 
         # e.g.,
-        # self.idxs_conf = (1, None, None, 2, None)
-        # self.wildcard_conf = (False, True, True, False, True)
         # self.arrays = [
         #     [55, 66, 77],
         #     [12, 13, 14],
@@ -97,11 +102,11 @@ class BackrefMultipleArrayReader(object):
         #     [222, 333, 444, 555],
         #     [1001, 1002, 1003]
         # ]
+        # self._group_idxs = [1, None, None, 2, None]
 
-        # read arrays
         vals = [ ]
-        for array, idx, wild in self._zipped:
-            if wild:
+        for array, idx in self._zipped_without_backref:
+            if idx is None:
                 vals.append(list(array))
                 continue
             if idx < len(array):
@@ -110,35 +115,15 @@ class BackrefMultipleArrayReader(object):
             # idx is out of the range
             vals.append([ ])
         # e.g.,
-        # vals = [
-        #     [66],
-        #     [12, 13, 14],
-        #     [104, 105],
-        #     [444],
-        #     [1001, 1002, 1003]
-        # ]
+        # vals = [[66], [12, 13, 14], [104, 105], [444], [1001, 1002, 1003]]
 
         # expand with all combinations
-        ret =  tuple(itertools.product(*vals))
+        ret = tuple(itertools.product(*vals))
         # e.g.,
         # ret = (
         #     (66, 12, 104, 444, 1001),
         #     (66, 12, 104, 444, 1002),
-        #     (66, 12, 104, 444, 1003),
-        #     (66, 12, 105, 444, 1001),
-        #     (66, 12, 105, 444, 1002),
-        #     (66, 12, 105, 444, 1003),
-        #     (66, 13, 104, 444, 1001),
-        #     (66, 13, 104, 444, 1002),
-        #     (66, 13, 104, 444, 1003),
-        #     (66, 13, 105, 444, 1001),
-        #     (66, 13, 105, 444, 1002),
-        #     (66, 13, 105, 444, 1003),
-        #     (66, 14, 104, 444, 1001),
-        #     (66, 14, 104, 444, 1002),
-        #     (66, 14, 104, 444, 1003),
-        #     (66, 14, 105, 444, 1001),
-        #     (66, 14, 105, 444, 1002),
+        #     ...
         #     (66, 14, 105, 444, 1003)
         # )
 
@@ -158,78 +143,25 @@ class BackrefMultipleArrayReader(object):
         #     [91, 92, 93]
         # ]
 
-        # initialize self.uniq_idxs
-        for i in self.uniq_idxs:
-            i[:] = [ ]
-        # e.g.,
-        # self.uniq_idxs = [[], [], []]
-        # self.ref_idxs = [[], [], [], [], [], [], [], []]
-
+        lens = [len(a) for a in self.arrays]
 
-        # fill self.ref_idxs
-        for array, idx, wild, ref in self._zipped_1:
-            larray = len(array)
-            if idx is not None:
-                ref[:] = [idx] if idx < larray else [ ]
-                continue
-            if wild:
-                ref[:] = range(larray)
-                continue
-            # backref
-            ref[:] = [j for j in ref if j < larray]
-        # e.g.,
-        # self.uniq_idxs = [
-        #     [0],
-        #     [0, 1, 2],
-        #     [0, 1]
-        # ]
-        # self.ref_idxs = [
-        #     [0],
-        #     [0, 1, 2],
-        #     [0, 1, 2],
-        #     [0, 1],
-        #     [0, 1],
-        #     [0, 1, 2],
-        #     [0, 1, 2],
-        #     [0, 1]
-        # ]
+        # the number of the indices of each group
+        counts = [ ]
+        for members, idx in self._zipped:
+            n = min([lens[i] for i in members])
+            counts.append(n if idx is None else int(idx < n))
+        counts = tuple(counts)
+        # e.g., (1, 3, 2)
 
-        # expand self.uniq_idxs with all combinations
-        prod = tuple(itertools.product(*self.uniq_idxs))
-        for i in range(len(self.uniq_idxs)):
-            self.uniq_idxs[i][:] = [p[i] for p in prod]
-        # e.g.,
-        # self.uniq_idxs = [
-        #     [0, 0, 0, 0, 0, 0],
-        #     [0, 0, 1, 1, 2, 2],
-        #     [0, 1, 0, 1, 0, 1]
-        # ]
-        # self.ref_idxs = [
-        #     [0, 0, 0, 0, 0, 0],
-        #     [0, 0, 1, 1, 2, 2],
-        #     [0, 0, 1, 1, 2, 2],
-        #     [0, 1, 0, 1, 0, 1],
-        #     [0, 1, 0, 1, 0, 1],
-        #     [0, 0, 1, 1, 2, 2],
-        #     [0, 0, 1, 1, 2, 2],
-        #     [0, 1, 0, 1, 0, 1]
-        # ]
+        try:
+            nrows, getters = self._plans[counts]
+        except KeyError:
+            nrows, getters = self._compile_plan(counts)
 
-        ret = [[a[j] for j in i] for a, i in self._zipped_2]
-        # e.g.,
-        # ret = [
-        #     [1001, 1001, 1001, 1001, 1001, 1001],
-        #     [12, 12, 13, 13, 14, 14],
-        #     [104, 104, 105, 105, 106, 106],
-        #     [51, 52, 51, 52, 51, 52],
-        #     [84, 85, 84, 85, 84, 85],
-        #     [403, 403, 404, 404, 405, 405],
-        #     [207, 207, 208, 208, 209, 209],
-        #     [91, 92, 91, 92, 91, 92]
-        # ]
+        if not getters:
+            return (( ), )*nrows
 
-        # take transpose
-        ret = tuple(map(tuple, zip(*ret)))
+        ret = tuple(zip(*[g(a) for g, a in zip(getters, self.arrays)]))
         # e.g.,
         # ret = (
         #     (1001, 12, 104, 51, 84, 403, 207, 91),
@@ -241,4 +173,101 @@ class BackrefMultipleArrayReader(object):
         # )
         return ret
 
+    def _compile_plan(self, counts):
+        # returns the number of the rows and a getter of the values in
+        # the rows for each array
+
+        ranges = [range(c) if i is None else [i]*c for c, i in zip(counts, self._group_idxs)]
+        prod = tuple(itertools.product(*ranges))
+        # e.g., for counts = (1, 3, 2)
+        # prod = ((0, 0, 0), (0, 0, 1), (0, 1, 0), (0, 1, 1), (0, 2, 0), (0, 2, 1))
+
+        getters = [_getter([p[g] for p in prod]) for g in self._groups]
+        ret = len(prod), getters
+
+        if len(self._plans) >= 1024:
+            self._plans.clear()
+        self._plans[counts] = ret
+
+        return ret
+
+    def read_batch(self, nevents=None):
+        """read a batch of events at once
+
+        Each of the arrays is a column for the batch, either a 1D array
+        with one element per event or a tuple ``(contents, offsets)``
+        of a jagged array, in which the elements of the i-th event are
+        ``contents[offsets[i]:offsets[i+1]]``.
+
+        Args:
+            nevents (int, optional): the number of the events in the
+                batch. Needs to be given if there are no arrays.
+
+        Returns:
+            A tuple ``(entries, values)``. ``entries`` is an array of
+            the event index of each row. ``values`` is a list of
+            arrays, one for each of the arrays, with the values in the
+            rows. The rows are in the same order as concatenating the
+            returns of ``read()`` for each event.
+
+        """
+
+        columns = [_to_contents_offsets(a) for a in self.arrays]
+
+        if nevents is None:
+            nevents = len(columns[0][1]) - 1
+
+        lens = [np.diff(o) for _, o in columns]
+
+        # the number of the indices for each group in each event
+        counts = [ ]
+        for members, idx in self._zipped:
+            c = lens[members[0]]
+            for i in members[1:]:
+                c = np.minimum(c, lens[i])
+            counts.append(c if idx is None else (idx < c).astype(np.int64))
+        # e.g., for 2 events,
+        # self._groups = [0, 1, 1, 2, 2, 1, 1, 2]
+        # counts = [array([1, 1]), array([3, 0]), array([2, 1])]
+
+        # expand with all combinations
+        nrows = np.ones(nevents, dtype=np.int64)
+        for c in counts:
+            nrows *= c
+        entries = np.repeat(np.arange(nevents), nrows)
+        starts = np.cumsum(nrows) - nrows
+        local = np.arange(len(entries)) - starts[entries]
+
+        # the index of each group in each row. the last group varies
+        # the fastest as in itertools.product()
+        idxs = [None]*len(counts)
+        stride = np.ones(len(entries), dtype=np.int64)
+        for g in reversed(range(len(counts))):
+            if self._group_idxs[g] is not None:
+                idxs[g] = self._group_idxs[g]
+                continue
+            c = counts[g][entries]
+            idxs[g] = (local//stride) % np.maximum(c, 1)
+            stride *= c
+
+        values = [contents[offsets[entries] + idxs[g]] for (contents, offsets), g in zip(columns, self._groups)]
+        return entries, values
+
+##__________________________________________________________________||
+def _getter(idxs):
+    # returns a function that returns a tuple of the elements at idxs
+    if not idxs:
+        return lambda a: ( )
+    if len(idxs) == 1:
+        i = idxs[0]
+        return lambda a: (a[i], )
+    return operator.itemgetter(*idxs)
+
+def _to_contents_offsets(array):
+    if isinstance(array, tuple):
+        contents, offsets = array
+        return np.asarray(contents), np.asarray(offsets)
+    array = np.asarray(array)
+    return array, np.arange(len(array) + 1)
+
 ##__________________________________________________________________||
@@ -3,6 +3,8 @@
 import numpy as np
 import copy
 
+from .reduce_contents import reduce_contents
+
 ##__________________________________________________________________||
 class Count(object):
     """
@@ -22,15 +24,50 @@ class Count(object):
             return
 
         if val is None:
-            self.contents = [np.array((0, 0))]
+            self.contents = [np.zeros(2, dtype=np.float64)]
             return
 
-        self.contents = [np.array((weight, weight**2))]
+        self.contents = [np.array((weight, weight**2), dtype=np.float64)]
+
+    @classmethod
+    def batch_contents(cls, vals, weights):
+        """return the contents for each row of a batch
+
+        Args:
+            vals : a tuple of arrays of the values, ignored
+            weights : an array of the weights
+
+        Returns:
+            an array with a row for each weight. The contents of
+            multiple rows can be summed.
+
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        return np.column_stack((weights, weights**2))
+
+    def accumulate(self, val=None, weight=1):
+        """count in place, equivalent to ``self += Count(val, weight)``"""
+        if val is None:
+            return
+        contents = self.contents[0]
+        if contents.dtype != np.float64:
+            contents = self.contents[0] = contents.astype(np.float64)
+        contents[0] += weight
+        contents[1] += weight**2
 
     def __add__(self, other):
         contents = [self.contents[0] + other.contents[0]]
         return self.__class__(contents=contents)
 
+    def __iadd__(self, other):
+        contents = self.contents[0]
+        other_contents = other.contents[0]
+        if contents.dtype == np.float64 and contents.shape == other_contents.shape:
+            contents += other_contents
+        else:
+            self.contents = [contents + other_contents]
+        return self
+
     def __radd__(self, other):
         # is called with other=0 when e.g. sum([obj1, obj2])
         if other == 0:
@@ -50,5 +87,7 @@ class Count(object):
         contents = [np.copy(self.contents[0])]
         return self.__class__(contents=contents)
 
-##__________________________________________________________________||
+    def __reduce__(self):
+        return reduce_contents(self)
 
+##__________________________________________________________________||
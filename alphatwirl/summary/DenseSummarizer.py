@@ -0,0 +1,184 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+
+import collections
+import copy
+
+import numpy as np
+
+from .Count import Count
+from .Sum import Sum
+from ..binning import MultiBinning
+from .convert import key_vals_dict_to_tuple_list
+from .convert import key_vals_dict_to_tuple_iter
+
+##__________________________________________________________________||
+class DenseSummarizer(object):
+    """A summarizer backed by one contiguous array
+
+    This class has the same interface as ``Summarizer``. It can be used
+    when all binnings of the keys are bounded, i.e., have the method
+    ``all_bins()``, and ``Summary`` is ``Count`` or ``Sum``.
+
+    The contents of all bins are stored in one array indexed by the
+    flat indices of the keys in ``multiBinning``, a ``MultiBinning``
+    of the binnings. The array is allocated when the first key is
+    added.
+
+    The flat indices can be also given directly to ``add_index()`` and
+    ``add_index_batch()``, e.g., by ``Reader``, without the keys.
+
+    Args:
+        Summary: ``Count`` or ``Sum``
+        binnings: binnings of the keys
+
+    """
+    def __init__(self, Summary, binnings):
+
+        if not issubclass(Summary, (Count, Sum)):
+            raise ValueError('Summary needs to be Count or Sum: Summary={!r}'.format(Summary))
+
+        self.Summary = Summary
+        self.binnings = tuple(binnings)
+
+        self.multiBinning = MultiBinning(self.binnings)
+        self._size = self.multiBinning.size
+
+        self._contents = None # (size, ncontents), allocated with the first fill
+        self._keys = np.zeros(self._size, dtype=bool) # added keys
+        self._filled = np.zeros(self._size, dtype=bool) # keys added with val
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('Summary',  self.Summary),
+            ('binnings', self.binnings),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def _allocate(self, ncontents):
+        self._contents = np.zeros((self._size, ncontents), dtype=np.float64)
+
+    def add(self, key, val=None, weight=1):
+        self.add_index(self.multiBinning.index(key), val, weight)
+
+    def add_index(self, i, val=None, weight=1):
+        """add with the flat index of the key instead of the key"""
+        self._keys[i] = True
+
+        if val is None:
+            # the summary of val=None is zero
+            return
+
+        if issubclass(self.Summary, Count):
+            if self._contents is None:
+                self._allocate(2)
+            row = self._contents[i]
+            row[0] += weight
+            row[1] += weight**2
+        else:
+            if self._contents is None:
+                self._allocate(len(val))
+            row = self._contents[i]
+            for j, v in enumerate(val):
+                row[j] += v*weight
+
+        self._filled[i] = True
+
+    def add_batch(self, keys, vals, weights):
+        """add rows in columns at once
+
+        Args:
+            keys : a tuple of arrays, one for each element of the key
+            vals : a tuple of arrays, one for each element of the value
+            weights : an array of the weights
+
+        """
+
+        if len(weights) == 0:
+            return
+        self.add_index_batch(self.multiBinning.index_array(keys), vals, weights)
+
+    def add_index_batch(self, index, vals, weights):
+        """add rows in columns with the flat indices of the keys"""
+
+        if len(weights) == 0:
+            return
+
+        row_contents = self.Summary.batch_contents(vals, weights)
+        if self._contents is None:
+            self._allocate(row_contents.shape[1])
+        np.add.at(self._contents, index, row_contents)
+
+        self._keys[index] = True
+        self._filled[index] = True
+
+    def add_key(self, key):
+        self._keys[self.multiBinning.index(key)] = True
+
+    def add_keys(self, keys):
+        keys = list(keys)
+        if not keys:
+            return
+        self._keys[self.multiBinning.index_array(tuple(zip(*keys)))] = True
+
+    def keys(self):
+        return [self.multiBinning.key(i) for i in np.flatnonzero(self._keys)]
+
+    def clear(self):
+        """remove all keys"""
+        self._contents = None
+        self._keys[:] = False
+        self._filled[:] = False
+
+    def __copy__(self):
+        ret = self.__class__(self.Summary, self.binnings)
+        ret._add_inplace(self)
+        return ret
+
+    def __add__(self, other):
+        ret = copy.copy(self)
+        if not other == 0: # other is 0 when e.g. sum([obj1, obj2])
+            ret._add_inplace(other)
+        return ret
+
+    def __iadd__(self, other):
+        self._add_inplace(other)
+        return self
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def _add_inplace(self, other):
+        if other._contents is not None:
+            if self._contents is None:
+                self._contents = np.copy(other._contents)
+            else:
+                self._contents += other._contents
+        self._keys |= other._keys
+        self._filled |= other._filled
+
+    def _summary(self, index):
+        if not self._filled[index]:
+            return self.Summary()
+        return self.Summary(contents=[np.copy(self._contents[index])])
+
+    def results(self):
+        return {self.multiBinning.key(i): self._summary(i) for i in np.flatnonzero(self._keys)}
+
+    def to_key_vals_dict(self):
+        items = [(self.multiBinning.key(i), self._summary(i).contents) for i in np.flatnonzero(self._keys)]
+        ret = collections.OrderedDict(sorted(items, key=lambda e: e[0]))
+        return ret
+
+    def to_tuple_list(self):
+        key_vals_dict = self.to_key_vals_dict()
+        ret = key_vals_dict_to_tuple_list(key_vals_dict, fill=0)
+        return ret
+
+    def to_tuple_iter(self):
+        """return an iterator of the tuples in ``to_tuple_list()``"""
+        return key_vals_dict_to_tuple_iter(self.to_key_vals_dict(), fill=0)
+
+##__________________________________________________________________||
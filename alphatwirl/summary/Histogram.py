@@ -0,0 +1,139 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import bisect
+
+import numpy as np
+
+##__________________________________________________________________||
+class Histogram(object):
+    """A histogram of a value in fixed bins
+
+    This class can be used in the place of ``Count`` with the value
+    binned in the key. The histogram of each key is in one summary
+    rather than in one summary for each bin of the value.
+
+    The bins are defined by the class attribute ``boundaries``, which
+    needs to be set in a subclass, e.g.,
+
+    .. code-block:: python
+
+        class HistPt(Histogram):
+            boundaries = (0, 10, 20, 50, 100)
+
+    The bins include the underflow bin, below the first boundary, and
+    the overflow bin, at or above the last boundary. NaN is not
+    counted.
+
+    The contents are one array with the sum of the weights and the sum
+    of the squares of the weights for each bin, i.e., ``[np.array([n0,
+    nvar0, n1, nvar1, ...])]``. The summarizers expand the contents
+    with ``expand_contents()`` into one row ``(low, n, nvar)`` for
+    each bin in ``to_tuple_list()``, where ``low`` is the lower
+    boundary of the bin, ``-inf`` for the underflow bin.
+
+    Args:
+        val : a tuple with one value. If None, initialize with no
+              values.
+        weight (float) : The weight
+        contents : Specified contents unless None
+    """
+
+    boundaries = None
+
+    def __init__(self, val=None, weight=1, contents=None):
+
+        if contents is not None:
+            self.contents = contents
+            return
+
+        self.contents = [np.zeros(2*self._nbins(), dtype=np.float64)]
+        self.accumulate(val, weight)
+
+    @classmethod
+    def _nbins(cls):
+        if cls.boundaries is None:
+            raise ValueError('boundaries need to be set in a subclass: {}'.format(cls.__name__))
+        return len(cls.boundaries) + 1
+
+    @classmethod
+    def out_column_names(cls, valAttrNames):
+        """return the column names of the expanded contents
+
+        e.g., ``('x', 'n', 'nvar')`` for ``('x', )``
+        """
+        return tuple(valAttrNames) + ('n', 'nvar')
+
+    @classmethod
+    def expand_contents(cls, contents):
+        """return the contents with one row ``(low, n, nvar)`` for each bin"""
+        lows = (float('-inf'), ) + tuple(cls.boundaries)
+        return [np.array((l, n, nvar)) for l, (n, nvar) in zip(lows, contents[0].reshape(-1, 2))]
+
+    @classmethod
+    def batch_contents(cls, vals, weights):
+        """return the contents for each row of a batch
+
+        Args:
+            vals : a tuple with one array of the values
+            weights : an array of the weights
+
+        Returns:
+            an array with a row for each weight. The contents of
+            multiple rows can be summed.
+
+        """
+        nbins = cls._nbins()
+        weights = np.asarray(weights, dtype=np.float64)
+        vals = np.asarray(vals[0], dtype=np.float64)
+        ret = np.zeros((len(weights), 2*nbins), dtype=np.float64)
+        rows = np.flatnonzero(~np.isnan(vals))
+        bins = np.searchsorted(np.asarray(cls.boundaries, dtype=np.float64), vals[rows], side='right')
+        ret[rows, 2*bins] = weights[rows]
+        ret[rows, 2*bins + 1] = weights[rows]**2
+        return ret
+
+    def accumulate(self, val=None, weight=1):
+        """fill in place, equivalent to ``self += Histogram(val, weight)``"""
+        if val is None:
+            return
+        v = val[0]
+        if v != v: # NaN
+            return
+        contents = self.contents[0]
+        if contents.dtype != np.float64:
+            contents = self.contents[0] = contents.astype(np.float64)
+        i = 2*bisect.bisect_right(self.boundaries, v)
+        contents[i] += weight
+        contents[i + 1] += weight**2
+
+    def __add__(self, other):
+        contents = [self.contents[0] + other.contents[0]]
+        return self.__class__(contents=contents)
+
+    def __iadd__(self, other):
+        contents = self.contents[0]
+        other_contents = other.contents[0]
+        if contents.dtype == np.float64:
+            contents += other_contents
+        else:
+            self.contents = [contents + other_contents]
+        return self
+
+    def __radd__(self, other):
+        # is called with other=0 when e.g. sum([obj1, obj2])
+        if other == 0:
+            return self.__class__() + self
+        raise TypeError('unsupported: {!r} + {!r}'.format(other, self))
+
+    def __repr__(self):
+        return '{}(contents={!r})'.format(self.__class__.__name__, self.contents)
+
+    def __eq__(self, other):
+        if len(self.contents) != len(other.contents):
+            return False
+        return all(np.array_equal(c1, c2) for c1, c2 in zip(self.contents, other.contents))
+
+    def __copy__(self):
+        contents = [np.copy(self.contents[0])]
+        return self.__class__(contents=contents)
+
+##__________________________________________________________________||
@@ -0,0 +1,103 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+
+##__________________________________________________________________||
+class KeyColumnCache(object):
+    """A cache of binned key columns shared by key value composers
+
+    An instance of this class can be given to ``KeyValueComposer`` of
+    many tables. The key columns of the same attribute, index, and
+    binning are binned only once for each event and used by all the
+    tables. The binnings are identified by the objects, i.e., the
+    same binning object needs to be used in the tables.
+
+    Each column is a list of the bins of the elements of the
+    attribute. If the index is an integer, only the element at the
+    index is binned; the elements before it are ``None``.
+
+    The event is identified by its attribute ``iEvent``. The columns
+    are binned every time for events without ``iEvent``.
+
+    """
+
+    def __init__(self):
+        self._columns = { } # (attr_name, idx, binning) -> _Column
+        self.nhits = 0
+        self.nmisses = 0
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('ncolumns', len(self._columns)),
+            ('nhits', self.nhits),
+            ('nmisses', self.nmisses),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def column(self, array, attr_name, idx, binning):
+        """register a column and return the list that holds the bins
+
+        This method is to be called in ``begin()`` of the composer.
+        The returned list is updated in place by ``update()``.
+
+        Args:
+            array : the array of the attribute of the event
+            attr_name (str) : the name of the attribute
+            idx : an integer index or ``'*'`` for all elements
+            binning : the binning
+
+        Returns:
+            the column, a list, which can be used in the place of the
+            array after ``update()`` is called for each event.
+
+        """
+        key = (attr_name, idx, binning)
+        ret = self._columns.get(key)
+        if ret is None:
+            ret = self._columns[key] = _Column(idx, binning)
+        ret.array = array
+        ret.event = None
+        return ret.bins
+
+    def update(self, event, keys):
+        """bin the columns for the event unless already binned
+
+        Args:
+            event : the event
+            keys : a list of tuples ``(attr_name, idx, binning)`` of
+                   the registered columns
+
+        """
+        token = getattr(event, 'iEvent', None)
+        for key in keys:
+            column = self._columns[key]
+            if token is not None and column.event == token:
+                self.nhits += 1
+                continue
+            column.fill()
+            column.event = token
+            self.nmisses += 1
+
+##__________________________________________________________________||
+class _Column(object):
+    def __init__(self, idx, binning):
+        self.idx = idx
+        self.binning = binning
+        self.array = None
+        self.event = None
+        self.bins = [ ]
+
+    def fill(self):
+        binning = self.binning
+        array = self.array
+        if self.idx == '*':
+            self.bins[:] = [binning(v) for v in array]
+            return
+        idx = self.idx
+        if idx < len(array):
+            self.bins[:] = [None]*idx + [binning(array[idx])]
+            return
+        del self.bins[:]
+
+##__________________________________________________________________||
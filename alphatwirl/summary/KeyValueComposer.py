@@ -1,6 +1,8 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import logging
 
+import numpy as np
+
 from .parse_indices_config import parse_indices_config
 from .BackrefMultipleArrayReader import BackrefMultipleArrayReader
 
@@ -16,10 +18,13 @@ class KeyValueComposer(object):
 
     This class supports back references.
 
+    If ``keyColumnCache``, an instance of ``KeyColumnCache``, is
+    given, the keys are binned in the cache, which can be shared by
+    the composers of many tables.
 
     """
     def __init__(self, keyAttrNames=None, binnings=None, keyIndices=None,
-                 valAttrNames=None, valIndices=None):
+                 valAttrNames=None, valIndices=None, keyColumnCache=None):
 
         # for __repr__()
         name_value_pairs = (
@@ -28,6 +33,7 @@ class KeyValueComposer(object):
             ('keyIndices', keyIndices),
             ('valAttrNames', valAttrNames),
             ('valIndices', valIndices),
+            ('keyColumnCache', keyColumnCache),
         )
         self._repr = '{}({})'.format(
             self.__class__.__name__,
@@ -68,6 +74,24 @@ class KeyValueComposer(object):
 
         self.ArrayReader = BackrefMultipleArrayReader
 
+        self.keyColumnCache = keyColumnCache
+        self._cache_keys = None
+        if self.keyColumnCache is not None and self.binnings:
+            self._cache_keys = self._create_cache_keys()
+
+    def _create_cache_keys(self):
+        # (attr_name, idx, binning) for each key. the index is '*' if
+        # the key refers to or is referred to by a back reference as
+        # all elements can be read.
+        referred = set(i for i in self.backref_idxs if i is not None)
+        ret = [ ]
+        for i, binning in enumerate(self.binnings):
+            idx = self.idxs_conf[i]
+            if not isinstance(idx, int) or i in referred or self.backref_idxs[i] is not None:
+                idx = '*'
+            ret.append((self.attr_names[i], idx, binning))
+        return ret
+
     def __repr__(self):
         return self._repr
 
@@ -75,6 +99,12 @@ class KeyValueComposer(object):
         arrays = self._collect_arrays(event, self.attr_names)
         self.active = True if arrays is not None else False
         if not self.active: return
+        if self._cache_keys is not None:
+            # the arrays of the keys are replaced with the columns of
+            # the bins in the cache
+            arrays[:self._lenkey] = [
+                self.keyColumnCache.column(a, *k)
+                for a, k in zip(arrays, self._cache_keys)]
         self._array_reader = self.ArrayReader(arrays, self.idxs_conf, self.backref_idxs)
 
     def _collect_arrays(self, event, attr_names):
@@ -89,9 +119,13 @@ class KeyValueComposer(object):
             ret.append(attr)
         return ret
 
-    def __call__(self, event):
+    def _read(self, event):
+        # returns the pairs of the keys and values before binning
         if not self.active: return ()
 
+        if self._cache_keys is not None:
+            self.keyColumnCache.update(event, self._cache_keys)
+
         try:
             arrays = self._array_reader.read()
         except Exception as e:
@@ -115,6 +149,10 @@ class KeyValueComposer(object):
 
         # separate into keys and vals
         keyvals = tuple((e[:self._lenkey], e[self._lenkey:]) for e in arrays)
+        return keyvals
+
+    def __call__(self, event):
+        keyvals = self._read(event)
         # e.g.,
         # keyvals = (
         #     ((1001, 15.3, -1.2, 20.2,  2.2, 0.1), (16.2, 22.1)),
@@ -130,7 +168,7 @@ class KeyValueComposer(object):
 
 
         # apply binnings
-        if self.binnings:
+        if self.binnings and self._cache_keys is None:
             keyvals = tuple((tuple(b(k) for b, k in zip(self.binnings, kk)), vv) for kk, vv in keyvals)
         # e.g.,
         # keyvals = (
@@ -157,4 +195,109 @@ class KeyValueComposer(object):
 
         return keyvals
 
+    def call_index(self, event, multiBinning):
+        """compose flat indices of keys and values for the event
+
+        The returns are the same as those of ``__call__()`` except that
+        the key of each pair is the flat index of the bins in
+        ``multiBinning``, a ``MultiBinning`` of the binnings, instead of
+        a tuple of the bins. The tuples of the bins are not created.
+
+        """
+        keyvals = self._read(event)
+        if self._cache_keys is None:
+            keyvals = ((multiBinning(kk), vv) for kk, vv in keyvals)
+        else:
+            # already binned in the cache
+            keyvals = ((None if None in kk else multiBinning.index(kk), vv) for kk, vv in keyvals)
+        return tuple(e for e in keyvals if e[0] is not None and None not in e[1])
+
+    def call_batch(self, batch):
+        """compose keys and values for a batch of events
+
+        The batch is an object with the same attributes as the event.
+        Each attribute is a column for all events in the batch, either
+        a 1D array with one element per event or a tuple ``(contents,
+        offsets)`` of a jagged array. ``len(batch)`` is the number of
+        the events.
+
+        The returns are the same as those of ``__call__()`` for each
+        event, concatenated in columns, except that the rows with
+        ``None`` are not removed but flagged in ``valid``.
+
+        Returns:
+            A tuple ``(entries, keys, vals, valid)``. ``entries`` is an
+            array of the event index of each row. ``keys`` and ``vals``
+            are tuples of arrays, one for each key and value. ``valid``
+            is a boolean array, which is ``False`` for the rows whose
+            key or value is ``None``.
+
+        """
+
+        entries, keys, vals, valid = self._read_batch(batch)
+
+        if self.binnings:
+            binned = [_apply_binning(b, k) for b, k in zip(self.binnings, keys)]
+            keys = tuple(k for k, _ in binned)
+            for _, v in binned:
+                valid &= v
+
+        return entries, keys, vals, valid
+
+    def call_index_batch(self, batch, multiBinning):
+        """compose flat indices of keys and values for a batch of events
+
+        The returns are the same as those of ``call_batch()`` except
+        that ``keys`` is replaced with one int64 array of the flat
+        indices of the bins in ``multiBinning``, a ``MultiBinning`` of
+        the binnings. The indices are 0 where ``valid`` is ``False``.
+
+        """
+        entries, keys, vals, valid = self._read_batch(batch)
+        if not keys:
+            return entries, np.zeros(len(entries), dtype=np.int64), vals, valid
+        indices, valid_keys = multiBinning.call_batch(keys)
+        return entries, indices, vals, valid & valid_keys
+
+    def _read_batch(self, batch):
+        # returns (entries, keys, vals, valid) before binning
+
+        nevents = len(batch)
+
+        arrays = self._collect_arrays(batch, self.attr_names)
+        if arrays is None:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, (empty, )*self._lenkey, (empty, )*(len(self.attr_names) - self._lenkey), np.zeros(0, dtype=bool)
+
+        try:
+            array_reader = self.ArrayReader(arrays, self.idxs_conf, self.backref_idxs)
+            entries, columns = array_reader.read_batch(nevents=nevents)
+        except Exception as e:
+            logger = logging.getLogger(__name__)
+            logger.error(e)
+            logger.error(self)
+            raise
+
+        keys = tuple(columns[:self._lenkey])
+        vals = tuple(columns[self._lenkey:])
+        valid = np.ones(len(entries), dtype=bool)
+        return entries, keys, vals, valid
+
+##__________________________________________________________________||
+def _apply_binning(binning, values):
+    # call the binning once for each unique value so that the bins
+    # are the same as those in the per-event path
+
+    uniq, inverse = np.unique(values, return_inverse=True)
+    if callable(getattr(type(binning), 'bin_array', None)):
+        # e.g., Binning
+        ret = binning.bin_array(uniq)
+    else:
+        ret = np.empty(len(uniq), dtype=object)
+        ret[:] = [binning(v) for v in uniq.tolist()]
+    valid = np.array([b is not None for b in ret], dtype=bool)
+
+    inverse = inverse.reshape(-1)
+    return ret[inverse], valid[inverse]
+
 ##__________________________________________________________________||
@@ -0,0 +1,148 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+
+import numpy as np
+import copy
+
+##__________________________________________________________________||
+class Moments(object):
+    """The weighted mean and variance of values
+
+    This class can be used in the place of ``Scan`` to find the
+    weighted means and variances of values without keeping the values.
+    The size of the contents does not depend on the number of values.
+
+    The contents are one array with the sum of the weights, the sum of
+    the squares of the weights, and the mean and variance for each
+    element of ``val``, e.g., ``[np.array([n, nvar, mean1, var1,
+    mean2, var2])]``. The variance is the weighted population variance,
+    i.e., the weighted sum of the squared deviations divided by the
+    sum of the weights.
+
+    The values are added with the weighted Welford's algorithm and the
+    contents are added with Chan's parallel algorithm.
+
+    Args:
+        val : If None, initialize with no values. Otherwise, a tuple of
+              values
+        weight (float) : The weight
+        contents : Specified contents unless None
+    """
+
+    def __init__(self, val=None, weight=1, contents=None):
+
+        if contents is not None:
+            self.contents = contents
+            return
+
+        self.contents = [np.zeros(2, dtype=np.float64)] # will be
+                                                        # extended with
+                                                        # the first val
+        self.accumulate(val, weight)
+
+    @classmethod
+    def out_column_names(cls, valAttrNames):
+        """return the column names of the contents
+
+        e.g., ``('n', 'nvar', 'x_mean', 'x_var')`` for ``('x', )``
+        """
+        ret = ('n', 'nvar')
+        for n in valAttrNames:
+            ret += ('{}_mean'.format(n), '{}_var'.format(n))
+        return ret
+
+    def accumulate(self, val=None, weight=1):
+        """add in place, equivalent to ``self += Moments(val, weight)``"""
+        if val is None:
+            return
+        contents = self.contents[0]
+        if contents.dtype != np.float64 or len(contents) != 2 + 2*len(val):
+            contents = self.contents[0] = _extend(contents, len(val))
+        n = contents[0] + weight
+        contents[1] += weight**2
+        mean = contents[2::2]
+        var = contents[3::2]
+        if n == 0:
+            contents[0] = 0
+            mean[:] = 0
+            var[:] = 0
+            return
+        x = np.asarray(val, dtype=np.float64)
+        delta = x - mean
+        m2 = var*contents[0]
+        mean += delta*(weight/n)
+        m2 += weight*delta*(x - mean)
+        var[:] = m2/n
+        contents[0] = n
+
+    def __add__(self, other):
+        contents = [_combine(self.contents[0], other.contents[0])]
+        return self.__class__(contents=contents)
+
+    def __iadd__(self, other):
+        contents = self.contents[0]
+        combined = _combine(contents, other.contents[0])
+        if contents.dtype == np.float64 and contents.shape == combined.shape:
+            contents[:] = combined
+        else:
+            self.contents = [combined]
+        return self
+
+    def __radd__(self, other):
+        # is called with other=0 when e.g. sum([obj1, obj2])
+        if other == 0:
+            return self.__class__() + self
+        raise TypeError('unsupported: {!r} + {!r}'.format(other, self))
+
+    def __repr__(self):
+        return '{}(contents={!r})'.format(self.__class__.__name__, self.contents)
+
+    def __eq__(self, other):
+        if len(self.contents) != len(other.contents):
+            return False
+        cmps = [np.array_equal(self.contents[i], other.contents[i]) for i in range(len(self.contents))]
+        return all(cmps)
+
+    def __copy__(self):
+        contents = [np.copy(self.contents[0])]
+        return self.__class__(contents=contents)
+
+##__________________________________________________________________||
+def _extend(contents, nvals):
+    # returns the contents for nvals values, e.g., the first time
+    if len(contents) == 2:
+        return np.concatenate((contents, np.zeros(2*nvals))).astype(np.float64)
+    if len(contents) != 2 + 2*nvals:
+        raise ValueError('the number of values changed: {} to {}'.format((len(contents) - 2)//2, nvals))
+    return contents.astype(np.float64)
+
+def _combine(contents1, contents2):
+    # returns the contents for the union of the values
+
+    if len(contents1) == 2 and len(contents2) != 2:
+        contents1 = _extend(contents1, (len(contents2) - 2)//2)
+    elif len(contents2) == 2 and len(contents1) != 2:
+        contents2 = _extend(contents2, (len(contents1) - 2)//2)
+    elif len(contents1) != len(contents2):
+        raise ValueError('the numbers of values differ: {!r} and {!r}'.format(contents1, contents2))
+
+    n1 = contents1[0]
+    n2 = contents2[0]
+    n = n1 + n2
+
+    ret = np.empty(len(contents1), dtype=np.float64)
+    ret[0] = n
+    ret[1] = contents1[1] + contents2[1]
+
+    if n == 0:
+        ret[2:] = 0
+        return ret
+
+    mean1 = contents1[2::2]
+    mean2 = contents2[2::2]
+    delta = mean2 - mean1
+    m2 = contents1[3::2]*n1 + contents2[3::2]*n2 + delta**2*(n1*n2/n)
+    ret[2::2] = mean1 + delta*(n2/n)
+    ret[3::2] = m2/n
+    return ret
+
+##__________________________________________________________________||
@@ -1,10 +1,14 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import numpy as np
 
 ##__________________________________________________________________||
 class NextKeyComposer(object):
     def __init__(self, binnings):
         self._binnings = binnings
 
+        # the next bin of each bin, filled as needed
+        self._successors = [{ } for _ in binnings]
+
     def __repr__(self):
         return '{}(binnings = {!r})'.format(
             self.__class__.__name__,
@@ -34,4 +38,63 @@ class NextKeyComposer(object):
             ret.append(tuple(keyc))
         return tuple(ret)
 
+    def next_keys(self, keys):
+        """returns the next keys of all keys at once
+
+        The returned keys are the same as the union of the returns of
+        ``__call__()`` for each key but without duplicates and in no
+        particular order.
+
+        The next bin is found only once for each distinct bin in each
+        dimension. The keys are processed in columns with NumPy.
+
+        Args:
+            keys : a list of keys
+
+        Returns:
+            a set of the next keys
+
+        """
+
+        from .Summarizer import _to_column # not at the top to avoid a circular import
+
+        keys = list(keys)
+        ndims = len(self._binnings)
+        if not keys or ndims == 0:
+            return set()
+
+        if not all(isinstance(k, tuple) and len(k) == ndims for k in keys):
+            return set(k for key in keys for k in self(key))
+
+        columns = [_to_column(c) for c in zip(*keys)]
+
+        ret = set()
+        for i, column in enumerate(columns):
+            try:
+                uniq, inverse = np.unique(column, return_inverse=True)
+            except TypeError:
+                # e.g., the bins cannot be sorted
+                ret.update(k for key in keys for k in self(key))
+                return ret
+            uniq = uniq.tolist()
+            nexts = [self._next(i, b) for b in uniq]
+            has_next = np.array([n is not None and n != b for n, b in zip(nexts, uniq)], dtype=bool)
+            rows = np.flatnonzero(has_next[inverse.reshape(-1)])
+            if len(rows) == 0:
+                continue
+            next_column = np.empty(len(nexts), dtype=object)
+            next_column[:] = nexts
+            next_columns = [c[rows].tolist() for c in columns]
+            next_columns[i] = next_column[inverse.reshape(-1)[rows]].tolist()
+            ret.update(zip(*next_columns))
+        return ret
+
+    def _next(self, i, bin):
+        successors = self._successors[i]
+        try:
+            return successors[bin]
+        except KeyError:
+            ret = successors[bin] = self._binnings[i].next(bin)
+            return ret
+
 ##__________________________________________________________________||
@@ -0,0 +1,107 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+
+import collections
+
+import numpy as np
+
+from .Summarizer import Summarizer
+from ..binning import MultiBinning
+
+##__________________________________________________________________||
+class PackedSummarizer(Summarizer):
+    """A summarizer with the keys packed into integers
+
+    This class has the same interface as ``Summarizer``. The keys are
+    stored as their flat indices in ``multiBinning``, a
+    ``MultiBinning`` of the binnings, which are smaller to store,
+    merge, and pickle than tuples. They are converted back into tuples
+    when the results are returned. All binnings need to be bounded,
+    i.e., have the method ``all_bins()``.
+
+    The flat indices can be also given directly to ``add_index()`` and
+    ``add_index_batch()``, e.g., by ``Reader``, without the keys.
+
+    Args:
+        Summary: a summary class, e.g., ``Count``
+        binnings: binnings of the keys
+
+    """
+    def __init__(self, Summary, binnings):
+        super(PackedSummarizer, self).__init__(Summary)
+        self.binnings = tuple(binnings)
+        self.multiBinning = MultiBinning(self.binnings)
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('Summary',  self.Summary),
+            ('binnings', self.binnings),
+            ('results', self._results),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def add(self, key, val=None, weight=1):
+        super(PackedSummarizer, self).add(self.multiBinning.index(key), val, weight)
+
+    def add_index(self, index, val=None, weight=1):
+        """add with the flat index of the key instead of the key"""
+        super(PackedSummarizer, self).add(index, val, weight)
+
+    def add_index_batch(self, indices, vals, weights):
+        """add rows in columns with the flat indices of the keys"""
+        if not hasattr(self.Summary, 'batch_contents'):
+            for index, val, weight in zip(indices.tolist(), zip(*vals), weights):
+                self.add_index(index, val, weight)
+            return
+        if len(weights) == 0:
+            return
+        group_keys, groups = np.unique(indices, return_inverse=True)
+        self._add_groups(group_keys.tolist(), groups.reshape(-1), vals, weights)
+
+    def add_key(self, key):
+        self._results[self.multiBinning.index(key)]
+
+    def add_keys(self, keys):
+        keys = list(keys)
+        if not keys:
+            return
+        codes = self.multiBinning.index_array(tuple(zip(*keys)))
+        missing = set(codes.tolist()).difference(self._results)
+        self._results.update((c, self.Summary()) for c in missing)
+
+    def _group_keys(self, keys, nrows):
+        codes = self.multiBinning.index_array(keys)
+        group_keys, groups = np.unique(codes, return_inverse=True)
+        return group_keys.tolist(), groups.reshape(-1)
+
+    def keys(self):
+        return [self.multiBinning.key(c) for c in self._results.keys()]
+
+    def _new(self):
+        return self.__class__(self.Summary, self.binnings)
+
+    def _can_merge_arrays(self, other):
+        if not super(PackedSummarizer, self)._can_merge_arrays(other):
+            return False
+        # the binnings can be copies, e.g., unpickled
+        return other.multiBinning._bins == self.multiBinning._bins
+
+    def _key_columns(self, codes):
+        return (np.array(codes, dtype=np.int64), )
+
+    def _column_keys(self, key_columns, nkeys):
+        return key_columns[0].tolist()
+
+    def results(self):
+        return {self.multiBinning.key(c): v for c, v in self._results.items()}
+
+    def to_key_vals_dict(self):
+        # unpack before sorting as the order of the packed keys is not
+        # necessarily the order of the keys
+        items = [(self.multiBinning.key(c), self._out_contents(v)) for c, v in self._results.items()]
+        ret = collections.OrderedDict(sorted(items, key=lambda e: e[0]))
+        return ret
+
+##__________________________________________________________________||
@@ -0,0 +1,214 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+
+import numpy as np
+
+##__________________________________________________________________||
+class QuantileSketch(object):
+    """A summary of the quantiles of values in a bounded-size sketch
+
+    This class can be used in the place of ``Scan`` to find, e.g.,
+    medians without keeping all values. The values are summarized in
+    a t-digest for each element of ``val``, i.e., weighted centroids
+    that are finer at the tails. The number of centroids is at most
+    about ``compression``. Sketches can be added.
+
+    The contents are one row with the ``quantiles`` of each element of
+    ``val``, e.g., ``[np.array([median1, median2])]`` with the default
+    ``quantiles``. With more than one quantile, the quantiles of the
+    first element come first. The contents are empty if no value is
+    added. The quantiles are exact while the number of values is not
+    larger than ``compression``.
+
+    The weights need to be positive. The values with non-positive
+    weights are ignored.
+
+    Args:
+        val : a tuple of values. If None, initialize with no values.
+        weight (float) : The weight
+        values : a list of tuples of values to add with the weight 1,
+            as the contents of ``Scan``, unless None. The argument is
+            not ``contents`` because the contents are the quantiles,
+            from which the sketch cannot be restored.
+
+    """
+
+    quantiles = (0.5, )
+    compression = 100
+
+    def __init__(self, val=None, weight=1, values=None):
+
+        self._means = None # a list of arrays, one for each element of val
+        self._weights = None
+        self._mins = None
+        self._maxs = None
+
+        # values not yet in the centroids
+        self._pending_vals = [ ]
+        self._pending_weights = [ ]
+
+        if values is not None:
+            for v in values:
+                self.accumulate(v)
+            return
+
+        self.accumulate(val, weight)
+
+    def accumulate(self, val=None, weight=1):
+        """add in place, equivalent to ``self += QuantileSketch(val, weight)``"""
+        if val is None:
+            return
+        if not weight > 0:
+            return
+        self._pending_vals.append(tuple(val))
+        self._pending_weights.append(weight)
+        if len(self._pending_vals) >= 5*self.compression:
+            self._flush()
+
+    def _flush(self):
+        state = self._state()
+        if state is None:
+            return
+        self._means, self._weights, self._mins, self._maxs = state
+        del self._pending_vals[:]
+        del self._pending_weights[:]
+
+    def _state(self):
+        # returns the centroids including the pending values without
+        # modifying self. None if no value is added.
+
+        if not self._pending_vals:
+            if self._means is None:
+                return None
+            return self._means, self._weights, self._mins, self._maxs
+
+        vals = np.array(self._pending_vals, dtype=np.float64).reshape(len(self._pending_vals), -1)
+        weights = np.array(self._pending_weights, dtype=np.float64)
+        state = (
+            list(vals.T), [weights]*vals.shape[1],
+            np.min(vals, axis=0, initial=np.inf), np.max(vals, axis=0, initial=-np.inf)
+        )
+        if self._means is None:
+            return self._merge_states(None, state)
+        return self._merge_states((self._means, self._weights, self._mins, self._maxs), state)
+
+    def _merge_states(self, state1, state2):
+        if state1 is None:
+            return state2
+        if state2 is None:
+            return state1
+        means1, weights1, mins1, maxs1 = state1
+        means2, weights2, mins2, maxs2 = state2
+        if len(means1) != len(means2):
+            raise ValueError('the numbers of values differ: {} and {}'.format(len(means1), len(means2)))
+        means = [ ]
+        weights = [ ]
+        for m1, w1, m2, w2 in zip(means1, weights1, means2, weights2):
+            m, w = _compress(np.concatenate((m1, m2)), np.concatenate((w1, w2)), self.compression)
+            means.append(m)
+            weights.append(w)
+        return means, weights, np.minimum(mins1, mins2), np.maximum(maxs1, maxs2)
+
+    def quantile(self, q):
+        """return the ``q``-quantile of each element of ``val``
+
+        Args:
+            q (float or array) : between 0 and 1
+
+        Returns:
+            an array with the quantiles in the last dimension, or None
+            if no value is added
+
+        """
+        state = self._state()
+        if state is None:
+            return None
+        ret = [ ]
+        for means, weights, min_, max_ in zip(*state):
+            cum = np.cumsum(weights)
+            total = cum[-1]
+            xs = np.concatenate(([0], cum - weights/2, [total]))
+            ys = np.concatenate(([min_], means, [max_]))
+            ret.append(np.interp(np.asarray(q)*total, xs, ys))
+        return np.array(ret).T
+
+    @property
+    def contents(self):
+        quantiles = self.quantile(self.quantiles)
+        if quantiles is None:
+            return [ ]
+        return [quantiles.T.reshape(-1)]
+
+    def __add__(self, other):
+        ret = copy.copy(self)
+        ret += other
+        return ret
+
+    def __iadd__(self, other):
+        state = self._merge_states(self._state(), other._state())
+        if state is not None:
+            self._means, self._weights, self._mins, self._maxs = state
+            del self._pending_vals[:]
+            del self._pending_weights[:]
+        return self
+
+    def __radd__(self, other):
+        # is called with other=0 when e.g. sum([obj1, obj2])
+        if other == 0:
+            return self.__class__() + self
+        raise TypeError('unsupported: {!r} + {!r}'.format(other, self))
+
+    def __repr__(self):
+        return '{}(contents={!r})'.format(self.__class__.__name__, self.contents)
+
+    def __eq__(self, other):
+        state1 = self._state()
+        state2 = other._state()
+        if state1 is None or state2 is None:
+            return state1 is None and state2 is None
+        return all(np.array_equal(e1, e2) for s1, s2 in zip(state1, state2) for e1, e2 in zip(s1, s2))
+
+    def __copy__(self):
+        ret = self.__class__()
+        if self._means is not None:
+            ret._means = list(self._means)
+            ret._weights = list(self._weights)
+            ret._mins = self._mins
+            ret._maxs = self._maxs
+        ret._pending_vals[:] = self._pending_vals
+        ret._pending_weights[:] = self._pending_weights
+        return ret
+
+    def __getstate__(self):
+        # pickle the centroids only
+        ret = self.__dict__.copy()
+        state = self._state()
+        if state is not None:
+            ret['_means'], ret['_weights'], ret['_mins'], ret['_maxs'] = state
+        ret['_pending_vals'] = [ ]
+        ret['_pending_weights'] = [ ]
+        return ret
+
+##__________________________________________________________________||
+def _compress(means, weights, compression):
+    # returns the centroids, sorted by the means, merged so that the
+    # quantile range of each centroid is within one unit of the scale
+    # function k(q) = compression*(arcsin(2q - 1)/pi + 1/2)
+
+    order = np.argsort(means, kind='mergesort')
+    means = means[order]
+    weights = weights[order]
+
+    if len(means) <= compression:
+        return means, weights
+
+    cum = np.cumsum(weights)
+    q = (cum - weights/2)/cum[-1]
+    k = np.floor(compression*(np.arcsin(np.clip(2*q - 1, -1, 1))/np.pi + 0.5))
+    _, starts = np.unique(k, return_index=True)
+
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means*weights, starts)/merged_weights
+    return merged_means, merged_weights
+
+##__________________________________________________________________||
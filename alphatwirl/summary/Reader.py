@@ -1,6 +1,9 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import copy
 import logging
 
+import numpy as np
+
 from .WeightCalculatorOne import WeightCalculatorOne
 
 ##__________________________________________________________________||
@@ -8,7 +11,8 @@ class Reader(object):
     def __init__(self, keyValComposer, summarizer,
                  nextKeyComposer=None,
                  weightCalculator=WeightCalculatorOne(),
-                 collector=None, nevents=None):
+                 collector=None, nevents=None,
+                 bulkNextKeys=False):
 
         self.keyValComposer = keyValComposer
         self.summarizer = summarizer
@@ -19,6 +23,19 @@ class Reader(object):
         self.nevents = nevents
         self.ievent = 0
 
+        # if True, the next keys are added at once in end(). The next
+        # key composer needs to have next_keys() and the summarizer
+        # needs to have add_keys().
+        self.bulkNextKeys = bulkNextKeys
+
+        # if True, the keys are given to the summarizer as the flat
+        # indices in its multiBinning, e.g., for DenseSummarizer, so
+        # that the tuples of the bins are not created.
+        self._indexed = (
+            callable(getattr(type(summarizer), 'add_index', None))
+            and callable(getattr(type(keyValComposer), 'call_index', None))
+        )
+
         self._repr_pairs = [
             ('keyValComposer', self.keyValComposer),
             ('summarizer', self.summarizer),
@@ -26,6 +43,7 @@ class Reader(object):
             ('nextKeyComposer', self.nextKeyComposer),
             ('weightCalculator', self.weightCalculator),
             ('nevents', self.nevents),
+            ('bulkNextKeys', self.bulkNextKeys),
         ]
 
     def __repr__(self):
@@ -52,7 +70,10 @@ class Reader(object):
         self.ievent += 1
 
         try:
-            keyvals = self.keyValComposer(event)
+            if self._indexed:
+                keyvals = self.keyValComposer.call_index(event, self.summarizer.multiBinning)
+            else:
+                keyvals = self.keyValComposer(event)
         except Exception as e:
             logger = logging.getLogger(__name__)
             logger.error(e)
@@ -60,18 +81,105 @@ class Reader(object):
             raise
 
         weight = self.weightCalculator(event)
+        if self._indexed:
+            for index, val in keyvals:
+                self.summarizer.add_index(index, val, weight)
+            return
         for key, val in keyvals:
             self.summarizer.add(key=key, val=val, weight=weight)
 
+    def events(self, batch):
+        """read a batch of events at once
+
+        The batch is an object with the same attributes as the event.
+        Each attribute is a column for all events in the batch. See
+        ``KeyValueComposer.call_batch()``. ``len(batch)`` is the
+        number of the events.
+
+        The key composer, the weight calculator, and the summarizer
+        need to support batches, i.e., to have ``call_batch()``,
+        ``call_batch()``, and ``add_batch()`` respectively, or
+        ``call_index_batch()`` and ``add_index_batch()`` for the key
+        composer and the summarizer with the flat indices of the keys.
+
+        """
+
+        nevents = len(batch)
+        if self.nevents is not None:
+            nevents = min(nevents, self.nevents - self.ievent)
+            if nevents <= 0:
+                return
+
+        self.ievent += nevents
+
+        try:
+            if self._indexed:
+                entries, indices, vals, valid = self.keyValComposer.call_index_batch(
+                    batch, self.summarizer.multiBinning)
+            else:
+                entries, keys, vals, valid = self.keyValComposer.call_batch(batch)
+        except Exception as e:
+            logger = logging.getLogger(__name__)
+            logger.error(e)
+            logger.error(self)
+            raise
+
+        weights = np.asarray(self.weightCalculator.call_batch(batch))
+
+        # only the first nevents events if nevents is reached
+        selected = valid & (entries < nevents)
+
+        if self._indexed:
+            self.summarizer.add_index_batch(
+                indices[selected],
+                vals=tuple(v[selected] for v in vals),
+                weights=weights[entries[selected]]
+            )
+            return
+
+        self.summarizer.add_batch(
+            keys=tuple(k[selected] for k in keys),
+            vals=tuple(v[selected] for v in vals),
+            weights=weights[entries[selected]]
+        )
+
+    def is_done(self):
+        """True if `nevents` events have been read"""
+        return self.nevents is not None and self.nevents <= self.ievent
+
     def end(self):
         if self.nextKeyComposer is None:
             return
 
+        if self.bulkNextKeys:
+            nextKeys = self.nextKeyComposer.next_keys(self.summarizer.keys())
+            self.summarizer.add_keys(nextKeys)
+            return
+
         for key in sorted(self.summarizer.keys()):
             nextKeys = self.nextKeyComposer(key)
             for nextKey in nextKeys:
                 self.summarizer.add_key(nextKey)
 
+    def clear(self):
+        """clear the results but not the number of events read"""
+        self.summarizer.clear()
+
+    def delta(self):
+        """return the results read since the last clear and clear them
+
+        The results are returned in a shallow copy of this reader
+        with a copy of the summarizer, to which ``end()`` is applied.
+        Only the summarizer is copied. The other attributes, e.g., the
+        composers, are shared.
+
+        """
+        ret = copy.copy(self)
+        ret.summarizer = copy.copy(self.summarizer)
+        self.clear()
+        ret.end()
+        return ret
+
     def merge(self, other):
         self.summarizer += other.summarizer
 
@@ -18,10 +18,20 @@ class Scan(object):
 
         self.contents = [val]
 
+    def accumulate(self, val = None, weight = 1):
+        """append in place, equivalent to ``self += Scan(val, weight)``"""
+        if val is None:
+            return
+        self.contents.append(val)
+
     def __add__(self, other):
         contents = self.contents + other.contents
         return self.__class__(contents = contents)
 
+    def __iadd__(self, other):
+        self.contents.extend(other.contents)
+        return self
+
     def __radd__(self, other):
         # is called with other = 0 when e.g. sum([obj1, obj2])
         if other == 0:
@@ -0,0 +1,235 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import numbers
+
+import numpy as np
+
+from .spill import SpillFile
+
+##__________________________________________________________________||
+class SpillScan(object):
+    """A scan that spills rows to files
+
+    This class can be used in the place of ``Scan`` for scans with too
+    many rows to hold in memory.
+
+    The rows are stored in a NumPy record buffer with ``buffer_size``
+    rows. When the types of the values change, e.g., from ``int`` to
+    ``float``, the buffer is converted to the common types, e.g.,
+    ``float``. When the buffer is full, the rows are saved in a
+    ``.npy`` file in ``directory``. When scans are added, only the references
+    to the files are concatenated. The rows are read from the files
+    one file at a time when ``contents`` is iterated.
+
+    The ``directory`` needs to be set in a subclass. It needs to be
+    accessible from both the workers and the main process, e.g., on a
+    shared file system for HTCondor. A file is removed when no scans
+    refer to it any longer (see ``SpillFile``).
+
+    """
+
+    buffer_size = 100000
+    directory = None
+
+    def __init__(self, val = None, weight = 1, contents = None):
+
+        if self.directory is None:
+            raise ValueError('{}.directory is not set'.format(self.__class__.__name__))
+
+        self._chunks = [ ] # (nrows, array or SpillFile of .npy), in order
+        self._buffer = None
+        self._types = None
+        self._n = 0 # the number of rows in the buffer
+
+        if contents is not None:
+            for v in contents:
+                self.accumulate(v)
+            return
+
+        if val is None:
+            return
+
+        self.accumulate(val)
+
+    @property
+    def contents(self):
+        return _Rows(self)
+
+    def __len__(self):
+        return sum(n for n, _ in self._chunks) + self._n
+
+    def accumulate(self, val = None, weight = 1):
+        """append in place, equivalent to ``self += SpillScan(val, weight)``"""
+        if val is None:
+            return
+        types = tuple(type(v) for v in val)
+        if types != self._types:
+            self._new_buffer(val, types)
+        self._buffer[self._n] = tuple(val)
+        self._n += 1
+        if self._n == len(self._buffer):
+            self._spill_buffer()
+
+    def _new_buffer(self, val, types):
+        dtype = np.dtype([('f{}'.format(i), _dtype(t)) for i, t in enumerate(types)])
+        self._types = types
+        if self._buffer is None:
+            self._buffer = np.empty(self.buffer_size, dtype=dtype)
+            return
+        promoted = _promote(self._buffer.dtype, dtype)
+        if promoted is None:
+            # e.g., a different number of values
+            self._flush_buffer()
+            self._buffer = np.empty(self.buffer_size, dtype=dtype)
+            return
+        if promoted == self._buffer.dtype:
+            return
+        buffer_ = np.empty(self.buffer_size, dtype=promoted)
+        buffer_[:self._n] = self._buffer[:self._n]
+        self._buffer = buffer_
+
+    def _flush_buffer(self):
+        # move the rows in the buffer to the chunks
+        if self._n == 0:
+            return
+        self._append_chunk(self._n, self._buffer[:self._n].copy())
+        self._n = 0
+        self._spill_chunks()
+
+    def _append_chunk(self, n, chunk):
+        # append a chunk, concatenating the arrays in memory so that
+        # the rows are spilled in files with about buffer_size rows
+        if _is_file(chunk) or not self._chunks:
+            self._chunks.append((n, chunk))
+            return
+        last_n, last = self._chunks[-1]
+        if _is_file(last):
+            self._chunks.append((n, chunk))
+            return
+        promoted = _promote(last.dtype, chunk.dtype)
+        if promoted is None:
+            self._chunks.append((n, chunk))
+            return
+        self._chunks[-1] = (last_n + n, np.concatenate([last.astype(promoted), chunk.astype(promoted)]))
+
+    def _spill_buffer(self):
+        self._chunks.append((self._n, self._save(self._buffer[:self._n])))
+        self._n = 0
+
+    def _spill_chunks(self):
+        # spill the chunks in memory if they have too many rows
+        nrows = sum(n for n, c in self._chunks if not _is_file(c))
+        if nrows <= self.buffer_size:
+            return
+        self._chunks[:] = [(n, c if _is_file(c) else self._save(c)) for n, c in self._chunks]
+
+    def _save(self, array):
+        ret = SpillFile(self.directory, prefix='scan_', suffix='.npy')
+        np.save(ret.path, array)
+        return ret
+
+    def iter_rows(self):
+        """iterate over the rows, reading files one at a time"""
+        for _, c in self._chunks:
+            if _is_file(c):
+                c = np.load(c.path, allow_pickle=True)
+            for row in c.tolist():
+                yield row
+        if self._n:
+            for row in self._buffer[:self._n].tolist():
+                yield row
+
+    def __add__(self, other):
+        ret = copy.copy(self)
+        ret += other
+        return ret
+
+    def __iadd__(self, other):
+        self._flush_buffer()
+        if isinstance(other, SpillScan):
+            for n, c in other._chunks:
+                self._append_chunk(n, c)
+            if other._n:
+                self._append_chunk(other._n, other._buffer[:other._n].copy())
+            self._spill_chunks()
+        else:
+            # e.g., Scan
+            for v in other.contents:
+                self.accumulate(v)
+        return self
+
+    def __radd__(self, other):
+        # is called with other = 0 when e.g. sum([obj1, obj2])
+        if other == 0:
+            return self.__class__() + self
+        raise TypeError('unsupported: {!r} + {!r}'.format(other, self))
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('nrows', len(self)),
+            ('nfiles', sum(1 for _, c in self._chunks if _is_file(c))),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{} = {!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def __eq__(self, other):
+        return list(self.iter_rows()) == [tuple(r) for r in other.contents]
+
+    def __copy__(self):
+        # the files are shared as they are not modified
+        ret = self.__class__()
+        ret._chunks[:] = self._chunks
+        if self._n:
+            ret._chunks.append((self._n, self._buffer[:self._n].copy()))
+        return ret
+
+    def __getstate__(self):
+        # not to pickle the empty part of the buffer
+        chunks = list(self._chunks)
+        if self._n:
+            chunks.append((self._n, self._buffer[:self._n].copy()))
+        return dict(_chunks=chunks, _buffer=None, _types=None, _n=0)
+
+##__________________________________________________________________||
+class _Rows(object):
+    """the rows of ``SpillScan``, read each time iterated"""
+    def __init__(self, scan):
+        self._scan = scan
+
+    def __iter__(self):
+        return self._scan.iter_rows()
+
+    def __len__(self):
+        return len(self._scan)
+
+    def __eq__(self, other):
+        return list(self) == [tuple(r) for r in other]
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._scan)
+
+def _is_file(chunk):
+    return isinstance(chunk, SpillFile)
+
+def _dtype(type_):
+    if issubclass(type_, (bool, np.bool_)):
+        return np.bool_
+    if issubclass(type_, numbers.Integral):
+        return np.int64
+    if issubclass(type_, numbers.Real):
+        return np.float64
+    return object
+
+def _promote(dtype1, dtype2):
+    # returns the record dtype to which both record dtypes can be
+    # converted, e.g., int64 and float64 to float64, or None if the
+    # numbers of the fields are different
+    if len(dtype1.names) != len(dtype2.names):
+        return None
+    return np.dtype([
+        (n, np.promote_types(dtype1[n], dtype2[n])) for n in dtype1.names
+    ])
+
+##__________________________________________________________________||
@@ -0,0 +1,208 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import heapq
+import pickle
+import collections
+
+from .Summarizer import Summarizer
+from .convert import key_vals_dict_to_tuple_iter
+from .spill import SpillFile
+
+##__________________________________________________________________||
+class SpillSummarizer(Summarizer):
+    """A summarizer that spills the results to files
+
+    This class has the same interface as ``Summarizer``. It can be used
+    for tables with too many keys to hold in memory, e.g., with the
+    run, luminosity block, and event numbers in the keys.
+
+    When the number of the keys in memory exceeds ``max_keys``, the
+    results in memory are sorted by the keys and saved in a file in
+    ``directory`` as a run, and then cleared. The runs and the results
+    in memory are merged in a k-way merge when the results are
+    returned. ``to_tuple_iter()`` reads the runs one result at a time.
+    When summarizers are added, only the references to the files are
+    concatenated.
+
+    The results are the same as the results of ``Summarizer`` except
+    for the order of floating-point additions. The keys need to be
+    sortable.
+
+    The ``directory`` needs to be accessible from both the workers and
+    the main process, e.g., on a shared file system for HTCondor. A
+    file is removed when no summarizers refer to it any longer, e.g.,
+    after ``clear()`` or after the summarizers are merged and the
+    merged summarizer is deleted (see ``SpillFile``).
+
+    Args:
+        Summary: a summary class, e.g., ``Count``
+        directory (str): the directory for the files
+        max_keys (int): the maximum number of the keys in memory
+
+    """
+    def __init__(self, Summary, directory, max_keys=100000):
+        if directory is None:
+            raise ValueError('the directory for the spill files is not given')
+        super(SpillSummarizer, self).__init__(Summary)
+        self.directory = directory
+        self.max_keys = max_keys
+        self._runs = [ ] # SpillFile, in order
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('Summary',  self.Summary),
+            ('directory', self.directory),
+            ('max_keys', self.max_keys),
+            ('nruns', len(self._runs)),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def add(self, key, val=None, weight=1):
+        super(SpillSummarizer, self).add(key, val, weight)
+        if len(self._results) > self.max_keys:
+            self._spill()
+
+    def add_batch(self, keys, vals, weights):
+        super(SpillSummarizer, self).add_batch(keys, vals, weights)
+        if len(self._results) > self.max_keys:
+            self._spill()
+
+    def add_key(self, key):
+        super(SpillSummarizer, self).add_key(key)
+        if len(self._results) > self.max_keys:
+            self._spill()
+
+    def add_keys(self, keys):
+        super(SpillSummarizer, self).add_keys(keys)
+        if len(self._results) > self.max_keys:
+            self._spill()
+
+    def _spill(self):
+        run = SpillFile(self.directory, prefix='summarizer_', suffix='.pickle')
+        with open(run.path, 'wb') as f:
+            for item in sorted(self._results.items(), key=lambda e: e[0]):
+                pickle.dump(item, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._runs.append(run)
+        self._results.clear()
+
+    def _merged_items(self):
+        # yields (key, summary) sorted by the keys, merging the runs
+        # and the results in memory. The summaries of the same key are
+        # added in the order of the runs.
+        iters = [_iter_run(r.path, i) for i, r in enumerate(self._runs)]
+        iters.append(_iter_items(sorted(self._results.items(), key=lambda e: e[0]), len(self._runs)))
+        last = None
+        summary = None
+        for key, _, s in heapq.merge(*iters):
+            if summary is not None and key != last:
+                yield last, summary
+                summary = None
+            if summary is None:
+                summary = self.Summary()
+            summary += s
+            last = key
+        if summary is not None:
+            yield last, summary
+
+    def keys(self):
+        if not self._runs:
+            return super(SpillSummarizer, self).keys()
+        return [k for k, _ in self._merged_items()]
+
+    def clear(self):
+        """remove all keys
+
+        The files are removed unless other summarizers refer to them.
+
+        """
+        super(SpillSummarizer, self).clear()
+        self._runs = [ ]
+
+    def _new(self):
+        return self.__class__(self.Summary, self.directory, self.max_keys)
+
+    def __copy__(self):
+        # the files are shared as they are not modified
+        ret = super(SpillSummarizer, self).__copy__()
+        ret._runs[:] = self._runs
+        return ret
+
+    def __iadd__(self, other):
+        self._add_results_inplace(self._results, other._results)
+        self._runs.extend(getattr(other, '_runs', [ ]))
+        if len(self._results) > self.max_keys:
+            self._spill()
+        return self
+
+    def _can_merge_arrays(self, other):
+        # merge_summarizers() adds the summarizers one by one so that
+        # the results are spilled whenever they exceed max_keys
+        return False
+
+    def _to_arrays(self):
+        # for pickling
+        if self._runs:
+            # not to load all runs in memory
+            return None
+        return super(SpillSummarizer, self)._to_arrays()
+
+    def results(self):
+        """return the results in a dict, loading all runs in memory"""
+        if not self._runs:
+            return super(SpillSummarizer, self).results()
+        return dict(self._merged_items())
+
+    def to_key_vals_dict(self):
+        if not self._runs:
+            return super(SpillSummarizer, self).to_key_vals_dict()
+        return collections.OrderedDict(
+            (k, self._out_contents(v)) for k, v in self._merged_items()
+        )
+
+    def to_tuple_iter(self):
+        """return an iterator of the tuples in ``to_tuple_list()``
+
+        The runs are read twice, first to find the maximum length of
+        the contents.
+
+        """
+        if not self._runs:
+            return super(SpillSummarizer, self).to_tuple_iter()
+        return key_vals_dict_to_tuple_iter(_MergedKeyVals(self), fill=0)
+
+##__________________________________________________________________||
+class _MergedKeyVals(object):
+    """the merged results as a key_vals_dict, read each time iterated"""
+    def __init__(self, summarizer):
+        self._summarizer = summarizer
+
+    def __bool__(self):
+        return any(True for _ in self.items())
+
+    __nonzero__ = __bool__ # for python 2
+
+    def items(self):
+        s = self._summarizer
+        for k, v in s._merged_items():
+            yield k, s._out_contents(v)
+
+    def values(self):
+        for _, v in self.items():
+            yield v
+
+def _iter_run(path, irun):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                key, summary = pickle.load(f)
+            except EOFError:
+                return
+            yield key, irun, summary
+
+def _iter_items(items, irun):
+    for key, summary in items:
+        yield key, irun, summary
+
+##__________________________________________________________________||
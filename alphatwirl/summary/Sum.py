@@ -3,6 +3,8 @@
 import numpy as np
 import copy
 
+from .reduce_contents import reduce_contents
+
 ##__________________________________________________________________||
 class Sum(object):
 
@@ -20,10 +22,49 @@ class Sum(object):
 
         self.contents = [np.array(val)*weight]
 
+    @classmethod
+    def batch_contents(cls, vals, weights):
+        """return the contents for each row of a batch
+
+        Args:
+            vals : a tuple of arrays, one for each value
+            weights : an array of the weights
+
+        Returns:
+            an array with a row for each weight. The contents of
+            multiple rows can be summed.
+
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+        ret = np.empty((len(weights), len(vals)), dtype=np.float64)
+        for i, v in enumerate(vals):
+            ret[:, i] = np.asarray(v)*weights
+        return ret
+
+    def accumulate(self, val = None, weight = 1):
+        """sum in place, equivalent to ``self += Sum(val, weight)``"""
+        if val is None:
+            return
+        contents = self.contents[0]
+        if contents.dtype != np.float64 or contents.shape != (len(val), ):
+            # e.g., the first time. broadcast np.array([0])
+            contents = self.contents[0] = contents + np.zeros(len(val), dtype=np.float64)
+        for i, v in enumerate(val):
+            contents[i] += v*weight
+
     def __add__(self, other):
         contents = [self.contents[0] + other.contents[0]]
         return self.__class__(contents = contents)
 
+    def __iadd__(self, other):
+        contents = self.contents[0]
+        other_contents = other.contents[0]
+        if contents.dtype == np.float64 and contents.shape == other_contents.shape:
+            contents += other_contents
+        else:
+            self.contents = [contents + other_contents]
+        return self
+
     def __radd__(self, other):
         # is called with other = 0 when e.g. sum([obj1, obj2])
         if other == 0:
@@ -41,4 +82,7 @@ class Sum(object):
         contents = [np.copy(self.contents[0])]
         return self.__class__(contents = contents)
 
+    def __reduce__(self):
+        return reduce_contents(self)
+
 ##__________________________________________________________________||
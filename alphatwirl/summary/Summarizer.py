@@ -2,15 +2,21 @@
 
 import collections
 import itertools
+import numbers
 import copy
 
+import numpy as np
+
 from .convert import key_vals_dict_to_tuple_list
+from .convert import key_vals_dict_to_tuple_iter
+from .merge_summarizers import merge_summarizers
 
 ##__________________________________________________________________||
 class Summarizer(object):
     def __init__(self, Summary):
         self._results = collections.defaultdict(Summary)
         self.Summary = Summary
+        self._accumulate = hasattr(Summary, 'accumulate')
 
     def __repr__(self):
         name_value_pairs = (
@@ -23,24 +29,83 @@ class Summarizer(object):
         )
 
     def add(self, key, val=None, weight=1):
+        if self._accumulate:
+            # in place without creating a new summary
+            self._results[key].accumulate(val, weight)
+            return
         self._results[key] += self.Summary(val, weight)
 
+    def add_batch(self, keys, vals, weights):
+        """add rows in columns at once
+
+        The result is the same as calling ``add()`` for each row,
+        except for the order of floating-point additions. The rows with
+        the same key are summed first if the summary class has
+        ``batch_contents()``.
+
+        Args:
+            keys : a tuple of arrays, one for each element of the key
+            vals : a tuple of arrays, one for each element of the value
+            weights : an array of the weights
+
+        """
+
+        if not hasattr(self.Summary, 'batch_contents'):
+            for key, val, weight in zip(zip(*keys), zip(*vals), weights):
+                self.add(key=key, val=val, weight=weight)
+            return
+
+        nrows = len(weights)
+        if nrows == 0:
+            return
+
+        group_keys, groups = self._group_keys(keys, nrows)
+        self._add_groups(group_keys, groups, vals, weights)
+
+    def _add_groups(self, group_keys, groups, vals, weights):
+        # sums the rows in each group and adds them to the results
+        row_contents = self.Summary.batch_contents(vals, weights)
+        contents = np.zeros((len(group_keys), ) + row_contents.shape[1:], dtype=row_contents.dtype)
+        np.add.at(contents, groups, row_contents)
+
+        for key, c in zip(group_keys, contents):
+            self._results[key] += self.Summary(contents=[c])
+
+    def _group_keys(self, keys, nrows):
+        # returns the distinct keys and the group index of each row
+        groups, first_rows = _group_rows(keys, nrows)
+        group_keys = [np.asarray(k)[first_rows].tolist() for k in keys]
+        group_keys = list(zip(*group_keys)) if keys else [( )]
+        return group_keys, groups
+
     def add_key(self, key):
         self._results[key]
 
+    def add_keys(self, keys):
+        """add keys at once, equivalent to ``add_key()`` for each key"""
+        missing = set(keys).difference(self._results)
+        self._results.update((k, self.Summary()) for k in missing)
+
     def keys(self):
         return self._results.keys()
 
+    def clear(self):
+        """remove all keys"""
+        self._results.clear()
+
+    def _new(self):
+        # returns an empty summarizer with the same configuration
+        return self.__class__(self.Summary)
+
     def __copy__(self):
-        ret = self.__class__(self.Summary)
+        ret = self._new()
         self._add_results_inplace(ret._results, self._results)
         return ret
 
     def __add__(self, other):
-        ret = copy.copy(self)
-        if not other == 0: # other is 0 when e.g. sum([obj1, obj2])
-            self._add_results_inplace(ret._results, other._results)
-        return ret
+        if other == 0: # other is 0 when e.g. sum([obj1, obj2])
+            return copy.copy(self)
+        return merge_summarizers([self, other])
 
     def __iadd__(self, other):
         self._add_results_inplace(self._results, other._results)
@@ -54,12 +119,101 @@ class Summarizer(object):
         for k, v in res2.items():
             res1[k] += v
 
+    def __getstate__(self):
+        # pickle the results in a few flat arrays rather than a dict
+        # of summaries if possible
+        ret = self.__dict__.copy()
+        arrays = self._to_arrays()
+        if arrays is None:
+            return ret
+        del ret['_results']
+        ret['_arrays'] = arrays
+        return ret
+
+    def __setstate__(self, state):
+        arrays = state.pop('_arrays', None)
+        self.__dict__.update(state)
+        if arrays is None:
+            return
+        self._results = collections.defaultdict(self.Summary)
+        self._set_arrays(*arrays)
+
+    def _can_merge_arrays(self, other):
+        return type(other) is type(self) and other.Summary is self.Summary
+
+    def _to_arrays(self):
+        # returns the results in arrays (key_columns, contents, filled)
+        # for merge_summarizers(), or None if they cannot be in arrays
+        #
+        # key_columns: a tuple of arrays, one for each element of the key
+        # contents: a 2D array with a row for each key
+        # filled: a bool array, False for keys only with the empty summary
+
+        if not hasattr(self.Summary, 'batch_contents'):
+            return None
+
+        items = list(self._results.items())
+
+        key_columns = self._key_columns([k for k, _ in items])
+        if key_columns is None:
+            return None
+
+        contents = [v.contents for _, v in items]
+        if not all(len(c) == 1 for c in contents):
+            return None
+        rows = [c[0] for c in contents]
+        if not all(isinstance(r, np.ndarray) and r.ndim == 1 for r in rows):
+            return None
+
+        # the rows that can be the empty summary, e.g., Sum() with
+        # the contents [np.array([0])] for the keys only added
+        empty = self.Summary().contents[0]
+        empty_like = np.array([r.shape == empty.shape and r.dtype == empty.dtype for r in rows], dtype=bool)
+        filled = np.ones(len(rows), dtype=bool)
+        if empty_like.any():
+            idxs = np.flatnonzero(empty_like)
+            filled[idxs] = np.array([rows[i] for i in idxs]).any(axis=1)
+
+        filled_rows = [rows[i] for i in np.flatnonzero(filled)]
+        if len(set(r.shape for r in filled_rows)) > 1:
+            return None
+
+        ncols = len(filled_rows[0]) if filled_rows else 0
+        dtype = np.result_type(*set(r.dtype for r in filled_rows)) if filled_rows else np.float64
+        ret = np.zeros((len(rows), ncols), dtype=dtype)
+        if filled_rows:
+            ret[filled] = filled_rows
+
+        return key_columns, ret, filled
+
+    def _set_arrays(self, key_columns, contents, filled):
+        # set the results from arrays in the format of _to_arrays()
+        keys = self._column_keys(key_columns, len(filled))
+        for key, c, f in zip(keys, contents, filled.tolist()):
+            self._results[key] = self.Summary(contents=[c]) if f else self.Summary()
+
+    def _key_columns(self, keys):
+        # returns a tuple of arrays, one for each element of the keys,
+        # or None if the keys cannot be in arrays
+        if not all(isinstance(k, tuple) for k in keys):
+            return None
+        lengths = set(len(k) for k in keys)
+        if len(lengths) > 1:
+            return None
+        return tuple(_to_column(c) for c in zip(*keys))
+
+    def _column_keys(self, key_columns, nkeys):
+        # the inverse of _key_columns()
+        if not key_columns:
+            return [( )]*nkeys
+        return list(zip(*[c.tolist() for c in key_columns]))
+
     def results(self):
         return self._results
 
     def to_key_vals_dict(self):
         keys_sorted = sorted(self._results.keys())
-        ret = collections.OrderedDict([(k, self._results[k].contents) for k in keys_sorted])
+        ret = collections.OrderedDict([(k, self._out_contents(self._results[k])) for k in keys_sorted])
         # e.g.,
         # OrderedDict([
         #     ((200, 2), [array([120, 240])]),
@@ -68,6 +222,14 @@ class Summarizer(object):
         # ])
         return ret
 
+    def _out_contents(self, summary):
+        # the contents in the output, e.g., a row for each bin for
+        # Histogram
+        expand = getattr(self.Summary, 'expand_contents', None)
+        if expand is None:
+            return summary.contents
+        return expand(summary.contents)
+
     def to_tuple_list(self):
         key_vals_dict = self.to_key_vals_dict()
         ret = key_vals_dict_to_tuple_list(key_vals_dict, fill=0)
@@ -79,4 +241,41 @@ class Summarizer(object):
         # ]
         return ret
 
+    def to_tuple_iter(self):
+        """return an iterator of the tuples in ``to_tuple_list()``
+
+        The tuples are created one at a time, e.g., for ``SpillScan``,
+        whose rows are not all in memory.
+
+        """
+        return key_vals_dict_to_tuple_iter(self.to_key_vals_dict(), fill=0)
+
+##__________________________________________________________________||
+def _group_rows(keys, nrows):
+    # returns the group index of each row and the first row of each
+    # group, where the rows with the same key are in the same group
+
+    groups = np.zeros(nrows, dtype=np.int64)
+    for k in keys:
+        _, inverse = np.unique(k, return_inverse=True)
+        _, groups = np.unique(groups*(inverse.max() + 1) + inverse.reshape(-1), return_inverse=True)
+        groups = groups.reshape(-1)
+    _, first_rows = np.unique(groups, return_index=True)
+    return groups, first_rows
+
+def _to_column(values):
+    # returns an array of the values with the dtype with which
+    # tolist() returns the same values
+    types = set(type(v) for v in values)
+    if all(issubclass(t, numbers.Integral) and t is not bool for t in types):
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    elif all(issubclass(t, float) for t in types):
+        return np.array(values, dtype=np.float64)
+    ret = np.empty(len(values), dtype=object)
+    ret[:] = values
+    return ret
+
 ##__________________________________________________________________||
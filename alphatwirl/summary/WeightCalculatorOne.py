@@ -1,10 +1,14 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
+import numpy as np
 
 ##__________________________________________________________________||
 class WeightCalculatorOne(object):
     def __call__(self, event):
         return 1
 
+    def call_batch(self, batch):
+        return np.ones(len(batch))
+
     def __repr__(self):
         return '{}()'.format(self.__class__.__name__)
 ##__________________________________________________________________||
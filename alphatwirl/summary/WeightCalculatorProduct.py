@@ -0,0 +1,114 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import numbers
+import weakref
+
+import numpy as np
+
+##__________________________________________________________________||
+class WeightCalculatorProduct(object):
+    """The product of the attributes of the event as the weight
+
+    For example, ``WeightCalculatorProduct(('genWeight', 'puWeight'))``
+    returns ``event.genWeight[0]*event.puWeight[0]``.
+
+    The attributes can be numbers or arrays. For arrays, the elements
+    at ``attrIndices``, which are 0 by default, are multiplied.
+
+    In ``call_batch()``, each attribute of the batch is a column with
+    one element per event or a tuple ``(contents, offsets)`` of a
+    jagged array. The columns are multiplied in NumPy.
+
+    The last weight is kept and reused if the same instance is called
+    again for the same event, e.g., by the readers of many tables.
+    The event is identified by the object and its ``iEvent``. The
+    weight is calculated every time for events without ``iEvent``.
+
+    Args:
+        attrNames : the names of the attributes to multiply
+        attrIndices : the index of the element for each attribute.
+                      ``None`` for 0.
+
+    """
+    def __init__(self, attrNames, attrIndices=None):
+        self.attrNames = tuple(attrNames)
+        if attrIndices is None:
+            attrIndices = (None, )*len(self.attrNames)
+        if not len(self.attrNames) == len(attrIndices):
+            raise ValueError(
+                "the two tuples must have the same length: attrNames={}, attrIndices={}".format(
+                    self.attrNames, attrIndices
+                )
+            )
+        self.attrIndices = tuple(attrIndices)
+        self._zipped = [(n, 0 if i is None else i) for n, i in zip(self.attrNames, self.attrIndices)]
+
+        self._last = None # (weakref to the event, iEvent, weight)
+
+    def __repr__(self):
+        name_value_pairs = (
+            ('attrNames', self.attrNames),
+            ('attrIndices', self.attrIndices),
+        )
+        return '{}({})'.format(
+            self.__class__.__name__,
+            ', '.join(['{}={!r}'.format(n, v) for n, v in name_value_pairs]),
+        )
+
+    def __getstate__(self):
+        # weak references cannot be pickled
+        ret = self.__dict__.copy()
+        ret['_last'] = None
+        return ret
+
+    def __call__(self, event):
+        ievent = getattr(event, 'iEvent', None)
+        last = self._last
+        if ievent is not None and last is not None:
+            if last[0]() is event and last[1] == ievent:
+                return last[2]
+
+        ret = 1
+        for name, idx in self._zipped:
+            value = getattr(event, name)
+            if not isinstance(value, numbers.Number):
+                value = value[idx]
+            ret *= value
+
+        if ievent is not None:
+            self._last = _ref(event), ievent, ret
+        return ret
+
+    def call_batch(self, batch):
+        nevents = len(batch)
+        ret = np.ones(nevents)
+        for name, idx in self._zipped:
+            ret *= _column(getattr(batch, name), idx, nevents)
+        return ret
+
+##__________________________________________________________________||
+def _ref(obj):
+    # a weak reference to obj, or a function returning None if obj
+    # does not support weak references
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return _none
+
+def _none():
+    return None
+
+def _column(column, idx, nevents):
+    # the element at idx for each event
+    if isinstance(column, tuple):
+        contents, offsets = column
+        contents = np.asarray(contents)
+        offsets = np.asarray(offsets)
+        if np.any(offsets[1:] - offsets[:-1] <= idx):
+            raise IndexError('index {} is out of range for some events'.format(idx))
+        return contents[offsets[:-1] + idx]
+    column = np.asarray(column)
+    if column.ndim == 0:
+        return np.full(nevents, column)
+    return column
+
+##__________________________________________________________________||
@@ -1,10 +1,20 @@
 from .BackrefMultipleArrayReader import BackrefMultipleArrayReader
 from .Count import Count
+from .DenseSummarizer import DenseSummarizer
+from .Histogram import Histogram
+from .KeyColumnCache import KeyColumnCache
 from .KeyValueComposer import KeyValueComposer
+from .Moments import Moments
 from .NextKeyComposer import NextKeyComposer
+from .PackedSummarizer import PackedSummarizer
+from .QuantileSketch import QuantileSketch
 from .Reader import Reader
 from .Scan import Scan
+from .SpillScan import SpillScan
+from .SpillSummarizer import SpillSummarizer
 from .Sum import Sum
 from .Summarizer import Summarizer
 from .WeightCalculatorOne import WeightCalculatorOne
+from .WeightCalculatorProduct import WeightCalculatorProduct
+from .merge_summarizers import merge_summarizers
 from .parse_indices_config import parse_indices_config
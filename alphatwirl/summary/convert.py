@@ -1,5 +1,4 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
-import itertools
 
 ##__________________________________________________________________||
 def key_vals_dict_to_tuple_list(key_vals_dict, fill=float('nan')):
@@ -13,21 +12,35 @@ def key_vals_dict_to_tuple_list(key_vals_dict, fill=float('nan')):
         A list of tuples
 
     """
+    return list(key_vals_dict_to_tuple_iter(key_vals_dict, fill=fill))
 
-    tuple_list = [ ]
+def key_vals_dict_to_tuple_iter(key_vals_dict, fill=float('nan')):
+    """Convert ``key_vals_dict`` to tuples one at a time.
 
-    if not key_vals_dict: return tuple_list
+    The same as ``key_vals_dict_to_tuple_list()`` except that this
+    function returns an iterator. The values are iterated twice, first
+    to find the maximum length.
 
-    vlen = max([len(vs) for vs in itertools.chain(*key_vals_dict.values())])
+    Args:
+        key_vals_dict (dict): The first parameter.
+        fill: a value to fill missing data
+
+    Returns:
+        An iterator of tuples
+
+    """
+
+    if not key_vals_dict: return
+
+    vlen = max(len(v) for vs in key_vals_dict.values() for v in vs)
 
     for k, vs in key_vals_dict.items():
         try:
-            tuple_list.extend([k + tuple(v) + (fill, )*(vlen - len(v)) for v in vs])
+            k = k + ( )
         except TypeError:
             # assume k is not a tuple
-            tuple_list.extend([(k, ) + tuple(v) + (fill, )*(vlen - len(v)) for v in vs])
-
-
-    return tuple_list
+            k = (k, )
+        for v in vs:
+            yield k + tuple(v) + (fill, )*(vlen - len(v))
 
 ##__________________________________________________________________||
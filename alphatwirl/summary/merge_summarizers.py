@@ -0,0 +1,106 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+
+import numpy as np
+
+##__________________________________________________________________||
+def merge_summarizers(summarizers):
+    """merge summarizers into a new summarizer
+
+    The result is the same as ``sum(summarizers)``. However, the
+    accumulator is not copied at every step.
+
+    If all summarizers are the same ``Summarizer`` type with the same
+    summary class whose contents are arrays, e.g., ``Count`` and
+    ``Sum``, the results are merged at once with NumPy: the keys and
+    contents of all summarizers are concatenated in arrays, and the
+    contents of the same keys are summed. The floating-point additions
+    are in the same order as in ``sum(summarizers)``. Otherwise, the
+    summarizers are added one by one to a copy of the first.
+
+    Args:
+        summarizers : summarizers to merge
+
+    Returns:
+        a new summarizer, or ``None`` if ``summarizers`` is empty
+
+    """
+
+    summarizers = list(summarizers)
+    if not summarizers:
+        return None
+
+    ret = _merge_arrays(summarizers)
+    if ret is not None:
+        return ret
+
+    ret = copy.copy(summarizers[0])
+    for s in summarizers[1:]:
+        ret += s
+    return ret
+
+##__________________________________________________________________||
+def _merge_arrays(summarizers):
+    # returns None if the summarizers cannot be merged in arrays
+
+    first = summarizers[0]
+    if not hasattr(first, '_to_arrays'):
+        return None
+    if not all(first._can_merge_arrays(s) for s in summarizers[1:]):
+        return None
+
+    arrays = [ ]
+    for s in summarizers:
+        a = s._to_arrays()
+        if a is None:
+            return None
+        if len(a[2]) == 0:
+            continue
+        arrays.append(a)
+
+    ret = first._new()
+    if not arrays:
+        return ret
+
+    if len(set(len(a[0]) for a in arrays)) > 1:
+        # different numbers of elements in the keys
+        return None
+
+    filled_contents = [a[1] for a in arrays if a[2].any()]
+    ncols = set(c.shape[1] for c in filled_contents)
+    if len(ncols) > 1:
+        return None
+    ncols = ncols.pop() if ncols else 0
+    dtype = np.result_type(*set(c.dtype for c in filled_contents)) if filled_contents else np.float64
+
+    key_columns = tuple(_concatenate(c) for c in zip(*[a[0] for a in arrays]))
+    contents = [a[1] if a[1].shape[1] == ncols else np.zeros((len(a[1]), ncols), dtype=dtype) for a in arrays]
+    contents = np.concatenate(contents)
+    filled = np.concatenate([a[2] for a in arrays])
+
+    from .Summarizer import _group_rows # not at the top to avoid a circular import
+    try:
+        groups, first_rows = _group_rows(key_columns, len(filled))
+    except TypeError:
+        # e.g., the keys cannot be sorted
+        return None
+
+    merged_contents = np.zeros((len(first_rows), ncols), dtype=contents.dtype)
+    np.add.at(merged_contents, groups, contents)
+    merged_filled = np.zeros(len(first_rows), dtype=bool)
+    np.logical_or.at(merged_filled, groups, filled)
+
+    ret._set_arrays(
+        tuple(c[first_rows] for c in key_columns),
+        merged_contents, merged_filled
+    )
+    return ret
+
+def _concatenate(columns):
+    # concatenate in the object dtype if the dtypes are different so
+    # that, e.g., integers are not converted to floats
+    if len(set(c.dtype for c in columns)) > 1:
+        columns = [c.astype(object) for c in columns]
+    return np.concatenate(columns)
+
+##__________________________________________________________________||
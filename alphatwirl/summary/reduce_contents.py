@@ -0,0 +1,28 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import numpy as np
+
+##__________________________________________________________________||
+def reduce_contents(summary):
+    """return the value of ``__reduce__()`` of a summary, e.g., ``Count``
+
+    The contents are pickled as a list of numbers and the dtype, which
+    is smaller and faster than the array, if the contents are one flat
+    array of numbers. Otherwise, the contents are pickled as they are.
+
+    The summary class needs to take the arguments ``(val, weight,
+    contents)``.
+
+    """
+    contents = summary.contents
+    if len(contents) == 1 and _is_flat_numbers(contents[0]):
+        return _restore, (summary.__class__, contents[0].tolist(), contents[0].dtype.str)
+    return summary.__class__, (None, 1, contents)
+
+##__________________________________________________________________||
+def _is_flat_numbers(array):
+    return isinstance(array, np.ndarray) and array.ndim == 1 and array.dtype.kind in 'biuf'
+
+def _restore(cls, values, dtype):
+    return cls(contents=[np.array(values, dtype=dtype)])
+
+##__________________________________________________________________||
@@ -0,0 +1,68 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import os
+import tempfile
+
+from ..misc import mkdir_p
+
+##__________________________________________________________________||
+class SpillFile(object):
+    """A file of spilled results, e.g., of ``SpillScan``
+
+    The file is created in ``directory``, which needs to be given
+    explicitly because the workers do not necessarily share the
+    current directory with the main process, e.g., on HTCondor.
+
+    The file is removed when this object is deleted, i.e., when no
+    scan or summarizer refers to it any longer. The scans and
+    summarizers share this object when they are copied or added.
+
+    When this object is pickled, e.g., to send the results from a
+    worker to the main process, the unpickled object removes the file
+    instead of this object.
+
+    Args:
+        directory (str): the directory for the file
+        prefix (str): the prefix of the file name
+        suffix (str): the suffix of the file name
+
+    """
+    def __init__(self, directory, prefix, suffix):
+        self._remove = False
+        if directory is None:
+            raise ValueError('the directory for the spill files is not given')
+        mkdir_p(directory)
+        fd, self.path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=directory)
+        os.close(fd)
+        self._remove = True
+
+    def __repr__(self):
+        return '{}(path={!r})'.format(
+            self.__class__.__name__,
+            self.path
+        )
+
+    def __copy__(self):
+        # the file is not modified
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        # the unpickled object removes the file
+        self._remove = False
+        return dict(path=self.path, _remove=True)
+
+    def __del__(self):
+        if self._remove:
+            self.remove()
+
+    def remove(self):
+        """remove the file"""
+        self._remove = False
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+##__________________________________________________________________||
@@ -1,5 +1,6 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import pytest
+import numpy as np
 
 from alphatwirl.binning import Binning
 
@@ -170,3 +171,56 @@ def test_valid():
     assert obj( 9) is None
 
 ##__________________________________________________________________||
+def test_all_bins():
+    obj = Binning(boundaries=(10, 20, 30, 40, 50))
+    assert (float('-inf'), 10, 20, 30, 40, 50) == obj.all_bins()
+
+    obj = Binning(boundaries=(10, 20, 30, 40, 50), retvalue='number')
+    assert (0, 1, 2, 3, 4, 5) == obj.all_bins()
+
+##__________________________________________________________________||
+@pytest.mark.parametrize('kwargs', [
+    dict(boundaries=(10, 20, 30, 40, 50)),
+    dict(boundaries=(10, 20, 30, 40, 50), retvalue='number'),
+    dict(boundaries=(10, 20, 30, 40, 50), retvalue='number', bins=(5, 3, 'a', None), underflow_bin=-1, overflow_bin='o'),
+    dict(boundaries=(0.000001, 0.00001, 0.0001), retvalue='number'),
+    dict(boundaries=(30, 40, 50), retvalue='number', valid=lambda x: x >= 10),
+    dict(boundaries=(10, 30, 20, 50)), # not increasing
+])
+def test_bin_array(kwargs):
+    obj = Binning(**kwargs)
+    values = [
+        -5, 0, 9.999, 10, 15, 20, 21.5, 30, 40, 49.99, 50, 55,
+        0.000001, 0.00001, 0.0001, 0.00005, float('inf'), float('-inf')
+    ]
+    expected = [obj(v) for v in values]
+    actual = obj.bin_array(np.array(values))
+    assert object == actual.dtype
+    assert expected == actual.tolist()
+    assert [obj(v) for v in range(60)] == obj.bin_array(np.arange(60)).tolist()
+    assert [ ] == obj.bin_array(np.array([ ])).tolist()
+    assert [obj(15)] == obj.bin_array(np.asarray(15)).tolist()
+    assert [obj(21.5)] == obj.bin_array(21.5).tolist()
+
+def test_nan():
+    obj = Binning(boundaries=(10, 20, 30))
+    with pytest.raises(IndexError):
+        obj(float('nan'))
+    with pytest.raises(IndexError):
+        obj.bin_array(np.array([15, float('nan')]))
+
+##__________________________________________________________________||
+def test_next_successors():
+    obj = Binning(boundaries=(10, 20, 30), retvalue='number', bins=(7, 5), underflow_bin=5, overflow_bin=9)
+    # underflow_bin has the priority as in the previous implementation
+    assert {7: 5, 5: 7, 9: 9} == obj._successors
+    assert 7 == obj.next(5)
+    assert 5 == obj.next(7)
+
+def test_next_lowedge_valid():
+    obj = Binning(boundaries=(10, 20, 30), valid=lambda x: x != 20)
+    assert 20 == obj.next(10)
+    with pytest.raises(ValueError):
+        obj.next(20) # as obj(20) is None
+
+##__________________________________________________________________||
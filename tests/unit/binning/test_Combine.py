@@ -1,6 +1,8 @@
-from alphatwirl.binning import Combine, Round, RoundLog
+from alphatwirl.binning import Combine, Round, RoundLog, Echo
 import unittest
 
+import numpy as np
+
 ##__________________________________________________________________||
 def plus2(val): return val + 2
 
@@ -36,4 +38,26 @@ class TestCombine(unittest.TestCase):
         self.assertAlmostEqual(50, binning.next(45))
         self.assertEqual(62.94627058970836, binning.next(50))
 
+    def test_bin_array(self):
+        binning = Combine(low=Round(10.0, 50, min=0), high=RoundLog(0.1, 50), at=50)
+        values = [-5, 0, 11, 49.9, 50, 50.1, 300, 11, np.nan]
+        expected = [binning(v) for v in values]
+        actual = binning.bin_array(np.array(values))
+        self.assertEqual(object, actual.dtype)
+        self.assertEqual(expected[:-1], actual.tolist()[:-1])
+        self.assertIsNone(actual[-1])
+        self.assertEqual([binning(11)], binning.bin_array(np.asarray(11)).tolist())
+        self.assertEqual([binning(300)], binning.bin_array(300).tolist())
+
+    def test_bin_array_without_bin_array(self):
+        binning = Combine(low=Echo(valid=lambda x: x != 3), high=Round(10.0, 0), at=10)
+        values = [1, 3, 9, 10, 25]
+        expected = [binning(v) for v in values]
+        self.assertEqual(expected, binning.bin_array(np.array(values)).tolist())
+
+    def test_bin_array_one_side(self):
+        binning = Combine(low=Round(10.0, 0), high=RoundLog(0.1, 50), at=50)
+        self.assertEqual([0, 20], binning.bin_array(np.array([5, 25])).tolist())
+        self.assertEqual([ ], binning.bin_array(np.array([ ])).tolist())
+
 ##__________________________________________________________________||
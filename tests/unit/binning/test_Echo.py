@@ -1,6 +1,8 @@
 from alphatwirl.binning import Echo
 import unittest
 
+import numpy as np
+
 ##__________________________________________________________________||
 def plus2(val): return val + 2
 
@@ -51,4 +53,17 @@ class TestEcho(unittest.TestCase):
         self.assertEqual( 10, binning(10))
         self.assertIsNone(binning(7))
 
+    def test_bin_array(self):
+        binning = Echo()
+        values = np.array([1.5, 2, 0, 5])
+        self.assertIs(values, binning.bin_array(values))
+        self.assertEqual([1.5], binning.bin_array(np.asarray(1.5)).tolist())
+
+    def test_bin_array_valid(self):
+        binning = Echo(valid = lambda x: x >= 10)
+        values = np.array([13, 10, 7])
+        self.assertEqual([13, 10, None], binning.bin_array(values).tolist())
+        values = np.array([13, 10])
+        self.assertIs(values, binning.bin_array(values))
+
 ##__________________________________________________________________||
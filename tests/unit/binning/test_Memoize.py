@@ -0,0 +1,83 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import pickle
+
+import numpy as np
+import pytest
+
+try:
+    import unittest.mock as mock
+except ImportError:
+    import mock
+
+from alphatwirl.binning import Memoize
+from alphatwirl.binning import Binning, Round, RoundLog, Combine, Echo
+
+##__________________________________________________________________||
+binnings = [
+    Binning(boundaries=(0, 2, 4, 8), retvalue='number'),
+    Round(2, 0, min=0, underflow_bin=-1, max=10, overflow_bin=True),
+    RoundLog(0.1, 1, min=1, underflow_bin=0),
+    Combine(low=Round(2, 0), high=RoundLog(0.1, 10), at=10),
+    Echo(valid=lambda x: x != 3),
+]
+
+@pytest.fixture(params=binnings)
+def binning(request):
+    return request.param
+
+##__________________________________________________________________||
+def test_repr(binning):
+    obj = Memoize(binning)
+    repr(obj)
+
+def test_same_as_binning(binning):
+    obj = Memoize(binning)
+    values = [-1, 0, 1, 2, 3, 5, 10, 12, 30, 3, 2, 1, 1.5, 2.5, 1.5]
+    assert [binning(v) for v in values] == [obj(v) for v in values]
+    assert [binning(v) for v in values] == obj.bin_array(np.array(values)).tolist()
+    values = [-1, 0, 1, 2, 3, 5, 10, 12, 30, 3, 2, 1]
+    assert [binning(v) for v in values] == obj.bin_array(np.array(values)).tolist()
+
+def test_hits_misses():
+    binning = mock.Mock(side_effect=lambda v: v*10)
+    obj = Memoize(binning)
+    assert [10, 20, 10, 10, 15.0, 15.0, 20] == [obj(v) for v in (1, 2, 1, 1, 1.5, 1.5, np.int64(2))]
+    assert 3 == obj.nhits
+    assert 2 == obj.nmisses
+    # the floats are not looked up
+    assert [mock.call(1), mock.call(2), mock.call(1.5), mock.call(1.5)] == binning.call_args_list
+
+def test_maxsize():
+    binning = mock.Mock(side_effect=lambda v: v*10)
+    obj = Memoize(binning, maxsize=2)
+    assert [10, 20, 30, 30, 10] == [obj(v) for v in (1, 2, 3, 3, 1)]
+    assert 1 == obj.nhits
+    assert 4 == obj.nmisses
+    assert 2 == len(obj._table)
+
+def test_bin_array_hits_misses():
+    binning = Round(2, 0)
+    obj = Memoize(binning)
+    obj(1)
+    actual = obj.bin_array(np.array([1, 5, 5, 1, 7]))
+    assert [0, 4, 4, 0, 6] == actual.tolist()
+    assert 1 == obj.nhits # for each unique value
+    assert 3 == obj.nmisses
+    obj.bin_array(np.array([5, 7]))
+    assert 3 == obj.nhits
+    assert [4] == obj.bin_array(np.asarray(5)).tolist()
+
+def test_next_all_bins():
+    binning = Round(2, 0, min=0, max=10)
+    obj = Memoize(binning)
+    assert binning.next(2) == obj.next(2)
+    assert binning.all_bins() == obj.all_bins()
+
+def test_pickle():
+    obj = Memoize(Round(2, 0))
+    obj(3)
+    obj = pickle.loads(pickle.dumps(obj))
+    assert 2 == obj(3)
+    assert 1 == obj.nhits
+
+##__________________________________________________________________||
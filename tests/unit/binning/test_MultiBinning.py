@@ -0,0 +1,93 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import itertools
+
+import numpy as np
+import pytest
+
+from alphatwirl.binning import MultiBinning
+from alphatwirl.binning import Binning, Round, RoundLog
+
+##__________________________________________________________________||
+binnings = (
+    Binning(boundaries=(10, 20, 30)),
+    Round(1, 0, min=0, underflow_bin=-1, max=4, overflow_bin=True),
+    RoundLog(0.5, 1, min=1, max=100),
+)
+
+values = [
+    (15, 2.5, 3.0), (5, -3, 50), (25, 3.9, 99), (35, 10, 150),
+    (15, 2.5, 0.5), (20, 0, 1), (float('-inf'), 1, 10),
+]
+
+@pytest.fixture()
+def obj():
+    return MultiBinning(binnings)
+
+##__________________________________________________________________||
+def test_repr(obj):
+    repr(obj)
+
+def test_shape(obj):
+    assert (4, 6, 4) == obj.shape
+    assert 4*6*4 == obj.size
+
+def test_call(obj):
+    for vals in values:
+        key = tuple(b(v) for b, v in zip(binnings, vals))
+        if None in key:
+            assert obj(vals) is None
+            continue
+        index = obj(vals)
+        assert 0 <= index < obj.size
+        assert obj.index(key) == index
+        assert key == obj.key(index)
+
+def test_example():
+    obj = MultiBinning((Binning(boundaries=(10, 20, 30)), Round(1, 0, min=0, max=3)))
+    assert 7 == obj((25, 1.5))
+    assert (20, 1) == obj.key(7)
+
+def test_all_keys(obj):
+    keys = list(itertools.product(*[b.all_bins() for b in binnings]))
+    indices = [obj.index(k) for k in keys]
+    assert list(range(obj.size)) == indices
+    assert keys == [obj.key(i) for i in indices]
+    assert keys == list(zip(*[c.tolist() for c in obj.key_array(indices)]))
+
+def test_index_raise(obj):
+    with pytest.raises(KeyError):
+        obj.index((15, 1, 1))
+
+def test_index_array(obj):
+    keys = (
+        np.array([float('-inf'), 10, 20, 30, 20], dtype=object),
+        np.array([-1, -1, 1, 3, 1], dtype=object),
+        np.array([1, 10**0.5, 10, 10**1.5, 10], dtype=object),
+    )
+    indices = obj.index_array(keys)
+    assert np.int64 == indices.dtype
+    assert [obj.index(k) for k in zip(*keys)] == indices.tolist()
+    assert list(zip(*keys)) == list(zip(*obj.key_array(indices)))
+
+def test_call_batch(obj):
+    columns = tuple(np.array(c) for c in zip(*values))
+    indices, valid = obj.call_batch(columns)
+    expected = [obj(v) for v in values]
+    assert [e is not None for e in expected] == valid.tolist()
+    assert [0 if e is None else e for e in expected] == indices.tolist()
+
+def test_call_batch_empty(obj):
+    indices, valid = obj.call_batch(tuple(np.array([ ]) for _ in binnings))
+    assert [ ] == indices.tolist()
+    assert [ ] == valid.tolist()
+
+def test_no_binnings():
+    obj = MultiBinning(( ))
+    assert 0 == obj.index(( ))
+    assert ( ) == obj.key(0)
+
+def test_raise_too_many_bins():
+    with pytest.raises(ValueError):
+        MultiBinning((Binning(boundaries=range(2**16)), )*5)
+
+##__________________________________________________________________||
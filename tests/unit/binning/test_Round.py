@@ -1,8 +1,11 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import numbers
+import random
 import pytest
+import numpy as np
 
 from alphatwirl.binning import Round
+from alphatwirl.binning.search import binary_search
 
 ##__________________________________________________________________||
 def test_repr():
@@ -243,4 +246,83 @@ def test_inf():
     assert obj.next(float('inf')) is None
     assert obj.next(float('-inf')) is None
 
+def test_nan():
+    obj = Round(10, 100)
+    assert obj(float('nan')) is None
+    obj = Round(10, 100, min=30, underflow_bin=0, max=150, overflow_bin=True)
+    assert 0 == obj(float('nan')) # as not min <= nan
+
+##__________________________________________________________________||
+def test_all_bins():
+    obj = Round(10, 100, min=30, underflow_bin=0, max=150, overflow_bin=True)
+    assert (0, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150) == obj.all_bins()
+    for v in (-10, 25, 35, 100, 149, 150, 200):
+        assert obj(v) in obj.all_bins()
+
+def test_all_bins_none_underflow_overflow():
+    obj = Round(10, 0, min=30, max=60)
+    assert (0, 10, 20, 30, 40, 50) == obj.all_bins()
+
+@pytest.mark.parametrize('kwargs', [dict(), dict(min=30), dict(max=60)])
+def test_all_bins_raise_unbounded(kwargs):
+    obj = Round(10, 100, **kwargs)
+    with pytest.raises(ValueError):
+        obj.all_bins()
+
+##__________________________________________________________________||
+
+@pytest.mark.parametrize('width, aboundary', [(0.1, None), (0.2, 2.0), (0.02, 1.0), (3, None), (10, 100)])
+def test_same_as_binary_search(width, aboundary):
+    obj = Round(width, aboundary)
+    r = random.Random(1)
+    values = [r.uniform(-50, 50) for _ in range(500)]
+    values.extend(obj.boundaries)
+    for v in values:
+        actual = obj(v)
+        assert obj.boundaries[binary_search(v, obj.boundaries)] == actual
+        # on the boundaries
+        assert actual == obj(actual)
+
+@pytest.mark.parametrize('kwargs', [
+    dict(),
+    dict(width=0.1, aboundary=2.0),
+    dict(width=10, aboundary=100, min=30, underflow_bin=0, max=150, overflow_bin=True),
+    dict(width=0.2, aboundary=2.0, min=1.1, max=3.3),
+    dict(width=5, valid=lambda x: x >= 0),
+])
+def test_bin_array(kwargs):
+    r = random.Random(2)
+    values = [r.uniform(-200, 200) for _ in range(300)]
+    values.extend([-10, 0, 30, 100, 150, 2.0, 1.0, 1.1, 3.3, float('inf'), float('-inf'), float('nan')])
+    expected = [Round(**kwargs)(v) for v in values]
+    obj = Round(**kwargs)
+    actual = obj.bin_array(np.array(values))
+    assert object == actual.dtype
+    assert expected == actual.tolist()
+    assert [Round(**kwargs)(v) for v in range(-50, 50)] == obj.bin_array(np.arange(-50, 50)).tolist()
+    assert [ ] == obj.bin_array(np.array([ ])).tolist()
+    assert [obj(1.5)] == obj.bin_array(np.asarray(1.5)).tolist()
+    assert [obj(30)] == obj.bin_array(30).tolist()
+
+##__________________________________________________________________||
+def test_successors_bounded():
+    obj = Round(10, 100, min=30, underflow_bin=0, max=150, overflow_bin=True)
+    assert len(obj.all_bins()) == len(obj._successors)
+    assert 30 == obj._successors[0]
+    assert 40 == obj._successors[30]
+    assert 150 == obj._successors[140]
+    assert 150 == obj._successors[150]
+
+def test_successors_lazy():
+    obj = Round(0.1, 0)
+    assert { } == obj._successors
+    r = random.Random(4)
+    values = [r.uniform(-5, 5) for _ in range(300)]
+    nexts = [obj.next(v) for v in values]
+    assert nexts == [obj.next(v) for v in values]
+    assert len(obj._successors) < len(obj.boundaries)
+    for n, v in zip(nexts, values):
+        assert obj(v) < n
+        assert obj(n) == n
+
 ##__________________________________________________________________||
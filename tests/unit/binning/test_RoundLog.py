@@ -1,5 +1,6 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import numpy as np
+import random
 import functools
 import pytest
 
@@ -196,3 +197,56 @@ def test_profile():
     print(profile_func(functools.partial(to_be_profiled, obj, vals)))
 
 ##__________________________________________________________________||
+def test_all_bins():
+    obj = RoundLog(0.1, 100, min=10, underflow_bin=0, max=1000, overflow_bin=True)
+    bins = obj.all_bins()
+    assert 0 == bins[0]
+    assert obj.overflow_bin == bins[-1]
+    assert list(bins) == sorted(bins)
+    for v in (-1, 0, 5, 10, 12.5, 150, 990, 1000, 2000, float('inf')):
+        assert obj(v) in bins
+
+@pytest.mark.parametrize('kwargs', [dict(), dict(min=10), dict(max=1000)])
+def test_all_bins_raise_unbounded(kwargs):
+    obj = RoundLog(0.1, 100, **kwargs)
+    with pytest.raises(ValueError):
+        obj.all_bins()
+
+##__________________________________________________________________||
+@pytest.mark.parametrize('kwargs', [
+    dict(),
+    dict(width=0.1, aboundary=100),
+    dict(width=0.1, aboundary=100, min=10, underflow_bin=0, max=1000, overflow_bin=True),
+    dict(width=0.2, aboundary=1, min=1.1, max=3000),
+    dict(width=0.05, valid=lambda x: x < 500),
+])
+def test_bin_array(kwargs):
+    r = random.Random(3)
+    values = [10**r.uniform(-2, 4) for _ in range(300)]
+    values.extend([
+        -1, 0, 1, 1.1, 5, 10, 100, 1000, 3000, 10**1.1, 10**2.3, 10**-0.7,
+        float('inf'), float('-inf'), float('nan')
+    ])
+    obj = RoundLog(**kwargs)
+    expected = [RoundLog(**kwargs)(v) for v in values]
+    actual = obj.bin_array(np.array(values))
+    assert object == actual.dtype
+    assert expected == actual.tolist()
+    # on the edges
+    edges = [e for e in expected if isinstance(e, float) and e > 0 and e < float('inf')]
+    assert [obj(e) for e in edges] == obj.bin_array(np.array(edges)).tolist()
+    assert [obj(v) for v in range(-5, 2000, 7)] == obj.bin_array(np.arange(-5, 2000, 7)).tolist()
+    assert [obj(1.5)] == obj.bin_array(np.asarray(1.5)).tolist()
+    assert [obj(100)] == obj.bin_array(100).tolist()
+    assert [ ] == obj.bin_array(np.array([ ])).tolist()
+
+##__________________________________________________________________||
+def test_successors_bounded():
+    obj = RoundLog(0.1, 100, min=10, underflow_bin=0, max=1000, overflow_bin=True)
+    assert 20 == len(obj._successors)
+    bins = obj.all_bins()
+    assert list(bins[1:]) == [obj.next(b) for b in bins[:-1]]
+    assert obj.overflow_bin == obj.next(bins[-1])
+    assert 20 == len(obj._successors)
+
+##__________________________________________________________________||
@@ -59,6 +59,12 @@ def test_example(obj):
 
     assert expected == actual
 
+    obj.stream = True
+    actual = obj.combine(dataset_readers_list)
+    assert not isinstance(actual, list)
+    assert expected == list(actual)
+    assert expected == list(actual) # can iterate again
+
 def test_combine_oneReader(obj):
 
     reader1 = MockReader(
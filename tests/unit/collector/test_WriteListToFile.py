@@ -50,6 +50,30 @@ def test_deliver(obj, out):
 
     assert expected == out.getvalue()
 
+def test_deliver_stream(obj, out):
+    results = [
+        ('component', 'v1', 'nvar', 'n'),
+        ('data1',  100, 6.0,   40),
+        ('data1',    2, 9.0, 3.3),
+        ('data1', 3124, 3.0, 0.0000001),
+        ('data2',  333, 6.0, 300909234),
+        ('data2',   11, 2.0, 323432.2234),
+    ]
+
+    obj.block_size = 3
+    obj.deliver(iter(results))
+
+    # aligned in each block
+    expected = """ component  v1 nvar   n
+     data1 100    6  40
+     data1   2    9 3.3
+ data1 3124 3       1e-07
+ data2  333 6   300909234
+ data2   11 2 323432.2234
+""".encode()
+
+    assert expected == out.getvalue()
+
 def test_deliver_empty_dataframe(obj, out):
     results = [
         ('component', 'v1', 'nvar', 'n'),
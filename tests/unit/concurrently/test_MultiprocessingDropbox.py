@@ -13,6 +13,7 @@ except ImportError:
 from alphatwirl.concurrently import MultiprocessingDropbox
 from alphatwirl.concurrently import TaskPackage
 from alphatwirl import progressbar
+from alphatwirl import concurrently
 
 ##__________________________________________________________________||
 def test_init_raise():
@@ -260,3 +261,35 @@ def test_receive_one_then_poll(obj, package1, package2, package3, package4):
     assert sorted(expected) == sorted(actual)
 
 ##__________________________________________________________________||
+class MockMergeableResult(list):
+    def merge(self, other):
+        self.extend(other)
+
+class MockTaskPartial(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self):
+        assert concurrently.can_send_partial_result()
+        concurrently.send_partial_result(MockMergeableResult([(self.name, 1)]))
+        concurrently.send_partial_result(MockMergeableResult([(self.name, 2)]))
+        return MockMergeableResult([(self.name, 3)])
+
+def test_partial_results(obj, package1):
+    packages = [
+        TaskPackage(task=MockTaskPartial(name='task1'), args=( ), kwargs={ }),
+        package1,
+        TaskPackage(task=MockTaskPartial(name='task3'), args=( ), kwargs={ }),
+    ]
+    pkgidxs = obj.put_multiple(packages)
+    actual = obj.receive()
+    assert pkgidxs == [i for i, _ in actual]
+    assert [('task1', 1), ('task1', 2), ('task1', 3)] == actual[0][1]
+    assert [('task3', 1), ('task3', 2), ('task3', 3)] == actual[2][1]
+    assert { } == obj.partial_results()
+
+def test_partial_results_not_in_worker():
+    assert not concurrently.can_send_partial_result()
+    assert not concurrently.send_partial_result(MockMergeableResult())
+
+##__________________________________________________________________||
@@ -16,6 +16,11 @@ class MockDefaultSummary:
 class MockSummary2:
     pass
 
+class MockSummaryWithOutColumnNames:
+    @classmethod
+    def out_column_names(cls, valAttrNames):
+        return ('n', ) + tuple('{}_mean'.format(n) for n in valAttrNames)
+
 class MockWeight:
     pass
 
@@ -260,6 +265,32 @@ binning2 = MockBinning()
         ),
         id='summary-class-2-keys-2-vals-key-indices-val-indices'
     ),
+    pytest.param(
+        dict(
+            keyAttrNames=('key1', ),
+            binnings=(binning1, ),
+            valAttrNames=('val1', 'val2'),
+            summaryClass=MockSummaryWithOutColumnNames,
+            valIndices=(2, None),
+        ),
+        dict(
+            keyAttrNames=('key1', ),
+            keyIndices=None,
+            binnings=(binning1, ),
+            keyOutColumnNames=('key1', ),
+            valAttrNames=('val1', 'val2'),
+            valIndices=(2, None),
+            summaryClass=MockSummaryWithOutColumnNames,
+            valOutColumnNames=('n', 'val1_mean', 'val2_mean'),
+            weight=defaultWeight,
+            sort=True,
+            nevents=None,
+            outFile=True,
+            outFileName='tbl_MockSummaryWithOutColumnNames.key1.val1-2.val2.txt',
+            outFilePath='tmp/tbl_MockSummaryWithOutColumnNames.key1.val1-2.val2.txt',
+        ),
+        id='summary-class-out-column-names'
+    ),
 ])
 def test_complete(obj, arg, expected):
     actual = obj.complete(arg)
@@ -267,3 +298,10 @@ def test_complete(obj, arg, expected):
     assert arg is not actual
 
 ##__________________________________________________________________||
+def test_complete_keyColumnCache():
+    keyColumnCache = mock.sentinel.keyColumnCache
+    obj = TableConfigCompleter(defaultOutDir='tmp', keyColumnCache=keyColumnCache)
+    assert keyColumnCache is obj.complete(dict(keyAttrNames=('key1', )))['keyColumnCache']
+    assert obj.complete(dict(keyColumnCache=None))['keyColumnCache'] is None
+
+##__________________________________________________________________||
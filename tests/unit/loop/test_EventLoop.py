@@ -7,8 +7,10 @@ try:
 except ImportError:
     import mock
 
-from alphatwirl.loop import EventLoop
+import alphatwirl
+from alphatwirl.loop import EventLoop, ReaderComposite
 from alphatwirl import progressbar
+from alphatwirl.selection.modules import All, Not, AllwCount
 
 ##__________________________________________________________________||
 @pytest.fixture(params=[0, 3])
@@ -81,3 +83,105 @@ def test_report_progress(obj, report_progress, ProgressReport):
     assert expected[0] == actual[0]
 
 ##__________________________________________________________________||
+class MockReaderDone(object):
+    def __init__(self, nevents):
+        self.nevents = nevents
+        self.events = [ ]
+        self.ended = False
+
+    def begin(self, events):
+        pass
+
+    def event(self, event):
+        self.events.append(event)
+
+    def is_done(self):
+        return self.nevents <= len(self.events)
+
+    def end(self):
+        self.ended = True
+
+@pytest.mark.parametrize('nevents', [0, 1, 3, 5])
+def test_is_done(build_events, events, report_progress, ProgressReport, nevents):
+    reader = MockReaderDone(nevents)
+    obj = EventLoop(build_events, reader)
+    assert reader is obj()
+    assert events[:nevents] == reader.events
+    assert reader.ended
+    last = mock.call(ProgressReport(taskid=obj.taskid, name='EventLoop', done=len(events), total=len(events)))
+    assert last == report_progress.call_args_list[-1]
+
+@pytest.mark.parametrize('Class, pass_', [
+    (lambda s: All(selections=[s]), True),
+    (lambda s: Not(s), False),
+])
+def test_is_done_nested_count(Class, pass_):
+    # the counts of the selections are not truncated
+    events = [mock.Mock(name='event{}'.format(i)) for i in range(5)]
+    allwcount = AllwCount(selections=[lambda e: pass_])
+    reader = ReaderComposite([Class(allwcount), MockReaderDone(1)])
+    obj = EventLoop(lambda: events, reader)
+    obj()
+    assert 5 == allwcount.results().results()[0][-1]
+
+##__________________________________________________________________||
+class MockEventWithVal(object):
+    def __init__(self, ievent, val):
+        self.iEvent = ievent
+        self.val = [val]
+
+def build_reader():
+    ret = ReaderComposite()
+    for i in range(2):
+        ret.add(alphatwirl.summary.Reader(
+            keyValComposer=alphatwirl.summary.KeyValueComposer(
+                keyAttrNames=('val', ),
+                binnings=(alphatwirl.binning.Round(1 + i, 0), )
+            ),
+            summarizer=alphatwirl.summary.Summarizer(Summary=alphatwirl.summary.Count),
+            nextKeyComposer=alphatwirl.summary.NextKeyComposer((alphatwirl.binning.Round(1 + i, 0), ))
+        ))
+    return ret
+
+@pytest.fixture()
+def partial_results(monkeypatch):
+    ret = [ ]
+    monkeypatch.setattr(alphatwirl.concurrently, '_partial_result_sender', ret.append)
+    return ret
+
+@pytest.mark.parametrize('delta_nevents', [1, 3, 7, 100])
+def test_delta(partial_results, delta_nevents):
+    events = [MockEventWithVal(i, (i*7) % 11) for i in range(20)]
+
+    expected = EventLoop(lambda : events, build_reader())()
+
+    reader = build_reader()
+    obj = EventLoop(lambda : events, reader, delta_nevents=delta_nevents)
+    result = obj()
+    assert len(events)//delta_nevents == len(partial_results)
+    for p in partial_results:
+        # only the summarizers are copied
+        for r, d in zip(reader.readers, p.readers):
+            assert r.keyValComposer is d.keyValComposer
+            assert r.summarizer is not d.summarizer
+    if partial_results:
+        merged = partial_results[0]
+        for r in partial_results[1:] + [result]:
+            merged.merge(r)
+    else:
+        merged = result
+    for e, a in zip(expected.readers, merged.readers):
+        assert e.summarizer.to_tuple_list() == a.summarizer.to_tuple_list()
+
+def test_delta_seconds(partial_results):
+    events = [MockEventWithVal(i, i) for i in range(5)]
+    obj = EventLoop(lambda : events, build_reader(), delta_seconds=0)
+    obj()
+    assert 5 == len(partial_results)
+
+def test_delta_no_channel(build_events, reader):
+    obj = EventLoop(build_events, reader, delta_nevents=1)
+    obj()
+    assert 'delta' not in [c[0] for c in reader.method_calls]
+
+##__________________________________________________________________||
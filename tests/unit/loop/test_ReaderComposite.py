@@ -163,6 +163,56 @@ def test_no_begin_end(obj):
     assert [mock.call()] == reader1.end.call_args_list
     assert [mock.call()] == reader3.end.call_args_list
 
+##__________________________________________________________________||
+def test_is_done(obj):
+    """
+    composite
+        |- reader1
+        |- reader2
+    """
+    reader1 = mock.Mock()
+    reader2 = mock.Mock()
+    obj.add(reader1)
+    obj.add(reader2)
+
+    reader1.is_done.return_value = True
+    reader2.is_done.return_value = False
+    assert obj.is_done() is False
+
+    reader2.is_done.return_value = True
+    assert obj.is_done() is True
+
+    reader1.is_done.return_value = mock.Mock() # not True
+    assert obj.is_done() is False
+
+def test_is_done_no_is_done(obj):
+    reader1 = mock.Mock()
+    del reader1.is_done
+    obj.add(reader1)
+    assert obj.is_done() is False
+
+def test_is_done_empty(obj):
+    assert obj.is_done() is True
+
+def test_clear(obj):
+    reader1 = mock.Mock()
+    reader2 = mock.Mock()
+    del reader2.clear
+    obj.add(reader1)
+    obj.add(reader2)
+    obj.clear()
+    assert [mock.call()] == reader1.clear.call_args_list
+
+def test_delta(obj):
+    reader1 = mock.Mock()
+    reader2 = mock.Mock()
+    del reader2.delta
+    obj.add(reader1)
+    obj.add(reader2)
+    delta = obj.delta()
+    assert delta is not obj
+    assert [reader1.delta(), reader2] == delta.readers
+
 ##__________________________________________________________________||
 def test_merge(obj):
     """
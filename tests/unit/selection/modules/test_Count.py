@@ -138,6 +138,14 @@ def test_one(obj, sel1):
         [1, 'MockEventSelection', 'sel1', 1, 2],
     ] == obj._results
 
+def test_clear(obj, sel1):
+    obj.add(sel1)
+    obj.count(pass_=[True])
+    obj.clear()
+    assert [
+        [1, 'MockEventSelection', 'sel1', 0, 0],
+    ] == obj._results
+
 def test_three(obj, sel1, sel2, sel3):
     obj.add(sel1)
     obj.add(sel2)
@@ -180,3 +180,40 @@ def test_not_call(Class):
     obj.end()
 
 ##__________________________________________________________________||
+@pytest.mark.parametrize('Class', [All, Any])
+def test_allany_is_done(Class):
+    sel1 = mock.Mock(spec=['__call__', 'is_done'])
+    sel2 = mock.Mock(spec=['__call__', 'is_done'])
+    obj = Class(selections=[sel1, sel2])
+
+    sel1.is_done.return_value = True
+    sel2.is_done.return_value = False
+    assert not obj.is_done()
+
+    sel2.is_done.return_value = True
+    assert obj.is_done()
+
+@pytest.mark.parametrize('Class', [All, Any])
+def test_allany_is_done_no_is_done(Class):
+    sel1 = mock.Mock(spec=['__call__'])
+    sel2 = mock.Mock(spec=['__call__', 'is_done'])
+    sel2.is_done.return_value = True
+    obj = Class(selections=[sel1, sel2])
+    assert not obj.is_done()
+
+@pytest.mark.parametrize('Class', [All, Any])
+def test_allany_is_done_empty(Class):
+    assert Class().is_done()
+
+def test_not_is_done():
+    sel1 = mock.Mock(spec=['__call__'])
+    assert not Not(sel1).is_done()
+
+    sel1 = mock.Mock(spec=['__call__', 'is_done'])
+    sel1.is_done.return_value = False
+    assert not Not(sel1).is_done()
+
+    sel1.is_done.return_value = True
+    assert Not(sel1).is_done()
+
+##__________________________________________________________________||
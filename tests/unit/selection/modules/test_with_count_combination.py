@@ -165,3 +165,51 @@ def test_merge():
     ] == count._results
 
 ##__________________________________________________________________||
+def test_delta():
+
+    tree = mk_tree()
+    all0 = tree['alls'][0]
+    sels = tree['sels']
+
+    event = mock.Mock()
+    all0.begin(event)
+
+    all_possible_results = list(itertools.product(*[[True, False]]*len(sels)))
+
+    results1 = all_possible_results[:len(all_possible_results)//2]
+    results2 = all_possible_results[len(all_possible_results)//2:]
+
+    for l in results1:
+        for sel, ret in zip(sels, l):
+            sel.return_value = ret
+        all0(event)
+
+    delta = all0.delta()
+    assert 16 == delta.results()._results[0][-1]
+    assert 0 == all0.results()._results[0][-1]
+    assert delta.selections[0] is not all0.selections[0]
+
+    for l in results2:
+        for sel, ret in zip(sels, l):
+            sel.return_value = ret
+        all0(event)
+
+    all0.end()
+
+    delta.merge(all0)
+
+    count = delta.results()
+    assert [
+        [1,          'AllwCount', 'all1',  3, 32],
+        [2,          'AllwCount', 'all2',  8, 32],
+        [3, 'MockEventSelection', 'sel1', 16, 32],
+        [3, 'MockEventSelection', 'sel2',  8, 16],
+        [2 ,         'NotwCount', 'not1',  3,  8],
+        [3,          'AnywCount', 'any1',  5,  8],
+        [4,          'AllwCount', 'all3',  2,  8],
+        [5, 'MockEventSelection', 'sel3',  4,  8],
+        [5, 'MockEventSelection', 'sel4',  2,  4],
+        [4, 'MockEventSelection', 'sel5',  3,  6]
+    ] == count._results
+
+##__________________________________________________________________||
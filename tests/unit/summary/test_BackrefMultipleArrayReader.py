@@ -1,5 +1,6 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 from __future__ import print_function
+import numpy as np
 import pytest
 
 try:
@@ -9,6 +10,18 @@ except ImportError:
 
 from alphatwirl.summary import BackrefMultipleArrayReader
 
+##__________________________________________________________________||
+def to_jagged(arrays):
+    contents = np.array([e for a in arrays for e in a], dtype=np.int64)
+    offsets = np.cumsum([0] + [len(a) for a in arrays])
+    return contents, offsets
+
+def expected_batch(data):
+    return [(i, ) + r for i, d in enumerate(data) for r in d['expected']]
+
+def to_rows(entries, values):
+    return list(zip(entries.tolist(), *[v.tolist() for v in values]))
+
 ##__________________________________________________________________||
 @pytest.mark.parametrize('kwargs', (
     dict(arrays=[[ ] ], idxs_conf=( )),
@@ -143,6 +156,14 @@ def test_read_without_backref(arrays, idxs_conf, data):
             a[:] = c
         assert expected == obj.read()
 
+@pytest.mark.parametrize('arrays, idxs_conf, data', params_without_backref)
+def test_read_batch_without_backref(arrays, idxs_conf, data):
+    batch_arrays = [to_jagged([d['arrays'][i] for d in data]) for i in range(len(arrays))]
+    obj = BackrefMultipleArrayReader(
+        arrays=batch_arrays, idxs_conf=idxs_conf)
+    entries, values = obj.read_batch(nevents=len(data))
+    assert expected_batch(data) == to_rows(entries, values)
+
 @pytest.mark.skip(reason='for optimizing for speed')
 @pytest.mark.parametrize('arrays, idxs_conf, data', params_without_backref[-1:])
 def test_read_without_backref_measure_time(arrays, idxs_conf, data):
@@ -214,6 +235,36 @@ def test_read_backref(arrays, idxs_conf, backref_idxs, data):
             a[:] = c
         assert expected == obj.read()
 
+@pytest.mark.parametrize('arrays, idxs_conf, backref_idxs, data', params_backref)
+def test_read_batch_backref(arrays, idxs_conf, backref_idxs, data):
+    batch_arrays = [to_jagged([d['arrays'][i] for d in data]) for i in range(len(arrays))]
+    obj = BackrefMultipleArrayReader(
+        arrays=batch_arrays, idxs_conf=idxs_conf, backref_idxs=backref_idxs)
+    entries, values = obj.read_batch()
+    assert expected_batch(data) == to_rows(entries, values)
+
+def test_read_backref_plans_reused():
+    arrays = [[ ], [ ]]
+    obj = BackrefMultipleArrayReader(
+        arrays=arrays, idxs_conf=('*', None), backref_idxs=[None, 0])
+    for a0, a1, expected in (
+            ([12, 13], [104, 105], ((12, 104), (13, 105))),
+            ([12], [104, 105], ((12, 104), )),
+            ([22, 23], [204, 205, 206], ((22, 204), (23, 205))),
+    ):
+        arrays[0][:] = a0
+        arrays[1][:] = a1
+        assert expected == obj.read()
+    assert 2 == len(obj._plans)
+
+def test_read_batch_flat_arrays():
+    obj = BackrefMultipleArrayReader(
+        arrays=[np.array([1001, 1002, 1003]), (np.array([12, 13, 14]), np.array([0, 2, 2, 3]))],
+        idxs_conf=(0, '*'))
+    entries, values = obj.read_batch()
+    np.testing.assert_equal([0, 0, 2], entries)
+    np.testing.assert_equal([[1001, 1001, 1003], [12, 13, 14]], values)
+
 @pytest.mark.skip(reason='for optimizing for speed')
 @pytest.mark.parametrize('arrays, idxs_conf, backref_idxs, data', params_backref[-1:])
 def test_read_backref_measure_time(arrays, idxs_conf, backref_idxs, data):
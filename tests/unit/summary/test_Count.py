@@ -1,6 +1,7 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import numpy as np
 import copy
+import pickle
 
 import pytest
 
@@ -38,6 +39,42 @@ def test_add():
     assert obj2 is not obj3
     assert obj2.contents is not obj3.contents
 
+def test_iadd():
+    obj1 = Count(contents=[np.array((10, 20))])
+    obj2 = Count(contents=[np.array((30, 40))])
+    obj3 = obj1
+    obj3 += obj2
+    assert obj1 is obj3
+    np.testing.assert_equal([np.array([40, 60])], obj1.contents)
+    np.testing.assert_equal([np.array([30, 40])], obj2.contents)
+
+def test_iadd_float_in_place():
+    obj1 = Count()
+    contents = obj1.contents[0]
+    obj1 += Count(contents=[np.array((1.5, 2.25))])
+    obj1 += Count(contents=[np.array((2, 4))])
+    assert contents is obj1.contents[0]
+    np.testing.assert_equal([np.array([3.5, 6.25])], obj1.contents)
+
+@pytest.mark.parametrize('val, weight, expected', (
+    (None, 1, [np.array([10, 20])]),
+    ((), 1, [np.array([11, 21])]),
+    ((), 2.5, [np.array([12.5, 26.25])]),
+))
+def test_accumulate(val, weight, expected):
+    obj = Count(contents=[np.array((10, 20))])
+    obj.accumulate(val, weight)
+    np.testing.assert_equal(expected, obj.contents)
+    assert obj == Count(contents=[np.array((10, 20))]) + Count(val, weight)
+
+def test_accumulate_in_place():
+    obj = Count()
+    contents = obj.contents[0]
+    for w in (1, 2, 0.5):
+        obj.accumulate((), w)
+    assert contents is obj.contents[0]
+    np.testing.assert_equal([np.array([3.5, 5.25])], obj.contents)
+
 def test_radd():
     obj1 = Count(contents=[np.array((10, 20))])
     assert obj1 is not sum([obj1]) # will call 0 + obj1
@@ -57,3 +94,15 @@ def test_copy():
     assert obj1.contents[0] is not copy1.contents[0]
 
 ##__________________________________________________________________||
+@pytest.mark.parametrize('contents', [
+    [np.array((10.5, 20.25))],
+    [np.array((10, 20))],
+    [np.array((1, 2)), np.array((3, ))],
+])
+def test_pickle(contents):
+    obj1 = Count(contents=contents)
+    obj2 = pickle.loads(pickle.dumps(obj1, protocol=pickle.HIGHEST_PROTOCOL))
+    assert obj1 == obj2
+    assert [c.dtype for c in obj1.contents] == [c.dtype for c in obj2.contents]
+
+##__________________________________________________________________||
@@ -0,0 +1,144 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import numpy as np
+import pytest
+
+from alphatwirl.binning import Binning, Round
+from alphatwirl.summary import DenseSummarizer
+from alphatwirl.summary import Summarizer
+from alphatwirl.summary import Count, Sum, Scan
+
+##__________________________________________________________________||
+binnings = (
+    Binning(boundaries=(10, 20, 30, 40)),
+    Round(1, 0, min=0, underflow_bin=-1, max=4, overflow_bin=True),
+)
+
+fills = [
+    dict(key=(10, 2), val=(12.5, 3.0), weight=1),
+    dict(key=(30, 2), val=(1.5, 2.0), weight=2.5),
+    dict(key=(10, 2), val=(4.0, 1.0), weight=0.5),
+    dict(key=(float('-inf'), -1), val=(3.0, 8.0), weight=1),
+    dict(key=(40, 4), val=(2.0, 1.0), weight=1),
+]
+
+added_keys = [(20, 0), (10, 2)]
+
+def fill(obj):
+    for f in fills:
+        obj.add(**f)
+    for k in added_keys:
+        obj.add_key(k)
+
+@pytest.fixture(params=[Count, Sum])
+def Summary(request):
+    return request.param
+
+##__________________________________________________________________||
+def test_repr():
+    obj = DenseSummarizer(Summary=Count, binnings=binnings)
+    repr(obj)
+
+def test_init_raise_summary():
+    with pytest.raises(ValueError):
+        DenseSummarizer(Summary=Scan, binnings=binnings)
+
+def test_init_raise_unbounded():
+    with pytest.raises(ValueError):
+        DenseSummarizer(Summary=Count, binnings=(Round(), ))
+
+def test_empty(Summary):
+    obj = DenseSummarizer(Summary=Summary, binnings=binnings)
+    assert [ ] == obj.keys()
+    assert [ ] == obj.to_tuple_list()
+
+def test_clear(Summary):
+    obj = DenseSummarizer(Summary=Summary, binnings=binnings)
+    fill(obj)
+    obj.clear()
+    assert [ ] == obj.keys()
+    assert [ ] == obj.to_tuple_list()
+    fill(obj)
+    expected = DenseSummarizer(Summary=Summary, binnings=binnings)
+    fill(expected)
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+##__________________________________________________________________||
+def test_same_as_summarizer(Summary):
+    obj = DenseSummarizer(Summary=Summary, binnings=binnings)
+    fill(obj)
+
+    expected = Summarizer(Summary=Summary)
+    fill(expected)
+
+    assert sorted(expected.keys()) == sorted(obj.keys())
+    assert expected.results() == obj.results()
+    np.testing.assert_equal(expected.to_key_vals_dict(), obj.to_key_vals_dict())
+    assert list(expected.to_key_vals_dict()) == list(obj.to_key_vals_dict())
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_batch(Summary):
+    obj = DenseSummarizer(Summary=Summary, binnings=binnings)
+    obj.add(**fills[0])
+    keys = tuple(np.array(k, dtype=object) for k in zip(*[f['key'] for f in fills]))
+    vals = tuple(np.array(v) for v in zip(*[f['val'] for f in fills]))
+    weights = np.array([f['weight'] for f in fills])
+    obj.add_batch(keys, vals, weights)
+
+    expected = Summarizer(Summary=Summary)
+    expected.add(**fills[0])
+    for f in fills:
+        expected.add(**f)
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_index(Summary):
+    obj = DenseSummarizer(Summary=Summary, binnings=binnings)
+    for f in fills:
+        obj.add_index(obj.multiBinning.index(f['key']), f['val'], f['weight'])
+    indices = obj.multiBinning.index_array(tuple(np.array(k, dtype=object) for k in zip(*[f['key'] for f in fills])))
+    vals = tuple(np.array(v) for v in zip(*[f['val'] for f in fills]))
+    weights = np.array([f['weight'] for f in fills])
+    obj.add_index_batch(indices, vals, weights)
+
+    expected = Summarizer(Summary=Summary)
+    for f in fills*2:
+        expected.add(**f)
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_key_only_sum():
+    obj = DenseSummarizer(Summary=Sum, binnings=binnings)
+    obj.add_key((20, 0))
+    expected = Summarizer(Summary=Sum)
+    expected.add_key((20, 0))
+    np.testing.assert_equal(expected.to_key_vals_dict(), obj.to_key_vals_dict())
+
+##__________________________________________________________________||
+def test_operators(Summary):
+    obj1 = DenseSummarizer(Summary=Summary, binnings=binnings)
+    fill(obj1)
+    obj2 = DenseSummarizer(Summary=Summary, binnings=binnings)
+    obj2.add((20, 3), (1.0, 1.0))
+    obj3 = DenseSummarizer(Summary=Summary, binnings=binnings)
+
+    exp1 = Summarizer(Summary=Summary)
+    fill(exp1)
+    exp2 = Summarizer(Summary=Summary)
+    exp2.add((20, 3), (1.0, 1.0))
+    exp3 = Summarizer(Summary=Summary)
+
+    assert (exp1 + exp2).to_tuple_list() == (obj1 + obj2).to_tuple_list()
+    assert sum([exp1, exp2, exp3]).to_tuple_list() == sum([obj1, obj2, obj3]).to_tuple_list()
+    assert (exp3 + exp1).to_tuple_list() == (obj3 + obj1).to_tuple_list()
+
+    copy1 = copy.copy(obj1)
+    assert copy1._contents is not obj1._contents
+    assert exp1.to_tuple_list() == copy1.to_tuple_list()
+
+    obj1 += obj2
+    exp1 += exp2
+    assert exp1.to_tuple_list() == obj1.to_tuple_list()
+    assert exp1.to_tuple_list() != copy1.to_tuple_list()
+
+##__________________________________________________________________||
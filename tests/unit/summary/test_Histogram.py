@@ -0,0 +1,136 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from alphatwirl.summary import Histogram, Summarizer, PackedSummarizer
+from alphatwirl.summary import merge_summarizers
+from alphatwirl.binning import Round
+
+##__________________________________________________________________||
+class HistX(Histogram):
+    boundaries = (0, 10, 20)
+
+vals = [(5.0, ), (-1.0, ), (10.0, ), (25.0, ), (float('nan'), ), (12.0, ), (20.0, )]
+weights = [1.0, 2.0, 0.5, 1.5, 3.0, 2.0, 1.0]
+
+expected_contents = np.array([
+    2.0, 4.0,   # underflow
+    1.0, 1.0,   # [0, 10)
+    2.5, 4.25,  # [10, 20)
+    2.5, 3.25,  # overflow
+])
+
+##__________________________________________________________________||
+def test_repr():
+    obj = HistX()
+    repr(obj)
+
+def test_init():
+    obj = HistX()
+    np.testing.assert_equal([np.zeros(8)], obj.contents)
+
+def test_init_raise():
+    with pytest.raises(ValueError):
+        Histogram()
+
+def test_init_val():
+    obj = HistX(val=(15, ), weight=2)
+    np.testing.assert_equal([np.array([0, 0, 0, 0, 2, 4, 0, 0])], obj.contents)
+
+def test_out_column_names():
+    assert ('x', 'n', 'nvar') == HistX.out_column_names(('x', ))
+
+def test_accumulate():
+    obj = HistX()
+    for v, w in zip(vals, weights):
+        obj.accumulate(v, w)
+    obj.accumulate(None)
+    np.testing.assert_equal(expected_contents, obj.contents[0])
+
+def test_batch_contents():
+    contents = HistX.batch_contents((np.array([v[0] for v in vals]), ), weights)
+    assert (len(vals), 8) == contents.shape
+    np.testing.assert_equal(expected_contents, contents.sum(axis=0))
+
+def test_add():
+    obj1 = HistX(val=(5, ), weight=2)
+    obj2 = HistX(val=(15, ))
+    expected = [np.array([0, 0, 2, 4, 1, 1, 0, 0])]
+    np.testing.assert_equal(expected, (obj1 + obj2).contents)
+    np.testing.assert_equal(expected, sum([obj1, obj2]).contents)
+    obj1 += obj2
+    np.testing.assert_equal(expected, obj1.contents)
+
+def test_copy():
+    obj = HistX(val=(5, ))
+    copy1 = copy.copy(obj)
+    assert obj == copy1
+    assert obj.contents[0] is not copy1.contents[0]
+
+def test_expand_contents():
+    expected = [
+        (float('-inf'), 2.0, 4.0),
+        (0, 1.0, 1.0),
+        (10, 2.5, 4.25),
+        (20, 2.5, 3.25),
+    ]
+    actual = HistX.expand_contents([expected_contents])
+    assert expected == [tuple(r) for r in actual]
+
+##__________________________________________________________________||
+@pytest.fixture(params=[Summarizer, PackedSummarizer])
+def create_summarizer(request):
+    if request.param is PackedSummarizer:
+        return lambda : PackedSummarizer(Summary=HistX, binnings=(Round(1, 0, min=0, max=4), ))
+    return lambda : Summarizer(Summary=HistX)
+
+def test_summarizer(create_summarizer):
+    obj = create_summarizer()
+    obj.add((2, ), (5.0, ), weight=2)
+    obj.add((1, ), (15.0, ))
+    obj.add((2, ), (-3.0, ))
+    obj.add_key((3, ))
+    expected = [
+        (1, float('-inf'), 0, 0), (1, 0, 0, 0), (1, 10, 1, 1), (1, 20, 0, 0),
+        (2, float('-inf'), 1, 1), (2, 0, 2, 4), (2, 10, 0, 0), (2, 20, 0, 0),
+        (3, float('-inf'), 0, 0), (3, 0, 0, 0), (3, 10, 0, 0), (3, 20, 0, 0),
+    ]
+    assert expected == obj.to_tuple_list()
+    assert expected == list(obj.to_tuple_iter())
+
+def test_summarizer_add_batch(create_summarizer):
+    keys = (np.array([2, 1, 2, 1, 2, 1, 3]), )
+    vals_ = (np.array([v[0] for v in vals]), )
+
+    obj = create_summarizer()
+    obj.add_batch(keys, vals_, weights)
+
+    expected = create_summarizer()
+    for k, v, w in zip(zip(*keys), vals, weights):
+        expected.add(k, v, w)
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_summarizer_merge_pickle(create_summarizer):
+    obj1 = create_summarizer()
+    obj1.add((2, ), (5.0, ), weight=2)
+    obj1.add_key((3, ))
+    obj2 = create_summarizer()
+    obj2.add((2, ), (15.0, ))
+    obj2.add((1, ), (25.0, ))
+
+    expected = create_summarizer()
+    for o in (obj1, obj2):
+        for k, v in o.results().items():
+            expected.add_key(k)
+    expected.add((2, ), (5.0, ), weight=2)
+    expected.add((2, ), (15.0, ))
+    expected.add((1, ), (25.0, ))
+
+    merged = merge_summarizers([obj1, obj2])
+    assert expected.to_tuple_list() == merged.to_tuple_list()
+    assert expected.to_tuple_list() == pickle.loads(pickle.dumps(merged)).to_tuple_list()
+
+##__________________________________________________________________||
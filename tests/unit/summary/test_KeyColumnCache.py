@@ -0,0 +1,133 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import math
+import pickle
+
+import pytest
+
+from alphatwirl.summary import KeyColumnCache, KeyValueComposer
+
+##__________________________________________________________________||
+class MockEvent(object):
+    pass
+
+class MockBinningFloor(object):
+    def __init__(self, max=None):
+        self.max = max
+        self.ncalls = 0
+
+    def __call__(self, val):
+        self.ncalls += 1
+        if self.max is not None and not val <= self.max:
+            return None
+        return int(math.floor(val))
+
+contents = dict(
+    ev=[[1001], [1002], [1003]],
+    jet_pt=[[15.3, 12.9, 9.2, 10.5], [ ], [22.1]],
+    jet_eta=[[-1.2, 5.2, 2.2, 0.5], [ ], [0.3]],
+    mu_pt=[[20.2, 11.9, 13.3, 5.2], [14.2], [31.9]],
+    mu_eta=[[2.2, 1.2, -1.5, -0.5], [0.2], [-2.7]],
+    muon_energy=[[22.1, 15.2, 16.3], [18.0], [35.0]],
+)
+
+def create_event():
+    ret = MockEvent()
+    for k in contents:
+        setattr(ret, k, [ ])
+    return ret
+
+def fill_event(event, i):
+    for k, v in contents.items():
+        getattr(event, k)[:] = v[i]
+    event.iEvent = i
+
+def create_composers(binnings, keyColumnCache):
+    floor = binnings['floor']
+    ret = [
+        KeyValueComposer(
+            keyAttrNames=('ev', 'jet_pt', 'jet_eta', 'mu_pt'),
+            binnings=(floor, floor, binnings['floor3'], floor),
+            keyIndices=(None, '(*)', '\\1', 0),
+            keyColumnCache=keyColumnCache,
+        ),
+        KeyValueComposer(
+            keyAttrNames=('jet_pt', 'mu_pt', 'mu_eta'),
+            binnings=(floor, floor, floor),
+            keyIndices=('*', '(*)', '\\1'),
+            valAttrNames=('muon_energy', ),
+            valIndices=('\\1', ),
+            keyColumnCache=keyColumnCache,
+        ),
+        KeyValueComposer(
+            keyAttrNames=('mu_pt', ),
+            binnings=(floor, ),
+            keyIndices=(1, ),
+            keyColumnCache=keyColumnCache,
+        ),
+    ]
+    return ret
+
+@pytest.fixture()
+def binnings():
+    return dict(floor=MockBinningFloor(), floor3=MockBinningFloor(max=3))
+
+def read(composers, event):
+    ret = [ ]
+    for composer in composers:
+        composer.begin(event)
+    for i in range(3):
+        fill_event(event, i)
+        ret.append([composer(event) for composer in composers])
+    return ret
+
+##__________________________________________________________________||
+def test_repr():
+    obj = KeyColumnCache()
+    repr(obj)
+
+def test_same_as_without_cache(binnings):
+    obj = KeyColumnCache()
+    expected = read(create_composers(binnings, None), create_event())
+    actual = read(create_composers(binnings, obj), create_event())
+    assert expected == actual
+    assert expected[0][2] == (((11, ), ()), )
+    assert expected[1][2] == ( )
+
+def test_shared(binnings):
+    obj = KeyColumnCache()
+    read(create_composers(binnings, obj), create_event())
+
+    # ('ev', 0), ('jet_pt', '*'), ('jet_eta', '*'), ('mu_pt', 0),
+    # ('mu_pt', '*'), ('mu_eta', '*'), ('mu_pt', 1)
+    assert 7*3 == obj.nmisses
+    assert 3 == obj.nhits # ('jet_pt', '*')
+
+    # each element is binned once for each column
+    # ev, jet_pt, mu_pt[0], mu_pt, mu_eta, mu_pt[1]
+    assert 3 + 5 + 3 + 6 + 6 + 1 == binnings['floor'].ncalls
+
+def test_without_iEvent(binnings):
+    obj = KeyColumnCache()
+    composers = create_composers(binnings, obj)
+    event = create_event()
+    for composer in composers:
+        composer.begin(event)
+    fill_event(event, 0)
+    del event.iEvent
+    first = [composer(event) for composer in composers]
+    fill_event(event, 1)
+    del event.iEvent
+    assert first != [composer(event) for composer in composers]
+    assert 0 == obj.nhits
+
+def test_copy(binnings):
+    obj = KeyColumnCache()
+    composers = create_composers(binnings, obj)
+    for copied in (copy.deepcopy(composers), pickle.loads(pickle.dumps(composers))):
+        assert copied[0].keyColumnCache is copied[1].keyColumnCache
+        assert copied[0].keyColumnCache is not obj
+        expected = read(create_composers(binnings, None), create_event())
+        assert expected == read(copied, create_event())
+
+##__________________________________________________________________||
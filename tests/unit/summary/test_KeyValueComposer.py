@@ -1,6 +1,7 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import logging
 import math
+import numpy as np
 import pytest
 
 try:
@@ -14,6 +15,13 @@ from alphatwirl.summary import KeyValueComposer
 class MockEvent(object):
     pass
 
+class MockBatch(object):
+    def __init__(self, nevents):
+        self.nevents = nevents
+
+    def __len__(self):
+        return self.nevents
+
 class MockBinningEcho(object):
     def __call__(self, val):
         return val
@@ -311,3 +319,63 @@ def test_example_back_reference_twice():
     ) == obj(event)
 
 ##__________________________________________________________________||
+def test_call_batch_back_reference_twice():
+    obj = KeyValueComposer(
+        keyAttrNames=('ev', 'jet_pt', 'jet_eta', 'mu_pt', 'mu_eta', 'jet_phi'),
+        binnings=(
+            MockBinningFloor(),
+            MockBinningFloor(),
+            MockBinningFloor(max=3), # <- use max for jet_eta
+            MockBinningFloor(),
+            MockBinningFloor(max=2), # <- use max for mu_eta
+            MockBinningEcho(),
+        ),
+        keyIndices=(None, '(*)', '\\1', '(*)', '\\2', '\\1'),
+        valAttrNames=('jet_energy', 'muon_energy'),
+        valIndices=('\\1', '\\2'),
+    )
+
+    contents = dict(
+        ev=[[1001], [1002], [1003]],
+        jet_pt=[[15.3, 12.9, 9.2, 10.5], [ ], [22.1]],
+        jet_eta=[[-1.2, 5.2, 2.2, 0.5], [ ], [0.3]],
+        jet_phi=[[0.1, 0.6, 1.2], [ ], [2.1]],
+        jet_energy=[[16.2, 13.1, 10.1, 11.8], [ ], [30.5]],
+        mu_pt=[[20.2, 11.9, 13.3, 5.2], [14.2], [31.9]],
+        mu_eta=[[2.2, 1.2, -1.5, -0.5], [0.2], [-2.7]],
+        muon_energy=[[22.1, 15.2, 16.3], [18.0], [35.0]],
+    )
+
+    # per event
+    event = MockEvent()
+    for k in contents:
+        setattr(event, k, [ ])
+    obj.begin(event)
+    expected = [ ]
+    for i in range(3):
+        for k, v in contents.items():
+            getattr(event, k)[:] = v[i]
+        expected.extend((i, k, v) for k, v in obj(event))
+
+    # batch
+    batch = MockBatch(3)
+    for k, v in contents.items():
+        setattr(batch, k, (np.array([e for a in v for e in a]), np.cumsum([0] + [len(a) for a in v])))
+    entries, keys, vals, valid = obj.call_batch(batch)
+    actual = [
+        (i, k, v) for i, k, v, ok in
+        zip(entries.tolist(), zip(*keys), zip(*[v.tolist() for v in vals]), valid) if ok
+    ]
+
+    assert 5 == len(expected)
+    assert expected == actual
+
+def test_call_batch_no_keys():
+    obj = KeyValueComposer()
+    entries, keys, vals, valid = obj.call_batch(MockBatch(3))
+    np.testing.assert_equal([0, 1, 2], entries)
+    assert () == keys
+    assert () == vals
+    np.testing.assert_equal([True, True, True], valid)
+
+##__________________________________________________________________||
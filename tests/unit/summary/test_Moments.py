@@ -0,0 +1,127 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+
+import numpy as np
+import pytest
+
+from alphatwirl.summary import Moments, Summarizer
+from alphatwirl.summary import merge_summarizers
+
+##__________________________________________________________________||
+def expected_contents(vals, weights):
+    vals = np.array(vals, dtype=np.float64)
+    weights = np.array(weights, dtype=np.float64)
+    n = weights.sum()
+    mean = np.average(vals, axis=0, weights=weights)
+    var = np.average((vals - mean)**2, axis=0, weights=weights)
+    ret = [n, (weights**2).sum()]
+    for m, v in zip(mean, var):
+        ret.extend([m, v])
+    return np.array(ret)
+
+vals = [(1.0, 10.0), (2.5, -3.0), (4.0, 7.5), (0.5, 2.0), (3.0, 1.0)]
+weights = [1.0, 2.0, 0.5, 1.5, 3.0]
+
+##__________________________________________________________________||
+def test_repr():
+    obj = Moments()
+    repr(obj)
+
+def test_init():
+    obj = Moments()
+    np.testing.assert_equal([np.array([0, 0])], obj.contents)
+
+def test_init_val():
+    obj = Moments(val=(3, 4), weight=2)
+    np.testing.assert_equal([np.array([2, 4, 3, 0, 4, 0])], obj.contents)
+
+def test_init_contents():
+    contents = [np.array([2, 4, 3, 0, 4, 0])]
+    obj = Moments(contents=contents)
+    assert contents is obj.contents
+
+def test_out_column_names():
+    assert ('n', 'nvar', 'x_mean', 'x_var', 'y_mean', 'y_var') == Moments.out_column_names(('x', 'y'))
+    assert ('n', 'nvar') == Moments.out_column_names(( ))
+
+def test_accumulate():
+    obj = Moments()
+    for v, w in zip(vals, weights):
+        obj.accumulate(v, w)
+    obj.accumulate(None)
+    np.testing.assert_allclose(expected_contents(vals, weights), obj.contents[0])
+
+def test_accumulate_raise():
+    obj = Moments(val=(1, 2))
+    with pytest.raises(ValueError):
+        obj.accumulate((1, 2, 3))
+
+def test_accumulate_zero_weight():
+    obj = Moments()
+    obj.accumulate((2.0, ), 1)
+    obj.accumulate((4.0, ), -1)
+    np.testing.assert_equal([np.array([0, 2, 0, 0])], obj.contents)
+
+##__________________________________________________________________||
+@pytest.mark.parametrize('split', [0, 1, 2, 5])
+def test_add(split):
+    obj1 = Moments()
+    for v, w in zip(vals[:split], weights[:split]):
+        obj1.accumulate(v, w)
+    obj2 = Moments()
+    for v, w in zip(vals[split:], weights[split:]):
+        obj2.accumulate(v, w)
+    copy1 = copy.copy(obj1)
+    copy2 = copy.copy(obj2)
+
+    obj3 = obj1 + obj2
+    np.testing.assert_allclose(expected_contents(vals, weights), obj3.contents[0])
+    assert copy1 == obj1
+    assert copy2 == obj2
+
+    obj1 += obj2
+    np.testing.assert_allclose(expected_contents(vals, weights), obj1.contents[0])
+    assert copy2 == obj2
+
+def test_add_raise():
+    obj1 = Moments(val=(1, 2))
+    obj2 = Moments(val=(1, 2, 3))
+    with pytest.raises(ValueError):
+        obj1 + obj2
+
+def test_radd():
+    obj1 = Moments(val=(1, 2))
+    assert obj1 is not sum([obj1])
+    assert obj1 == sum([obj1])
+    with pytest.raises(TypeError):
+        obj1.__radd__(1)
+
+def test_copy():
+    obj1 = Moments(val=(1, 2))
+    copy1 = copy.copy(obj1)
+    assert obj1 == copy1
+    assert obj1.contents[0] is not copy1.contents[0]
+
+##__________________________________________________________________||
+def test_summarizer():
+    summarizers = [ ]
+    for i in range(3):
+        obj = Summarizer(Summary=Moments)
+        for v, w in zip(vals, weights):
+            obj.add((int(v[0]) % 2, ), v, w*(i + 1))
+        obj.add_key((5, ))
+        summarizers.append(obj)
+    obj = merge_summarizers(summarizers)
+
+    expected = [ ]
+    for k in (0, 1):
+        rows = [(v, w*(i + 1)) for i in range(3) for v, w in zip(vals, weights) if int(v[0]) % 2 == k]
+        expected.append((k, ) + tuple(expected_contents(*zip(*rows))))
+
+    actual = obj.to_tuple_list()
+    assert [0, 1, 5] == [a[0] for a in actual]
+    np.testing.assert_allclose(expected[0], actual[0])
+    np.testing.assert_allclose(expected[1], actual[1])
+    assert (5, 0, 0, 0, 0, 0, 0) == actual[2]
+
+##__________________________________________________________________||
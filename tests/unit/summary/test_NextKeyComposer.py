@@ -58,4 +58,26 @@ class TestNextKeyComposer(unittest.TestCase):
         keyComposer = summary.NextKeyComposer(binnings)
         self.assertEqual(((12, 8, 20), (11, 8, 21)), keyComposer((11, 8, 20)))
 
+    def test_next_keys(self):
+        binnings = (MockBinningPlusOneNext(), MockBinningSameNext(), MockBinningPlusOneNext())
+        keyComposer = summary.NextKeyComposer(binnings)
+        keys = [(11, 8, 20), (12, 8, 20), (11, 9, 20), (11, 8, 21)]
+        expected = set(k for key in keys for k in keyComposer(key))
+        self.assertEqual(expected, keyComposer.next_keys(keys))
+
+    def test_next_keys_one_none(self):
+        binnings = (MockBinningPlusOneNext(), MockBinningNoneNext())
+        keyComposer = summary.NextKeyComposer(binnings)
+        self.assertEqual(set([(12, 8), (3.5, 1)]), keyComposer.next_keys([(11, 8), (2.5, 1)]))
+
+    def test_next_keys_empty(self):
+        binnings = (MockBinningPlusOneNext(), MockBinningPlusOneNext())
+        keyComposer = summary.NextKeyComposer(binnings)
+        self.assertEqual(set(), keyComposer.next_keys([ ]))
+
+    def test_next_keys_unsortable(self):
+        binnings = (MockBinningSameNext(), MockBinningPlusOneNext())
+        keyComposer = summary.NextKeyComposer(binnings)
+        self.assertEqual(set([('a', 2), (1, 3)]), keyComposer.next_keys([('a', 1), (1, 2)]))
+
 ##__________________________________________________________________||
@@ -0,0 +1,116 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import pickle
+import numpy as np
+import pytest
+
+from alphatwirl.binning import Binning, Round
+from alphatwirl.summary import PackedSummarizer
+from alphatwirl.summary import Summarizer
+from alphatwirl.summary import Count, Sum, Scan
+
+##__________________________________________________________________||
+binnings = (
+    Binning(boundaries=(10, 20, 30, 40), retvalue='number', bins=(4, 3, 2)),
+    Round(1, 0, min=0, underflow_bin=-1, max=4, overflow_bin=True),
+)
+
+fills = [
+    dict(key=(4, 2), val=(12.5, 3.0), weight=1),
+    dict(key=(2, 2), val=(1.5, 2.0), weight=2.5),
+    dict(key=(4, 2), val=(4.0, 1.0), weight=0.5),
+    dict(key=(1, -1), val=(3.0, 8.0), weight=1),
+    dict(key=(5, 4), val=(2.0, 1.0), weight=1),
+]
+
+added_keys = [(3, 0), (4, 2)]
+
+def fill(obj):
+    for f in fills:
+        obj.add(**f)
+    for k in added_keys:
+        obj.add_key(k)
+
+@pytest.fixture(params=[Count, Sum, Scan])
+def Summary(request):
+    return request.param
+
+##__________________________________________________________________||
+def test_repr():
+    obj = PackedSummarizer(Summary=Count, binnings=binnings)
+    repr(obj)
+
+def test_keys_are_packed():
+    obj = PackedSummarizer(Summary=Count, binnings=binnings)
+    fill(obj)
+    assert all(isinstance(k, int) for k in obj._results)
+
+def test_same_as_summarizer(Summary):
+    obj = PackedSummarizer(Summary=Summary, binnings=binnings)
+    fill(obj)
+
+    expected = Summarizer(Summary=Summary)
+    fill(expected)
+
+    assert sorted(expected.keys()) == sorted(obj.keys())
+    assert expected.results() == obj.results()
+    assert list(expected.to_key_vals_dict()) == list(obj.to_key_vals_dict())
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_batch(Summary):
+    obj = PackedSummarizer(Summary=Summary, binnings=binnings)
+    keys = tuple(np.array(k, dtype=object) for k in zip(*[f['key'] for f in fills]))
+    vals = tuple(np.array(v) for v in zip(*[f['val'] for f in fills]))
+    weights = np.array([f['weight'] for f in fills])
+    obj.add_batch(keys, vals, weights)
+
+    expected = Summarizer(Summary=Summary)
+    for f in fills:
+        expected.add(**f)
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_index(Summary):
+    obj = PackedSummarizer(Summary=Summary, binnings=binnings)
+    for f in fills:
+        obj.add_index(obj.multiBinning.index(f['key']), f['val'], f['weight'])
+    indices = obj.multiBinning.index_array(tuple(np.array(k, dtype=object) for k in zip(*[f['key'] for f in fills])))
+    vals = tuple(np.array(v) for v in zip(*[f['val'] for f in fills]))
+    weights = np.array([f['weight'] for f in fills])
+    obj.add_index_batch(indices, vals, weights)
+
+    expected = Summarizer(Summary=Summary)
+    for f in fills*2:
+        expected.add(**f)
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_operators(Summary):
+    obj1 = PackedSummarizer(Summary=Summary, binnings=binnings)
+    fill(obj1)
+    obj2 = PackedSummarizer(Summary=Summary, binnings=binnings)
+    obj2.add((3, 3), (1.0, 1.0))
+
+    exp1 = Summarizer(Summary=Summary)
+    fill(exp1)
+    exp2 = Summarizer(Summary=Summary)
+    exp2.add((3, 3), (1.0, 1.0))
+
+    assert (exp1 + exp2).to_tuple_list() == (obj1 + obj2).to_tuple_list()
+    assert sum([exp1, exp2]).to_tuple_list() == sum([obj1, obj2]).to_tuple_list()
+
+    copy1 = copy.copy(obj1)
+    assert isinstance(copy1, PackedSummarizer)
+    assert exp1.to_tuple_list() == copy1.to_tuple_list()
+
+    obj1 += obj2
+    exp1 += exp2
+    assert exp1.to_tuple_list() == obj1.to_tuple_list()
+
+def test_pickle():
+    obj = PackedSummarizer(Summary=Count, binnings=binnings)
+    fill(obj)
+    obj1 = pickle.loads(pickle.dumps(obj))
+    assert obj.to_tuple_list() == obj1.to_tuple_list()
+
+##__________________________________________________________________||
@@ -0,0 +1,127 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from alphatwirl.summary import QuantileSketch, Summarizer
+
+##__________________________________________________________________||
+class Quartiles(QuantileSketch):
+    quantiles = (0.25, 0.5, 0.75)
+
+##__________________________________________________________________||
+def test_repr():
+    obj = QuantileSketch()
+    repr(obj)
+
+def test_init():
+    obj = QuantileSketch()
+    assert [ ] == obj.contents
+    assert obj.quantile(0.5) is None
+
+def test_init_val():
+    obj = QuantileSketch(val=(10, 20), weight=2)
+    np.testing.assert_equal([np.array([10, 20])], obj.contents)
+
+def test_init_values():
+    obj = QuantileSketch(values=[(1, 10), (2, 20), (3, 30), (4, 40)])
+    np.testing.assert_equal([np.array([2.5, 25])], obj.contents)
+
+def test_init_contents():
+    # the contents are the quantiles, from which the sketch cannot be
+    # restored
+    obj = QuantileSketch(values=[(1, 10), (2, 20), (3, 30), (4, 40)])
+    with pytest.raises(TypeError):
+        QuantileSketch(contents=obj.contents)
+
+def test_quartiles():
+    obj = Quartiles(values=[(1, 10), (2, 20), (3, 30), (4, 40)])
+    np.testing.assert_equal([np.array([1.5, 2.5, 3.5, 15, 25, 35])], obj.contents)
+
+def test_accumulate_weight():
+    obj = QuantileSketch()
+    obj.accumulate((1, ), weight=1)
+    obj.accumulate((2, ), weight=3)
+    obj.accumulate((5, ), weight=0) # ignored
+    obj.accumulate(None)
+    # interpolated between the centers of the weights, 0.5 and 2.5
+    assert [1.75] == obj.quantile(0.5).tolist()
+    assert [2] == obj.quantile(0.75).tolist()
+
+##__________________________________________________________________||
+def test_large():
+    rng = np.random.RandomState(0)
+    vals = rng.normal(size=(20000, 2))
+    objs = [QuantileSketch(values=c) for c in np.array_split(vals, 10)]
+    obj = sum(objs)
+
+    assert len(obj._means[0]) <= QuantileSketch.compression
+    qs = [0.01, 0.1, 0.5, 0.9, 0.99]
+    np.testing.assert_allclose(np.quantile(vals, qs, axis=0), obj.quantile(qs), atol=0.02)
+    assert [vals.min(axis=0).tolist()] == [obj.quantile(0).tolist()]
+    assert [vals.max(axis=0).tolist()] == [obj.quantile(1).tolist()]
+
+def test_pickle_bounded():
+    rng = np.random.RandomState(0)
+    obj1 = QuantileSketch(values=rng.normal(size=(1000, 1)))
+    obj2 = QuantileSketch(values=rng.normal(size=(100000, 1)))
+    assert len(pickle.dumps(obj2)) < 2*len(pickle.dumps(obj1))
+    unpickled = pickle.loads(pickle.dumps(obj2))
+    assert unpickled == obj2
+    np.testing.assert_equal(obj2.contents, unpickled.contents)
+
+##__________________________________________________________________||
+def test_add():
+    obj1 = QuantileSketch(values=[(1, ), (2, )])
+    obj2 = QuantileSketch(values=[(3, ), (4, )])
+    obj3 = obj1 + obj2
+    np.testing.assert_equal([np.array([2.5])], obj3.contents)
+    np.testing.assert_equal([np.array([1.5])], obj1.contents)
+    np.testing.assert_equal([np.array([3.5])], obj2.contents)
+
+def test_iadd():
+    obj1 = QuantileSketch(values=[(1, ), (2, )])
+    obj2 = QuantileSketch(values=[(3, ), (4, )])
+    obj3 = obj1
+    obj3 += obj2
+    assert obj1 is obj3
+    np.testing.assert_equal([np.array([2.5])], obj1.contents)
+
+def test_iadd_empty():
+    obj1 = QuantileSketch()
+    obj1 += QuantileSketch()
+    assert [ ] == obj1.contents
+    obj1 += QuantileSketch(values=[(3, )])
+    np.testing.assert_equal([np.array([3])], obj1.contents)
+
+def test_iadd_raise():
+    obj1 = QuantileSketch(values=[(1, )])
+    with pytest.raises(ValueError):
+        obj1 += QuantileSketch(values=[(1, 2)])
+
+def test_radd():
+    obj1 = QuantileSketch(values=[(10, 20), (30, 40)])
+    assert obj1 is not sum([obj1])
+    assert obj1 == sum([obj1])
+    with pytest.raises(TypeError):
+        obj1.__radd__(1)
+
+def test_copy():
+    obj1 = QuantileSketch(values=[(10, 20), (30, 40)])
+    copy1 = copy.copy(obj1)
+    assert obj1 == copy1
+    copy1.accumulate((50, 60))
+    assert obj1 != copy1
+
+##__________________________________________________________________||
+def test_summarizer():
+    obj = Summarizer(Summary=QuantileSketch)
+    obj.add((1, ), (10, ))
+    obj.add((1, ), (20, ))
+    obj.add((2, ), (30, ))
+    obj.add_key((3, ))
+    assert [(1, 15.0), (2, 30.0)] == obj.to_tuple_list()
+
+##__________________________________________________________________||
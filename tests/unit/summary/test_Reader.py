@@ -1,5 +1,6 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import copy
+import numpy as np
 import pytest
 
 try:
@@ -107,8 +108,11 @@ def test_event_nevents(mockKeyValComposer, mockSummarizer, mockWeightCalculator)
     event1 = mock.Mock(name='event1')
     event2 = mock.Mock(name='event2')
     event3 = mock.Mock(name='event3')
+    assert not obj.is_done()
     obj.event(event1)
+    assert not obj.is_done()
     obj.event(event2)
+    assert obj.is_done()
     obj.event(event3)
 
     assert [
@@ -119,6 +123,160 @@ def test_event_nevents(mockKeyValComposer, mockSummarizer, mockWeightCalculator)
     assert [mock.call(event1), mock.call(event2)] == mockKeyValComposer.call_args_list
     assert [mock.call(event1), mock.call(event2)] == mockWeightCalculator.call_args_list
 
+def test_is_done_no_nevents(obj, mockKeyValComposer):
+    mockKeyValComposer.return_value = [ ]
+    for _ in range(3):
+        obj.event(mock.Mock())
+    assert obj.is_done() is False
+
+def test_events(obj, mockKeyValComposer, mockSummarizer, mockWeightCalculator):
+    batch = mock.MagicMock()
+    batch.__len__.return_value = 3
+    mockKeyValComposer.call_batch.return_value = (
+        np.array([0, 0, 1, 2]), # entries
+        (np.array([10, 20, 30, 40]), ), # keys
+        (np.array([1.5, 2.5, 3.5, 4.5]), ), # vals
+        np.array([True, False, True, True]), # valid
+    )
+    mockWeightCalculator.call_batch.return_value = np.array([1.0, 2.0, 3.0])
+    obj.events(batch)
+
+    assert [mock.call(batch)] == mockKeyValComposer.call_batch.call_args_list
+    assert [mock.call(batch)] == mockWeightCalculator.call_batch.call_args_list
+    assert 1 == len(mockSummarizer.add_batch.call_args_list)
+    kwargs = mockSummarizer.add_batch.call_args_list[0][1]
+    np.testing.assert_equal((np.array([10, 30, 40]), ), kwargs['keys'])
+    np.testing.assert_equal((np.array([1.5, 3.5, 4.5]), ), kwargs['vals'])
+    np.testing.assert_equal(np.array([1.0, 2.0, 3.0]), kwargs['weights'])
+    assert 3 == obj.ievent
+
+def test_events_nevents(mockKeyValComposer, mockSummarizer, mockWeightCalculator):
+    obj = Reader(
+        mockKeyValComposer, mockSummarizer,
+        weightCalculator=mockWeightCalculator,
+        nevents=4 # read only first 4 events
+    )
+
+    batch = mock.MagicMock()
+    batch.__len__.return_value = 3
+    mockKeyValComposer.call_batch.return_value = (
+        np.array([0, 1, 1, 2]), # entries
+        (np.array([10, 20, 30, 40]), ), # keys
+        ( ), # vals
+        np.array([True, True, True, True]), # valid
+    )
+    mockWeightCalculator.call_batch.return_value = np.array([1.0, 2.0, 3.0])
+
+    obj.events(batch)
+    kwargs = mockSummarizer.add_batch.call_args_list[0][1]
+    np.testing.assert_equal((np.array([10, 20, 30, 40]), ), kwargs['keys'])
+    np.testing.assert_equal(np.array([1.0, 2.0, 2.0, 3.0]), kwargs['weights'])
+
+    obj.events(batch) # only the first event
+    kwargs = mockSummarizer.add_batch.call_args_list[1][1]
+    np.testing.assert_equal((np.array([10]), ), kwargs['keys'])
+    np.testing.assert_equal(np.array([1.0]), kwargs['weights'])
+
+    obj.events(batch) # no events
+    assert 2 == len(mockSummarizer.add_batch.call_args_list)
+    assert 2 == len(mockKeyValComposer.call_batch.call_args_list)
+    assert 4 == obj.ievent
+
+class MockEvent(object):
+    pass
+
+class MockBatch(object):
+    def __init__(self, nevents):
+        self.nevents = nevents
+
+    def __len__(self):
+        return self.nevents
+
+@pytest.mark.parametrize('nevents', [None, 2])
+def test_events_same_as_event(nevents):
+    contents = dict(
+        njets=[[2], [3], [2], [0]],
+        jet_pt=[[40.5, 20.2], [50.1, 30.4, 40.2], [ ], [ ]],
+    )
+
+    def build_reader():
+        return Reader(
+            alphatwirl.summary.KeyValueComposer(
+                keyAttrNames=('njets', 'jet_pt'),
+                binnings=(alphatwirl.binning.Echo(), alphatwirl.binning.Round(10, 0)),
+                keyIndices=(None, '*'),
+            ),
+            alphatwirl.summary.Summarizer(Summary=alphatwirl.summary.Count),
+            nevents=nevents
+        )
+
+    expected = build_reader()
+    event = MockEvent()
+    for k in contents:
+        setattr(event, k, [ ])
+    expected.begin(event)
+    for i in range(4):
+        for k, v in contents.items():
+            getattr(event, k)[:] = v[i]
+        expected.event(event)
+
+    obj = build_reader()
+    batch = MockBatch(4)
+    for k, v in contents.items():
+        setattr(batch, k, (np.array([e for a in v for e in a]), np.cumsum([0] + [len(a) for a in v])))
+    obj.events(batch)
+
+    assert expected.results().to_tuple_list() == obj.results().to_tuple_list()
+
+@pytest.mark.parametrize('Summarizer', [
+    alphatwirl.summary.DenseSummarizer,
+    alphatwirl.summary.PackedSummarizer,
+])
+@pytest.mark.parametrize('cache', [False, True])
+def test_indexed(Summarizer, cache):
+    # the keys are given to the summarizer as the flat indices
+    contents = dict(
+        njets=[[2], [3], [2], [0]],
+        jet_pt=[[40.5, 20.2], [50.1, 30.4, 90.2], [ ], [ ]],
+    )
+    binnings = (
+        alphatwirl.binning.Round(1, 0, min=0, max=5),
+        alphatwirl.binning.Round(10, 0, min=0, max=60),
+    )
+
+    def build_reader(summarizer):
+        return Reader(
+            alphatwirl.summary.KeyValueComposer(
+                keyAttrNames=('njets', 'jet_pt'),
+                binnings=binnings,
+                keyIndices=(None, '*'),
+                keyColumnCache=alphatwirl.summary.KeyColumnCache() if cache else None
+            ),
+            summarizer
+        )
+
+    expected = build_reader(alphatwirl.summary.Summarizer(Summary=alphatwirl.summary.Count))
+    obj = build_reader(Summarizer(Summary=alphatwirl.summary.Count, binnings=binnings))
+    assert obj._indexed
+    event = MockEvent()
+    for k in contents:
+        setattr(event, k, [ ])
+    expected.begin(event)
+    obj.begin(event)
+    for i in range(4):
+        for k, v in contents.items():
+            getattr(event, k)[:] = v[i]
+        expected.event(event)
+        obj.event(event)
+    assert expected.results().to_tuple_list() == obj.results().to_tuple_list()
+
+    obj = build_reader(Summarizer(Summary=alphatwirl.summary.Count, binnings=binnings))
+    batch = MockBatch(4)
+    for k, v in contents.items():
+        setattr(batch, k, (np.array([e for a in v for e in a]), np.cumsum([0] + [len(a) for a in v])))
+    obj.events(batch)
+    assert expected.results().to_tuple_list() == obj.results().to_tuple_list()
+
 def test_end(obj, mockSummarizer, mockNextKeyComposer):
     key1 = mock.MagicMock(name='key1')
     key2 = mock.MagicMock(name='key2')
@@ -139,6 +297,34 @@ def test_end(obj, mockSummarizer, mockNextKeyComposer):
         mock.call(key11), mock.call(key21), mock.call(key22)
     ] == mockSummarizer.add_key.call_args_list
 
+@pytest.mark.parametrize('create_summarizer', [
+    lambda binnings: alphatwirl.summary.Summarizer(Summary=alphatwirl.summary.Count),
+    lambda binnings: alphatwirl.summary.PackedSummarizer(Summary=alphatwirl.summary.Count, binnings=binnings),
+    lambda binnings: alphatwirl.summary.DenseSummarizer(Summary=alphatwirl.summary.Count, binnings=binnings),
+], ids=['Summarizer', 'PackedSummarizer', 'DenseSummarizer'])
+def test_end_bulk(mockKeyValComposer, create_summarizer):
+    binnings = (
+        alphatwirl.binning.Binning(boundaries=(10, 20, 30, 40)),
+        alphatwirl.binning.Round(1, 0, min=0, underflow_bin=-1, max=4, overflow_bin=True),
+    )
+    keys = [(10, 2), (30, 4), (float('-inf'), -1), (40, 0), (20, 2)]
+
+    objs = [ ]
+    for bulk in (False, True):
+        obj = Reader(
+            mockKeyValComposer, create_summarizer(binnings),
+            nextKeyComposer=alphatwirl.summary.NextKeyComposer(binnings),
+            bulkNextKeys=bulk
+        )
+        for k in keys:
+            obj.summarizer.add(k, weight=1)
+        obj.end()
+        objs.append(obj)
+
+    expected, actual = [o.summarizer.to_tuple_list() for o in objs]
+    assert expected == actual
+    assert len(keys) < len(actual)
+
 def test_end_None_nextKeyComposer(mockKeyValComposer, mockSummarizer):
     obj = Reader(
         mockKeyValComposer, mockSummarizer,
@@ -154,6 +340,31 @@ def test_end_None_nextKeyComposer(mockKeyValComposer, mockSummarizer):
 def test_results(obj, mockSummarizer):
     assert mockSummarizer is obj.results()
 
+def test_clear(obj, mockSummarizer):
+    obj.clear()
+    assert [mock.call()] == mockSummarizer.clear.call_args_list
+
+def test_delta():
+    class MockEvent(object):
+        pass
+    event = MockEvent()
+    event.val = [1]
+    obj = Reader(
+        keyValComposer=alphatwirl.summary.KeyValueComposer(
+            keyAttrNames=('val', ), binnings=(alphatwirl.binning.Round(1, 0), )
+        ),
+        summarizer=alphatwirl.summary.Summarizer(Summary=alphatwirl.summary.Count),
+        nextKeyComposer=alphatwirl.summary.NextKeyComposer((alphatwirl.binning.Round(1, 0), ))
+    )
+    obj.begin(event)
+    obj.event(event)
+    delta = obj.delta()
+    assert delta.summarizer is not obj.summarizer
+    assert delta.keyValComposer is obj.keyValComposer
+    assert [(1, ), (2, )] == sorted(delta.summarizer.keys()) # with the next key
+    assert [ ] == list(obj.summarizer.keys())
+    assert 1 == obj.ievent
+
 def test_merge(obj, mockSummarizer):
     obj1 = copy.deepcopy(obj)
 
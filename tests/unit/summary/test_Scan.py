@@ -46,6 +46,22 @@ class TestScan(unittest.TestCase):
         self.assertIsNot(obj2, obj3)
         self.assertIsNot(obj2.contents, obj3.contents)
 
+    def test_iadd(self):
+        obj1 = Scan(contents = [(10, 20)])
+        obj2 = Scan(contents = [(30, 40)])
+        obj3 = obj1
+        obj3 += obj2
+        self.assertIs(obj1, obj3)
+        self.assertEqual([(10, 20), (30, 40)], obj1.contents)
+        self.assertEqual([(30, 40)], obj2.contents)
+
+    def test_accumulate(self):
+        obj = Scan()
+        obj.accumulate((10, 20))
+        obj.accumulate(None)
+        obj.accumulate((30, 40), weight = 2)
+        self.assertEqual([(10, 20), (30, 40)], obj.contents)
+
     def test_radd(self):
         obj1 = Scan(contents = [(10, 20), (30, 40)])
         self.assertIsNot(obj1, sum([obj1])) # will call 0 + obj1
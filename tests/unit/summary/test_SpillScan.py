@@ -0,0 +1,179 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import gc
+import os
+import copy
+import pickle
+import shutil
+import tempfile
+
+import pytest
+
+from alphatwirl.summary import SpillScan, Scan, Summarizer
+from alphatwirl.summary import merge_summarizers
+
+##__________________________________________________________________||
+class SmallSpillScan(SpillScan):
+    buffer_size = 3
+
+@pytest.fixture(autouse=True)
+def directory(monkeypatch):
+    ret = tempfile.mkdtemp()
+    monkeypatch.setattr(SpillScan, 'directory', ret)
+    yield ret
+    shutil.rmtree(ret)
+
+def nfiles(directory):
+    return len([f for f in os.listdir(directory) if f.endswith('.npy')])
+
+##__________________________________________________________________||
+def test_repr():
+    obj = SpillScan()
+    repr(obj)
+
+def test_init():
+    obj = SpillScan()
+    assert [ ] == list(obj.contents)
+    assert 0 == len(obj.contents)
+
+def test_init_no_directory(monkeypatch):
+    monkeypatch.setattr(SpillScan, 'directory', None)
+    with pytest.raises(ValueError):
+        SmallSpillScan()
+
+def test_init_val():
+    obj = SpillScan(val=(10, 20.5), weight=2)
+    assert [(10, 20.5)] == list(obj.contents)
+
+def test_init_contents():
+    obj = SpillScan(contents=[(10, 20), (30, 40)])
+    assert [(10, 20), (30, 40)] == list(obj.contents)
+    assert Scan(contents=[(10, 20), (30, 40)]) == obj
+
+def test_accumulate_spill(directory):
+    obj = SmallSpillScan()
+    rows = [(i, i*0.5) for i in range(7)]
+    for r in rows:
+        obj.accumulate(r)
+    obj.accumulate(None)
+    assert 2 == nfiles(directory)
+    assert rows == list(obj.contents)
+    assert rows == list(obj.contents) # can iterate again
+    assert [int, float] == [type(e) for e in list(obj.contents)[-1]]
+
+def test_accumulate_types():
+    obj = SmallSpillScan()
+    rows = [(1, 2), (1.5, 2), ('a', 3), ('bcdef', 3), (1, 2, 3)]
+    for r in rows:
+        obj.accumulate(r)
+    assert rows == list(obj.contents)
+
+def test_accumulate_mixed(directory, monkeypatch):
+    monkeypatch.setattr(SmallSpillScan, 'buffer_size', 1000)
+    obj = SmallSpillScan()
+    rows = [(i, ) if i % 2 else (i*0.5, ) for i in range(3000)]
+    for r in rows:
+        obj.accumulate(r)
+    assert 3 == nfiles(directory) # a file for each full buffer
+    assert 3 == len(obj._chunks)
+    assert rows == list(obj.contents)
+    assert [float] == [type(e) for e in list(obj.contents)[1]] # promoted
+
+def test_iadd_mixed(directory):
+    objs = [SmallSpillScan(contents=[(i, ), (i*0.5, )]) for i in range(6)]
+    obj = objs[0]
+    for o in objs[1:]:
+        obj += o
+    assert 3 == nfiles(directory) # not a file for each chunk
+    assert [4, 4, 4] == [n for n, _ in obj._chunks]
+    assert 12 == len(obj.contents)
+
+def test_iadd(directory):
+    obj1 = SmallSpillScan(contents=[(i, ) for i in range(4)])
+    obj2 = SmallSpillScan(contents=[(i, ) for i in range(10, 15)])
+    assert 2 == nfiles(directory)
+
+    obj3 = obj1
+    obj3 += obj2
+    assert obj3 is obj1
+    assert [(i, ) for i in list(range(4)) + list(range(10, 15))] == list(obj1.contents)
+    assert [(i, ) for i in range(10, 15)] == list(obj2.contents)
+
+    obj1.accumulate((20, ))
+    assert (20, ) == list(obj1.contents)[-1]
+
+def test_add_copy():
+    obj1 = SmallSpillScan(contents=[(i, ) for i in range(4)])
+    obj2 = SmallSpillScan(contents=[(i, ) for i in range(10, 12)])
+    obj3 = obj1 + obj2
+    assert [(0, ), (1, ), (2, ), (3, ), (10, ), (11, )] == list(obj3.contents)
+    assert 4 == len(obj1.contents)
+
+    copy1 = copy.copy(obj1)
+    copy1.accumulate((5, ))
+    assert 4 == len(obj1.contents)
+    assert 5 == len(copy1.contents)
+
+def test_iadd_scan():
+    obj = SpillScan(contents=[(1, 2)])
+    obj += Scan(contents=[(3, 4)])
+    assert [(1, 2), (3, 4)] == list(obj.contents)
+
+def test_radd():
+    obj1 = SmallSpillScan(contents=[(10, 20), (30, 40)])
+    assert obj1 is not sum([obj1])
+    assert obj1 == sum([obj1])
+    with pytest.raises(TypeError):
+        obj1.__radd__(1)
+
+def test_pickle(directory):
+    obj = SmallSpillScan(contents=[(i, ) for i in range(5)])
+    unpickled = pickle.loads(pickle.dumps(obj))
+    assert list(obj.contents) == list(unpickled.contents)
+    unpickled.accumulate((5, ))
+    assert [(i, ) for i in range(6)] == list(unpickled.contents)
+
+    # the unpickled scan removes the files
+    del obj
+    gc.collect()
+    assert 1 == nfiles(directory)
+    del unpickled
+    gc.collect()
+    assert 0 == nfiles(directory)
+
+def test_remove_files(directory):
+    obj1 = SmallSpillScan(contents=[(i, ) for i in range(4)])
+    obj2 = SmallSpillScan(contents=[(i, ) for i in range(10, 17)])
+    assert 3 == nfiles(directory)
+
+    obj1 += obj2
+    del obj2
+    gc.collect()
+    assert 3 == nfiles(directory) # still in obj1
+
+    copy1 = copy.copy(obj1)
+    del obj1
+    gc.collect()
+    assert 3 == nfiles(directory) # still in copy1
+    assert 11 == len(list(copy1.contents))
+
+    del copy1
+    gc.collect()
+    assert 0 == nfiles(directory)
+
+##__________________________________________________________________||
+def test_summarizer():
+    summarizers = [ ]
+    for i in range(3):
+        obj = Summarizer(Summary=SmallSpillScan)
+        expected = Summarizer(Summary=Scan)
+        for j in range(5):
+            for s in (obj, expected):
+                s.add((j % 2, ), (i, j))
+        summarizers.append((obj, expected))
+
+    obj = merge_summarizers([o for o, _ in summarizers])
+    expected = merge_summarizers([e for _, e in summarizers])
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+    assert expected.to_tuple_list() == list(obj.to_tuple_iter())
+
+##__________________________________________________________________||
@@ -0,0 +1,186 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import gc
+import os
+import copy
+import pickle
+import random
+import shutil
+import tempfile
+
+import numpy as np
+import pytest
+
+from alphatwirl.summary import SpillSummarizer, Summarizer
+from alphatwirl.summary import Count, Sum, Scan
+from alphatwirl.summary import merge_summarizers
+
+##__________________________________________________________________||
+@pytest.fixture()
+def directory():
+    ret = tempfile.mkdtemp()
+    yield ret
+    shutil.rmtree(ret)
+
+def nfiles(directory):
+    return len(os.listdir(directory))
+
+def create_rows(n, seed):
+    # the weights and values are exact in binary so that the sums do
+    # not depend on the order of the additions
+    r = random.Random(seed)
+    ret = [ ]
+    for _ in range(n):
+        key = (r.randint(1, 3), r.randint(100, 130))
+        val = (r.randint(0, 10)*0.5, )
+        weight = r.choice((1, 0.5, 0.25))
+        ret.append((key, val, weight))
+    return ret
+
+@pytest.fixture(params=[Count, Sum, Scan])
+def Summary(request):
+    return request.param
+
+def fill(obj, rows):
+    for key, val, weight in rows:
+        obj.add(key, val, weight)
+    obj.add_key((4, 100))
+    obj.add_keys([(1, 100), (5, 100)])
+
+##__________________________________________________________________||
+def test_repr(directory):
+    obj = SpillSummarizer(Count, directory=directory)
+    repr(obj)
+
+def test_same_as_summarizer(Summary, directory):
+    rows = create_rows(200, 1)
+    expected = Summarizer(Summary)
+    fill(expected, rows)
+
+    obj = SpillSummarizer(Summary, max_keys=10, directory=directory)
+    fill(obj, rows)
+    assert obj._runs
+    assert len(obj._runs) == nfiles(directory)
+    assert len(obj._results) <= 10
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+    assert expected.to_tuple_list() == list(obj.to_tuple_iter())
+    assert list(expected.to_key_vals_dict()) == list(obj.to_key_vals_dict())
+    assert sorted(expected.keys()) == obj.keys()
+    assert expected.results() == obj.results()
+
+def test_no_spill(directory):
+    rows = create_rows(20, 2)
+    expected = Summarizer(Count)
+    fill(expected, rows)
+    obj = SpillSummarizer(Count, directory=directory)
+    fill(obj, rows)
+    assert [ ] == obj._runs
+    assert 0 == nfiles(directory)
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_batch(directory):
+    rows = create_rows(100, 3)
+    keys = tuple(np.array(c) for c in zip(*[k for k, _, _ in rows]))
+    vals = tuple(np.array(c) for c in zip(*[v for _, v, _ in rows]))
+    weights = np.array([w for _, _, w in rows])
+
+    expected = Summarizer(Sum)
+    expected.add_batch(keys, vals, weights)
+
+    obj = SpillSummarizer(Sum, max_keys=10, directory=directory)
+    for i in range(0, 100, 20):
+        obj.add_batch(tuple(k[i:i+20] for k in keys), tuple(v[i:i+20] for v in vals), weights[i:i+20])
+    assert obj._runs
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_merge(Summary, directory):
+    rows1 = create_rows(100, 4)
+    rows2 = create_rows(100, 5)
+
+    expected = Summarizer(Summary)
+    fill(expected, rows1 + rows2)
+
+    obj1 = SpillSummarizer(Summary, max_keys=10, directory=directory)
+    fill(obj1, rows1)
+    obj2 = SpillSummarizer(Summary, max_keys=10, directory=directory)
+    fill(obj2, rows2)
+    nruns = len(obj1._runs) + len(obj2._runs)
+
+    merged = merge_summarizers([obj1, obj2])
+    assert nruns <= len(merged._runs)
+    assert expected.to_tuple_list() == merged.to_tuple_list()
+    assert expected.to_tuple_list() == (obj1 + obj2).to_tuple_list()
+    assert expected.to_tuple_list() == sum([obj1, obj2]).to_tuple_list()
+
+    obj1 += obj2
+    assert expected.to_tuple_list() == obj1.to_tuple_list()
+
+def test_merge_max_keys(directory):
+    objs = [ ]
+    for i in range(10):
+        obj = SpillSummarizer(Count, max_keys=100, directory=directory)
+        for j in range(90):
+            obj.add((i, j))
+        assert not obj._runs
+        objs.append(obj)
+
+    merged = merge_summarizers(objs)
+    assert len(merged._results) <= merged.max_keys
+    assert merged._runs
+    assert 900 == len(merged.to_tuple_list())
+
+    added = objs[0] + objs[1]
+    assert len(added._results) <= added.max_keys
+    assert 180 == len(added.to_tuple_list())
+
+def test_copy_pickle(directory):
+    rows = create_rows(100, 6)
+    obj = SpillSummarizer(Count, max_keys=10, directory=directory)
+    fill(obj, rows)
+    expected = obj.to_tuple_list()
+
+    copy1 = copy.copy(obj)
+    assert copy1._runs == obj._runs
+    assert copy1._runs is not obj._runs
+    assert expected == copy1.to_tuple_list()
+
+    unpickled = pickle.loads(pickle.dumps(obj))
+    assert expected == unpickled.to_tuple_list()
+
+def test_clear(directory):
+    obj = SpillSummarizer(Count, max_keys=10, directory=directory)
+    fill(obj, create_rows(100, 7))
+    obj.clear()
+    assert [ ] == obj.to_tuple_list()
+    assert [ ] == list(obj.to_tuple_iter())
+
+def test_no_directory():
+    with pytest.raises(ValueError):
+        SpillSummarizer(Count, directory=None)
+
+def test_remove_files_clear(directory):
+    obj = SpillSummarizer(Count, max_keys=5, directory=directory)
+    fill(obj, create_rows(100, 8))
+    assert nfiles(directory)
+    obj.clear()
+    gc.collect()
+    assert 0 == nfiles(directory)
+
+def test_remove_files_merge(directory):
+    obj1 = SpillSummarizer(Count, max_keys=5, directory=directory)
+    fill(obj1, create_rows(500, 9))
+    obj2 = SpillSummarizer(Count, max_keys=5, directory=directory)
+    fill(obj2, create_rows(500, 10))
+    expected = (obj1 + obj2).to_tuple_list()
+
+    merged = merge_summarizers([obj1, obj2])
+    del obj1, obj2
+    gc.collect()
+    assert nfiles(directory) # in merged
+    assert expected == merged.to_tuple_list()
+
+    del merged
+    gc.collect()
+    assert 0 == nfiles(directory)
+
+##__________________________________________________________________||
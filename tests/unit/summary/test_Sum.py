@@ -1,6 +1,7 @@
 import unittest
 
 import copy
+import pickle
 import numpy as np
 
 from alphatwirl.summary import Sum
@@ -56,6 +57,33 @@ class TestSum(unittest.TestCase):
         self.assertIsNot(obj2, obj3)
         self.assertIsNot(obj2.contents, obj3.contents)
 
+    def test_iadd(self):
+        obj1 = Sum(contents = [np.array((10, 20))])
+        obj2 = Sum(contents = [np.array((30, 40.2))])
+        obj3 = obj1
+        obj3 += obj2
+        self.assertIs(obj1, obj3)
+        np.testing.assert_equal([np.array([40, 60.2])], obj1.contents)
+        np.testing.assert_equal([np.array([30, 40.2])], obj2.contents)
+
+    def test_iadd_to_empty(self):
+        obj1 = Sum()
+        obj1 += Sum(contents = [np.array((30, 40.2))])
+        contents = obj1.contents[0]
+        obj1 += Sum(contents = [np.array((1, 2))])
+        self.assertIs(contents, obj1.contents[0])
+        np.testing.assert_equal([np.array([31, 42.2])], obj1.contents)
+
+    def test_accumulate(self):
+        obj = Sum()
+        obj.accumulate((10, 20))
+        contents = obj.contents[0]
+        obj.accumulate((1, 2), weight = 2.5)
+        obj.accumulate(None, weight = 2.5)
+        self.assertIs(contents, obj.contents[0])
+        np.testing.assert_equal([np.array([12.5, 25])], obj.contents)
+        self.assertEqual(Sum() + Sum((10, 20)) + Sum((1, 2), 2.5), obj)
+
     def test_radd(self):
         obj1 = Sum(contents = [np.array((10, 20))])
         self.assertIsNot(obj1, sum([obj1])) # will call 0 + obj1
@@ -73,4 +101,11 @@ class TestSum(unittest.TestCase):
         self.assertIsNot(obj1.contents, copy1.contents)
         self.assertIsNot(obj1.contents[0], copy1.contents[0])
 
+    def test_pickle(self):
+        for contents in ([np.array((10, 20))], [np.array((1.5, ))], [np.array((1, 2)), np.array((3, ))]):
+            obj1 = Sum(contents = contents)
+            obj2 = pickle.loads(pickle.dumps(obj1, protocol=pickle.HIGHEST_PROTOCOL))
+            self.assertEqual(obj1, obj2)
+            self.assertEqual(obj1.contents[0].dtype, obj2.contents[0].dtype)
+
 ##__________________________________________________________________||
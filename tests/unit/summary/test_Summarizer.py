@@ -1,5 +1,6 @@
 # Tai Sakuma <tai.sakuma@gmail.com>
 import sys
+import pickle
 import numpy as np
 import pytest
 
@@ -10,6 +11,8 @@ except ImportError:
 
 from alphatwirl.summary import Summarizer
 from alphatwirl.summary import Sum
+from alphatwirl.summary import Count
+from alphatwirl.summary import Scan
 
 ##__________________________________________________________________||
 @pytest.fixture()
@@ -40,6 +43,62 @@ def test_add(obj):
     }
     assert expected == obj.results()
 
+def test_add_in_place(obj):
+    obj.add('A', (12, ))
+    summary = obj.results()['A']
+    obj.add('A', (23, ))
+    obj.add('A', (10, ), weight=2)
+    assert summary is obj.results()['A']
+    assert {'A': Sum(contents=np.array((55, )))} == obj.results()
+
+class MockSummaryWithoutAccumulate(object):
+    def __init__(self, val=None, weight=1):
+        self.contents = [ ] if val is None else [val]
+
+    def __add__(self, other):
+        ret = self.__class__()
+        ret.contents = self.contents + other.contents
+        return ret
+
+def test_add_summary_without_accumulate():
+    obj = Summarizer(Summary=MockSummaryWithoutAccumulate)
+    obj.add('A', (12, ))
+    obj.add('A', (23, ))
+    assert [(12, ), (23, )] == obj.results()['A'].contents
+
+@pytest.mark.parametrize('Summary', [Count, Sum, Scan])
+def test_add_batch(Summary):
+    keys = (
+        np.array([1, 2, 1, 1, 3, 2, 1]),
+        np.array([10.5, 10.5, 10.5, 20.5, 10.5, 10.5, 10.5]),
+    )
+    vals = (
+        np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]),
+        np.array([2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0]),
+    )
+    weights = np.array([1.0, 0.5, 2.0, 1.0, 1.0, 1.0, 3.0])
+
+    obj = Summarizer(Summary=Summary)
+    obj.add((2, 10.5), (1.0, 1.0), 1.0)
+    obj.add_batch(keys, vals, weights)
+
+    expected = Summarizer(Summary=Summary)
+    expected.add((2, 10.5), (1.0, 1.0), 1.0)
+    for key, val, weight in zip(zip(*keys), zip(*vals), weights):
+        expected.add(key, val, weight)
+
+    assert expected.to_tuple_list() == obj.to_tuple_list()
+
+def test_add_batch_no_keys():
+    obj = Summarizer(Summary=Count)
+    obj.add_batch(( ), ( ), np.array([1.0, 2.0]))
+    assert [(3.0, 5.0)] == obj.to_tuple_list()
+
+def test_add_batch_empty():
+    obj = Summarizer(Summary=Count)
+    obj.add_batch((np.array([ ]), ), ( ), np.array([ ]))
+    assert [ ] == obj.to_tuple_list()
+
 def test_add_key(obj):
 
     obj.add_key('A')
@@ -55,6 +114,23 @@ def test_add_key(obj):
     }
     assert expected == obj.results()
 
+def test_add_keys(obj):
+    obj.add((1, ), (2, ))
+    obj.add_keys([(1, ), (2, ), (3, ), (2, )])
+    expected  = {
+        (1, ): Sum(contents=np.array((2, ))),
+        (2, ): Sum(contents=np.array((0, ))),
+        (3, ): Sum(contents=np.array((0, ))),
+    }
+    assert expected == obj.results()
+
+def test_clear(obj):
+    obj.add((1, ), (2, ))
+    obj.clear()
+    assert { } == obj.results()
+    obj.add((3, ), (4, ))
+    assert [(3, 4)] == obj.to_tuple_list()
+
 def test_key(obj):
     obj.add_key('A')
     assert ['A'] == list(obj.keys())
@@ -71,3 +147,41 @@ def test_to_tuple_list_key_not_tuple(obj):
     assert [(2, 20), ('A', 12)] == obj.to_tuple_list()
 
 ##__________________________________________________________________||
+@pytest.mark.parametrize('Summary', [Count, Sum, Scan])
+def test_pickle(Summary):
+    obj = Summarizer(Summary=Summary)
+    obj.add((1, 2.5), (3, ))
+    obj.add((1, 2.5), (4, ))
+    obj.add((2, 0.5), (5, ))
+    obj.add_key((3, 1.5))
+    unpickled = pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    assert obj.to_tuple_list() == unpickled.to_tuple_list()
+    assert obj.results() == unpickled.results()
+    assert obj.Summary is unpickled.Summary
+
+    unpickled.add((4, 4.5), (6, ))
+    unpickled.add((1, 2.5), (7, ))
+    assert 3 == len(obj.results())
+    assert 4 == len(unpickled.results())
+
+def test_pickle_in_arrays():
+    obj = Summarizer(Summary=Count)
+    for i in range(100):
+        obj.add((i, i*0.5), weight=2)
+    state = obj.__getstate__()
+    assert '_results' not in state
+    unpickled = pickle.loads(pickle.dumps(obj))
+    assert obj.results() == unpickled.results()
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="requires pickle protocol 5")
+def test_pickle_out_of_band():
+    obj = Summarizer(Summary=Count)
+    for i in range(100):
+        obj.add((i, i*0.5), weight=2)
+    buffers = [ ]
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    assert buffers
+    unpickled = pickle.loads(data, buffers=buffers)
+    assert obj.results() == unpickled.results()
+
+##__________________________________________________________________||
@@ -1,5 +1,6 @@
 import alphatwirl.summary as summary
 import unittest
+import numpy as np
 
 ##__________________________________________________________________||
 class MockEvent(object): pass
@@ -11,4 +12,9 @@ class TestWeightCalculatorOne(unittest.TestCase):
         weight = summary.WeightCalculatorOne()
         self.assertEqual(1.0, weight(MockEvent()))
 
+    def test_call_batch(self):
+        weight = summary.WeightCalculatorOne()
+        batch = [MockEvent(), MockEvent(), MockEvent()]
+        np.testing.assert_equal(np.array([1.0, 1.0, 1.0]), weight.call_batch(batch))
+
 ##__________________________________________________________________||
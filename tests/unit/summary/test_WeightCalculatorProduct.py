@@ -0,0 +1,110 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from alphatwirl.summary import WeightCalculatorProduct
+
+##__________________________________________________________________||
+class MockEvent(object):
+    pass
+
+class MockBatch(object):
+    def __init__(self, nevents):
+        self.nevents = nevents
+
+    def __len__(self):
+        return self.nevents
+
+@pytest.fixture()
+def obj():
+    return WeightCalculatorProduct(('w1', 'w2', 'w3'), attrIndices=(None, 1, None))
+
+##__________________________________________________________________||
+def test_repr(obj):
+    repr(obj)
+
+def test_init_raise_wrong_length():
+    with pytest.raises(ValueError):
+        WeightCalculatorProduct(('w1', 'w2'), attrIndices=(None, ))
+
+def test_call(obj):
+    event = MockEvent()
+    event.w1 = [2.0]
+    event.w2 = [5.0, 0.5]
+    event.w3 = 3.0
+    assert 3.0 == obj(event)
+
+def test_call_no_attributes():
+    obj = WeightCalculatorProduct(( ))
+    assert 1 == obj(MockEvent())
+
+def test_call_reuse(obj):
+    event = MockEvent()
+    event.w1 = [2.0]
+    event.w2 = [5.0, 0.5]
+    event.w3 = 3.0
+
+    event.iEvent = 0
+    assert 3.0 == obj(event)
+
+    event.w1[:] = [4.0]
+    assert 3.0 == obj(event) # the same event
+
+    event.iEvent = 1
+    assert 6.0 == obj(event)
+
+    del event.iEvent
+    event.w1[:] = [1.0]
+    assert 1.5 == obj(event)
+
+def test_call_batch(obj):
+    batch = MockBatch(3)
+    batch.w1 = np.array([2.0, 1.0, 0.5])
+    batch.w2 = (np.array([5.0, 0.5, 1.0, 2.0, 1.0, 3.0, 9.0]), np.array([0, 2, 4, 7]))
+    batch.w3 = (np.array([3.0, 2.0, 4.0]), np.array([0, 1, 2, 3]))
+    np.testing.assert_equal([3.0, 4.0, 6.0], obj.call_batch(batch))
+
+def test_call_batch_same_as_call(obj):
+    batch = MockBatch(3)
+    batch.w1 = np.array([2.0, 1.0, 0.5])
+    batch.w2 = (np.array([5.0, 0.5, 1.0, 2.0, 1.0, 3.0, 9.0]), np.array([0, 2, 4, 7]))
+    batch.w3 = np.array([3.0, 2.0, 4.0])
+    expected = [ ]
+    for i in range(3):
+        event = MockEvent()
+        event.w1 = [batch.w1[i]]
+        event.w2 = batch.w2[0][batch.w2[1][i]:batch.w2[1][i+1]]
+        event.w3 = batch.w3[i]
+        expected.append(obj(event))
+    np.testing.assert_equal(expected, obj.call_batch(batch))
+
+def test_call_batch_index_out_of_range(obj):
+    batch = MockBatch(2)
+    batch.w1 = np.array([2.0, 1.0])
+    batch.w2 = (np.array([5.0, 0.5, 1.0]), np.array([0, 2, 3]))
+    batch.w3 = np.array([3.0, 2.0])
+    with pytest.raises(IndexError):
+        obj.call_batch(batch)
+
+def test_call_batch_empty(obj):
+    batch = MockBatch(0)
+    batch.w1 = np.array([ ])
+    batch.w2 = (np.array([ ]), np.array([0]))
+    batch.w3 = np.array([ ])
+    assert 0 == len(obj.call_batch(batch))
+
+def test_copy(obj):
+    event = MockEvent()
+    event.w1 = [2.0]
+    event.w2 = [5.0, 0.5]
+    event.w3 = 3.0
+    event.iEvent = 0
+    obj(event)
+    for copied in (copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))):
+        assert copied._last is None
+        assert copied.attrNames == obj.attrNames
+
+##__________________________________________________________________||
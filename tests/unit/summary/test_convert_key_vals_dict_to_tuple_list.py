@@ -5,6 +5,7 @@ import collections
 import pytest
 
 from alphatwirl.summary.convert import key_vals_dict_to_tuple_list
+from alphatwirl.summary.convert import key_vals_dict_to_tuple_iter
 
 ##__________________________________________________________________||
 @pytest.mark.parametrize(
@@ -73,6 +74,7 @@ from alphatwirl.summary.convert import key_vals_dict_to_tuple_list
 )
 def test_convert(key_vals_dict, tuple_list, kwargs):
     assert tuple_list == key_vals_dict_to_tuple_list(key_vals_dict, **kwargs)
+    assert tuple_list == list(key_vals_dict_to_tuple_iter(key_vals_dict, **kwargs))
 
 ##__________________________________________________________________||
 @pytest.mark.parametrize(
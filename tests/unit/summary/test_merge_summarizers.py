@@ -0,0 +1,147 @@
+# Tai Sakuma <tai.sakuma@gmail.com>
+import copy
+import numpy as np
+import pytest
+
+from alphatwirl.binning import Binning, Round
+from alphatwirl.summary import merge_summarizers
+from alphatwirl.summary import Summarizer, PackedSummarizer, DenseSummarizer
+from alphatwirl.summary import Count, Sum, Scan
+
+##__________________________________________________________________||
+binnings = (
+    Binning(boundaries=(10, 20, 30, 40)),
+    Round(1, 0, min=0, underflow_bin=-1, max=4, overflow_bin=True),
+)
+
+fills_list = [
+    [
+        dict(key=(10, 2), val=(12.5, 3.0), weight=1),
+        dict(key=(30, 2), val=(1.5, 2.0), weight=2.5),
+        dict(key=(float('-inf'), -1), val=(3.0, 8.0), weight=1),
+    ],
+    [ ],
+    [
+        dict(key=(10, 2), val=(4.0, 1.0), weight=0.1),
+        dict(key=(40, 4), val=(2.0, 1.0), weight=1),
+    ],
+    [
+        dict(key=(10, 2), val=(0.3, 1.7), weight=0.7),
+        dict(key=(20, 0), val=(2.0, 1.0), weight=1),
+    ],
+]
+
+added_keys_list = [[(20, 1)], [(20, 1), (10, 2)], [ ], [(30, 3)]]
+
+def create(create_summarizer):
+    ret = [ ]
+    for fills, added_keys in zip(fills_list, added_keys_list):
+        obj = create_summarizer()
+        for f in fills:
+            obj.add(**f)
+        for k in added_keys:
+            obj.add_key(k)
+        ret.append(obj)
+    return ret
+
+@pytest.fixture(params=[
+    lambda Summary: Summarizer(Summary=Summary),
+    lambda Summary: PackedSummarizer(Summary=Summary, binnings=binnings),
+    lambda Summary: DenseSummarizer(Summary=Summary, binnings=binnings),
+], ids=['Summarizer', 'PackedSummarizer', 'DenseSummarizer'])
+def create_summarizer(request):
+    return request.param
+
+@pytest.fixture(params=[Count, Sum])
+def Summary(request):
+    return request.param
+
+##__________________________________________________________________||
+def test_empty():
+    assert merge_summarizers([ ]) is None
+
+def test_same_as_sum(create_summarizer, Summary):
+    summarizers = create(lambda : create_summarizer(Summary))
+    copies = [copy.copy(s) for s in summarizers]
+
+    expected = sum(summarizers)
+    actual = merge_summarizers(iter(summarizers))
+
+    assert type(expected) is type(actual)
+    assert expected.to_tuple_list() == actual.to_tuple_list()
+    np.testing.assert_equal(expected.to_key_vals_dict(), actual.to_key_vals_dict())
+
+    # not modified
+    for s, c in zip(summarizers, copies):
+        assert c.to_tuple_list() == s.to_tuple_list()
+
+def test_one(create_summarizer, Summary):
+    summarizer = create(lambda : create_summarizer(Summary))[0]
+    actual = merge_summarizers([summarizer])
+    assert actual is not summarizer
+    assert summarizer.to_tuple_list() == actual.to_tuple_list()
+
+def test_in_arrays(Summary):
+    summarizers = create(lambda : Summarizer(Summary=Summary))
+    arrays = [s._to_arrays() for s in summarizers]
+    assert all(a is not None for a in arrays)
+    actual = merge_summarizers(summarizers)
+    expected = sum(summarizers)
+    assert sorted(expected.keys()) == sorted(actual.keys())
+    for k, v in expected.results().items():
+        assert v == actual.results()[k]
+
+def test_add_key_only_sum():
+    obj1 = Summarizer(Summary=Sum)
+    obj1.add_key((1, ))
+    obj2 = Summarizer(Summary=Sum)
+    obj2.add_key((1, ))
+    obj2.add_key((2, ))
+    obj2.add((2, ), (3, 4))
+    actual = merge_summarizers([obj1, obj2])
+    np.testing.assert_equal(sum([obj1, obj2]).to_key_vals_dict(), actual.to_key_vals_dict())
+    assert [np.array([0])] == actual.results()[(1, )].contents
+
+def test_int_keys_stay_int():
+    obj1 = Summarizer(Summary=Count)
+    obj1.add((1, 2.5), 1)
+    obj2 = Summarizer(Summary=Count)
+    obj2.add((1.5, 3), 1)
+    obj2.add((1, 2.5), 1)
+    actual = merge_summarizers([obj1, obj2])
+    assert [(1, 2.5, 2.0, 2.0), (1.5, 3, 1.0, 1.0)] == actual.to_tuple_list()
+    assert [int, float] == [type(k[0]) for k in actual.to_tuple_list()]
+
+@pytest.mark.parametrize('keys1, keys2', [
+    pytest.param([(1, ), ('a', )], [(2, )], id='unsortable'),
+    pytest.param([(1, ), (1, 2)], [(2, )], id='different-lengths'),
+    pytest.param([(1, )], [(1, 2)], id='different-lengths-between'),
+])
+def test_fall_back(keys1, keys2):
+    obj1 = Summarizer(Summary=Count)
+    for k in keys1:
+        obj1.add(k, 1)
+    obj2 = Summarizer(Summary=Count)
+    for k in keys2:
+        obj2.add(k, 1)
+    actual = merge_summarizers([obj1, obj2])
+    assert sum([obj1, obj2]).results() == actual.results()
+
+def test_scan():
+    obj1 = Summarizer(Summary=Scan)
+    obj1.add((1, ), (3, 4))
+    obj2 = Summarizer(Summary=Scan)
+    obj2.add((1, ), (5, 6))
+    assert obj1._to_arrays() is None
+    actual = merge_summarizers([obj1, obj2])
+    assert sum([obj1, obj2]).to_tuple_list() == actual.to_tuple_list()
+
+def test_different_binnings():
+    obj1 = PackedSummarizer(Summary=Count, binnings=binnings)
+    obj1.add((10, 2), 1)
+    obj2 = PackedSummarizer(Summary=Count, binnings=(Binning(boundaries=(1, 2)), ) + binnings[1:])
+    obj2.add((1, 2), 1)
+    assert not obj1._can_merge_arrays(obj2)
+    assert obj1._can_merge_arrays(copy.deepcopy(obj1))
+
+##__________________________________________________________________||